@@ -0,0 +1,160 @@
+import re
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from core.conflict_controller.ConflictController import ConflictController
+from core.conflict_controller.ScheduleIndex import ScheduleIndex, section_intervals
+from core.generation_cache.GenerationCache import invalidate_schedule_caches
+from core.local_data_classes import AvailableTA, ProposedLabAssignment, UserRef
+from ta_scheduler.models import Course, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+# Cost of giving a TA one more lab, and the discount for each of their skills the course mentions. A skill match
+# is worth half a lab, so load stays balanced and skills decide between TAs with similar loads.
+LOAD_COST = 2
+SKILL_MATCH_BONUS = 1
+
+
+class AssignmentController:
+    @staticmethod
+    def propose_lab_assignments(semester_name: str) -> List[ProposedLabAssignment]:
+        """
+        Pre-conditions: A semester with the given name exists, otherwise a ValueError is raised
+        Post-conditions: Returns a proposed TA for every lab section of the semester without one, chosen from the TAs
+            assigned to the lab's course who are not graders. A TA is never proposed for a lab that meets at the same
+            time as another of their labs, assigned or proposed. Among the TAs who are free, the one with the lowest
+            cost is chosen: LOAD_COST per lab they already have in the semester, less SKILL_MATCH_BONUS per skill of
+            theirs mentioned in the course code or name. Labs with the fewest free TAs are filled first.
+            Labs no TA can take are returned with ta None and the reason.
+        Side-effects: None
+        """
+        semester = AssignmentController._get_semester(semester_name)
+        return [proposal for _, _, proposal in AssignmentController._solve(semester)]
+
+    @staticmethod
+    def apply_lab_assignments(semester_name: str) -> List[ProposedLabAssignment]:
+        """
+        Pre-conditions: A semester with the given name exists, otherwise a ValueError is raised
+        Post-conditions: Assigns every TA proposed by propose_lab_assignments and returns the proposals
+        Side-effects: Adds records to the TALabAssignment table, clears the course and calendar caches
+        """
+        semester = AssignmentController._get_semester(semester_name)
+        with transaction.atomic():
+            # locks the semester's labs on backends that support it, so a concurrent run can't assign them twice
+            list(LabSection.objects.select_for_update().filter(course__semester=semester).values_list("pk"))
+            solution = AssignmentController._solve(semester)
+            TALabAssignment.objects.bulk_create([TALabAssignment(lab_section=lab, ta=ta) for lab, ta, _ in solution if ta])
+        invalidate_schedule_caches()
+        return [proposal for _, _, proposal in solution]
+
+    @staticmethod
+    def find_available_tas(semester_name: str, days: str, start_time, end_time,
+                           course_code: str | None = None) -> List[AvailableTA]:
+        """
+        Pre-conditions: A semester with the given name exists and, if given, a course with the code exists in it,
+            otherwise a ValueError is raised. days is a string accepted by Weekdays.parse, otherwise a ValueError is
+            raised. start_time and end_time are times or "HH:MM" strings.
+        Post-conditions: Returns every TA who neither TAs a lab nor instructs a section of the semester meeting at
+            the given time, with the number of labs they have in the semester and, if a course is given, the number
+            of their skills it mentions. TAs are ranked the way propose_lab_assignments picks them, lowest cost first.
+        Side-effects: None
+        """
+        semester = AssignmentController._get_semester(semester_name)
+        course_text = ""
+        if course_code is not None:
+            course = Course.objects.filter(semester=semester, course_code=course_code).first()
+            if course is None:
+                raise ValueError(f"Course '{course_code}' does not exist in {semester_name}.")
+            course_text = f"{course.course_code} {course.course_name}".lower()
+
+        tas = (ConflictController.available_users(semester.id, days, start_time, end_time, role="TA")
+               .annotate(load=Count("lab_assignments",
+                                    filter=Q(lab_assignments__lab_section__course__semester=semester)))
+               .only("username", "first_name", "last_name", "skills"))
+        available = [AvailableTA(ta=UserRef(name=f"{ta.first_name} {ta.last_name}", username=ta.username),
+                                 load=ta.load, skill_matches=_skill_matches(ta, course_text) if course_text else 0)
+                     for ta in tas]
+        return sorted(available, key=lambda ta: (ta.load * LOAD_COST - ta.skill_matches * SKILL_MATCH_BONUS,
+                                                 ta.ta.username))
+
+    @staticmethod
+    def _get_semester(semester_name: str) -> Semester:
+        try:
+            return Semester.objects.get(semester_name=semester_name)
+        except Semester.DoesNotExist:
+            raise ValueError(f"Semester '{semester_name}' does not exist.")
+
+    @staticmethod
+    def _solve(semester: Semester) -> List[Tuple[LabSection, User | None, ProposedLabAssignment]]:
+        labs = list(LabSection.objects.filter(course__semester=semester, talabassignment_set__isnull=True)
+                    .select_related("course").order_by("course__course_code", "lab_section_number"))
+
+        pools = defaultdict(list)
+        pool_assignments = (TACourseAssignment.objects.filter(course__semester=semester, grader_status=False)
+                            .select_related("ta").order_by("ta__username"))
+        for assignment in pool_assignments:
+            pools[assignment.course_id].append(assignment.ta)
+
+        # every TA's labs in the semester, for their load and schedule
+        loads: Dict[int, int] = defaultdict(int)
+        schedules: Dict[int, ScheduleIndex] = defaultdict(ScheduleIndex)
+        assigned = (TALabAssignment.objects.filter(lab_section__course__semester=semester)
+                    .select_related("lab_section"))
+        for assignment in assigned:
+            loads[assignment.ta_id] += 1
+            for start, end in section_intervals(assignment.lab_section):
+                schedules[assignment.ta_id].add(start, end, assignment.lab_section_id)
+
+        lab_intervals = {lab.pk: section_intervals(lab) for lab in labs}
+        candidates = {
+            lab.pk: [ta for ta in pools[lab.course_id]
+                     if not any(schedules[ta.id].overlapping(start, end) for start, end in lab_intervals[lab.pk])]
+            for lab in labs
+        }
+        # the unfilled labs each TA is still free for, so placing a TA only rechecks their labs
+        labs_by_ta = defaultdict(set)
+        for lab in labs:
+            for ta in candidates[lab.pk]:
+                labs_by_ta[ta.id].add(lab.pk)
+
+        proposals = {}
+        remaining = {lab.pk: lab for lab in labs}
+        while remaining:
+            # the lab with the fewest free TAs goes next, so choices for easy labs don't use up the only TA of a hard one
+            lab = min(remaining.values(),
+                      key=lambda lab: (len(candidates[lab.pk]), lab.course.course_code, lab.lab_section_number))
+            del remaining[lab.pk]
+            if not candidates[lab.pk]:
+                reason = ("No TA who isn't a grader is assigned to the course." if not pools[lab.course_id]
+                          else "Every TA of the course is busy at that time.")
+                proposals[lab.pk] = (lab, None, ProposedLabAssignment(lab.course.course_code, lab.lab_section_number,
+                                                                      None, reason))
+                continue
+
+            course_text = f"{lab.course.course_code} {lab.course.course_name}".lower()
+            ta = min(candidates[lab.pk], key=lambda ta: (
+                loads[ta.id] * LOAD_COST - _skill_matches(ta, course_text) * SKILL_MATCH_BONUS, ta.username))
+            loads[ta.id] += 1
+            for start, end in lab_intervals[lab.pk]:
+                schedules[ta.id].add(start, end, lab.pk)
+            labs_by_ta[ta.id].discard(lab.pk)
+            for other_pk in list(labs_by_ta[ta.id]):
+                if _overlap(lab_intervals[other_pk], lab_intervals[lab.pk]):
+                    candidates[other_pk] = [other for other in candidates[other_pk] if other.id != ta.id]
+                    labs_by_ta[ta.id].discard(other_pk)
+            ta_ref = UserRef(name=f"{ta.first_name} {ta.last_name}", username=ta.username)
+            proposals[lab.pk] = (lab, ta, ProposedLabAssignment(lab.course.course_code, lab.lab_section_number, ta_ref, None))
+        return [proposals[lab.pk] for lab in labs]
+
+
+def _overlap(intervals, other_intervals) -> bool:
+    return any(start < other_end and other_start < end
+               for start, end in intervals for other_start, other_end in other_intervals)
+
+
+def _skill_matches(ta: User, course_text: str) -> int:
+    words = set(re.findall(r"\w+", course_text))
+    return sum(1 for skill in ta.skills or [] if isinstance(skill, str)
+               and (skill.lower() in words or (" " in skill and skill.lower() in course_text)))
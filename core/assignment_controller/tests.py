@@ -0,0 +1,188 @@
+from datetime import date, time
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.assignment_controller.AssignmentController import AssignmentController
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+
+class AssignmentControllerTestBase(TestCase):
+    def setUp(self):
+        self.semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                                end_date=date(2025, 12, 15))
+        self.course = Course.objects.create(course_code="CS361", course_name="Software Engineering",
+                                            semester=self.semester)
+
+    def ta(self, username, course=None, grader=False, skills=None):
+        ta = User.objects.create(username=username, role="TA", skills=skills or [])
+        TACourseAssignment.objects.create(course=course or self.course, ta=ta, grader_status=grader)
+        return ta
+
+    def lab(self, number, days="Tuesday", start=time(11, 0), end=time(12, 50), course=None):
+        return LabSection.objects.create(course=course or self.course, lab_section_number=number, days=days,
+                                         start_time=start, end_time=end)
+
+    def proposed(self):
+        return {(p.lab_section_number, p.ta.username if p.ta else None)
+                for p in AssignmentController.propose_lab_assignments("Fall 2025")}
+
+
+class TestProposeLabAssignments(AssignmentControllerTestBase):
+    def test_overlapping_labs_get_different_tas(self):
+        self.ta("ta1")
+        self.ta("ta2")
+        self.lab(801)
+        self.lab(802, start=time(12, 0), end=time(13, 0))
+        self.assertEqual({ta for _, ta in self.proposed()}, {"ta1", "ta2"})
+
+    def test_existing_assignments_count_toward_load_and_schedule(self):
+        ta1, _ = self.ta("ta1"), self.ta("ta2")
+        TALabAssignment.objects.create(lab_section=self.lab(801, days="Monday"), ta=ta1)
+        self.lab(802, days="Wednesday")
+        self.assertEqual(self.proposed(), {(802, "ta2")})
+
+    def test_load_is_balanced(self):
+        self.ta("ta1")
+        self.ta("ta2")
+        for number, days in enumerate(["M", "T", "W", "R"], start=801):
+            self.lab(number, days=days)
+        proposals = [p.ta.username for p in AssignmentController.propose_lab_assignments("Fall 2025")]
+        self.assertEqual(sorted(proposals), ["ta1", "ta1", "ta2", "ta2"])
+
+    def test_skills_break_ties(self):
+        self.ta("ta1")
+        self.ta("ta2", skills=["Software Engineering"])
+        self.lab(801)
+        self.assertEqual(self.proposed(), {(801, "ta2")})
+
+    def test_most_constrained_lab_first(self):
+        # ta2 is busy during lab 802 only, so giving lab 801 to ta1 first would leave 802 without a TA
+        self.ta("ta1")
+        ta2 = self.ta("ta2")
+        self.lab(801, start=time(11, 0), end=time(12, 0))
+        self.lab(802, start=time(11, 30), end=time(12, 30))
+        TALabAssignment.objects.create(lab_section=self.lab(803, start=time(12, 15), end=time(13, 0)), ta=ta2)
+        self.assertEqual(self.proposed(), {(801, "ta2"), (802, "ta1")})
+
+    def test_graders_and_other_courses_excluded(self):
+        self.ta("grader", grader=True)
+        other = Course.objects.create(course_code="CS351", course_name="Data Structures", semester=self.semester)
+        self.ta("other", course=other)
+        self.lab(801)
+        proposal, = AssignmentController.propose_lab_assignments("Fall 2025")
+        self.assertIsNone(proposal.ta)
+        self.assertEqual(proposal.reason, "No TA who isn't a grader is assigned to the course.")
+
+    def test_busy_reason(self):
+        ta = self.ta("ta1")
+        TALabAssignment.objects.create(lab_section=self.lab(801), ta=ta)
+        self.lab(802, start=time(12, 0), end=time(13, 0))
+        proposal, = AssignmentController.propose_lab_assignments("Fall 2025")
+        self.assertEqual(proposal.reason, "Every TA of the course is busy at that time.")
+
+    def test_dry_run_writes_nothing(self):
+        self.ta("ta1")
+        self.lab(801)
+        AssignmentController.propose_lab_assignments("Fall 2025")
+        self.assertFalse(TALabAssignment.objects.exists())
+
+    def test_unknown_semester(self):
+        with self.assertRaises(ValueError):
+            AssignmentController.propose_lab_assignments("Spring 1900")
+
+    def test_large_semester_query_count(self):
+        courses = Course.objects.bulk_create([
+            Course(course_code=f"BULK{i}", course_name="Bulk", semester=self.semester) for i in range(20)
+        ])
+        tas = User.objects.bulk_create([User(username=f"bulk_ta{i}", role="TA") for i in range(80)])
+        TACourseAssignment.objects.bulk_create([
+            TACourseAssignment(course=course, ta=tas[(c * 4 + i) % len(tas)], grader_status=False)
+            for c, course in enumerate(courses) for i in range(4)
+        ])
+        days = ["MW", "TR", "F", "MWF", "TR"]
+        LabSection.objects.bulk_create([
+            LabSection(course=course, lab_section_number=n, days=days[n % 5], start_time=time(8 + n % 9, 0),
+                       end_time=time(9 + n % 9, 0))
+            for course in courses for n in range(10)
+        ])
+        with self.assertNumQueries(4):
+            proposals = AssignmentController.propose_lab_assignments("Fall 2025")
+        self.assertEqual(len(proposals), 200)
+        self.assertTrue(all(p.ta for p in proposals))
+
+
+class TestApplyLabAssignments(AssignmentControllerTestBase):
+    def test_apply_creates_assignments(self):
+        self.ta("ta1")
+        self.ta("ta2")
+        self.lab(801)
+        self.lab(802, start=time(12, 0), end=time(13, 0))
+        AssignmentController.apply_lab_assignments("Fall 2025")
+        self.assertEqual(set(TALabAssignment.objects.values_list("ta__username", flat=True)), {"ta1", "ta2"})
+        self.assertEqual(AssignmentController.propose_lab_assignments("Fall 2025"), [])
+
+    def test_command_previews_unless_applied(self):
+        self.ta("ta1")
+        self.lab(801)
+        call_command("assign_labs", "Fall 2025", stdout=open("/dev/null", "w"))
+        self.assertFalse(TALabAssignment.objects.exists())
+        call_command("assign_labs", "Fall 2025", "--apply", stdout=open("/dev/null", "w"))
+        self.assertTrue(TALabAssignment.objects.exists())
+
+
+class TestFindAvailableTAs(AssignmentControllerTestBase):
+    def available(self, days="Tuesday", start="11:30", end="12:30", course_code=None):
+        return [(a.ta.username, a.load, a.skill_matches)
+                for a in AssignmentController.find_available_tas("Fall 2025", days, start, end, course_code)]
+
+    def test_busy_tas_excluded_and_ranked_by_load(self):
+        busy, loaded, _ = self.ta("busy"), self.ta("loaded"), self.ta("free")
+        TALabAssignment.objects.create(lab_section=self.lab(801), ta=busy)
+        TALabAssignment.objects.create(lab_section=self.lab(802, days="Friday"), ta=loaded)
+        self.assertEqual(self.available(), [("free", 0, 0), ("loaded", 1, 0)])
+
+    def test_instructing_counts_as_busy(self):
+        self.ta("ta1")
+        instructor = User.objects.create(username="instructor", role="Instructor")
+        CourseSection.objects.create(course=self.course, course_section_number=1, instructor=instructor, days="T",
+                                     start_time=time(11, 0), end_time=time(12, 0))
+        self.assertEqual(self.available(), [("ta1", 0, 0)])
+
+    def test_skills_rank_within_load(self):
+        self.ta("ta1")
+        self.ta("ta2", skills=["software"])
+        self.assertEqual(self.available(course_code="CS361"), [("ta2", 0, 1), ("ta1", 0, 0)])
+
+    def test_other_semester_load_ignored(self):
+        ta = self.ta("ta1")
+        other = Semester.objects.create(semester_name="Spring 2026", start_date=date(2026, 1, 20),
+                                        end_date=date(2026, 5, 10))
+        other_course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=other)
+        TALabAssignment.objects.create(lab_section=self.lab(801, course=other_course), ta=ta)
+        self.assertEqual(self.available(), [("ta1", 0, 0)])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            self.available(course_code="CS999")
+        with self.assertRaises(ValueError):
+            self.available(days="whenever")
+        with self.assertRaises(ValueError):
+            AssignmentController.find_available_tas("Spring 1900", "T", "11:00", "12:00")
+
+    def test_query_count_at_scale(self):
+        tas = User.objects.bulk_create([User(username=f"bulk_ta{i:04}", role="TA") for i in range(200)])
+        courses = Course.objects.bulk_create([
+            Course(course_code=f"BULK{i}", course_name="Bulk", semester=self.semester) for i in range(10)
+        ])
+        days = ["MW", "TR", "F", "MWF", "TR"]
+        labs = LabSection.objects.bulk_create([
+            LabSection(course=course, lab_section_number=n, days=days[n % 5], start_time=time(8 + n % 9, 0),
+                       end_time=time(9 + n % 9, 0))
+            for course in courses for n in range(30)
+        ])
+        TALabAssignment.objects.bulk_create([TALabAssignment(lab_section=lab, ta=tas[i % 200])
+                                             for i, lab in enumerate(labs)])
+        with self.assertNumQueries(3):
+            available = AssignmentController.find_available_tas("Fall 2025", "TR", "10:00", "11:00", "BULK1")
+        self.assertTrue(0 < len(available) < 200)
@@ -0,0 +1,229 @@
+import math
+import time
+from typing import Callable, Dict, List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, override_settings
+
+from core.assignment_controller.AssignmentController import AssignmentController
+from core.calendar_controller.CalendarController import CalendarController
+from core.conflict_controller.ConflictController import ConflictController
+from core.course_controller.CourseController import CourseController
+from core.export_controller.ExportController import ExportController
+from core.import_controller.ImportController import ImportController
+from core.local_data_classes import BenchmarkComparison, BenchmarkResult
+from core.request_metrics.RequestMetrics import RequestMetrics
+from core.section_controller.SectionController import SectionController
+from core.semester_controller.SemesterController import SemesterController
+from core.user_controller.UserController import UserController
+from core.workload_controller.WorkloadController import WorkloadController
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+DEFAULT_ITERATIONS = 20
+# A benchmark has regressed when its median is this much slower than the baseline's...
+DEFAULT_TOLERANCE = 0.2
+# ...and by at least this many milliseconds, so sub-millisecond noise on fast calls isn't reported
+MIN_REGRESSION_MS = 1.0
+_CLONE_NAME = "Benchmark clone"
+# Requests recorded per run of the RequestMetrics benchmark, a single one takes microseconds
+_RECORDED_REQUESTS = 1000
+
+
+class Benchmark:
+    @staticmethod
+    def run(iterations: int = DEFAULT_ITERATIONS, semester_name: str | None = None,
+            only: str | None = None) -> List[BenchmarkResult]:
+        """
+        Pre-conditions: The database has an admin and a semester with courses, sections and TA assignments, such
+            as the data made by SyntheticData.generate. If given, a semester with semester_name exists. Otherwise
+            a ValueError is raised.
+        Post-conditions: Times each benchmark, every controller entry point and the main views fetched through
+            the test client, iterations times after a warm-up run, against the semester (by default the one with
+            the most courses). Caches are cleared before each run, so the times are for a cold cache. Only the
+            benchmarks whose name contains `only` are run if it is given. Returns the results in the order run.
+        Side-effects: Clears the cache. Entry points that write run inside a transaction that is rolled back.
+        """
+        results = []
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for name, call in Benchmark.cases(semester_name):
+                if only and only not in name:
+                    continue
+                cache.clear()
+                # counted with a wrapper, as the test client's request_started resets connection.queries_log
+                queries = []
+
+                def count(execute, sql, *args):
+                    queries.append(sql)
+                    return execute(sql, *args)
+                with connection.execute_wrapper(count):
+                    call()
+                samples = []
+                for _ in range(iterations):
+                    cache.clear()
+                    started = time.perf_counter()
+                    call()
+                    samples.append((time.perf_counter() - started) * 1000)
+                samples.sort()
+                results.append(BenchmarkResult(
+                    name=name, iterations=iterations, queries=len(queries),
+                    p50_ms=round(Benchmark.percentile(samples, 50), 3),
+                    p90_ms=round(Benchmark.percentile(samples, 90), 3),
+                    p99_ms=round(Benchmark.percentile(samples, 99), 3),
+                    max_ms=round(samples[-1], 3),
+                ))
+        cache.clear()
+        return results
+
+    @staticmethod
+    def cases(semester_name: str | None = None) -> List[Tuple[str, Callable[[], object]]]:
+        """
+        Pre-conditions: Same as run
+        Post-conditions: Returns the name and a call taking no arguments of every benchmark. Views are named by
+            their URL pattern rather than the URL fetched, so results can be compared across data sets.
+        Side-effects: Logs the test client in as an admin
+        """
+        semester = Benchmark._semester(semester_name)
+        course = (Course.objects.filter(semester=semester).annotate(sections=Count("coursesection", distinct=True)
+                                                                    + Count("labsection", distinct=True))
+                  .order_by("-sections", "course_code").first())
+        section = CourseSection.objects.filter(course=course).order_by("course_section_number").first()
+        lab = LabSection.objects.filter(course=course).order_by("lab_section_number").first()
+        ta = TALabAssignment.objects.filter(lab_section__course__semester=semester).select_related("ta").first()
+        instructor = CourseSection.objects.filter(course__semester=semester).select_related("instructor").first()
+        admin = User.objects.filter(role="Admin").order_by("pk").first()
+        if None in (section, lab, ta, instructor, admin):
+            raise ValueError(f"{semester.semester_name} needs course sections, lab sections, TA lab assignments and "
+                             "an admin to benchmark.")
+        name, code, ta, instructor = semester.semester_name, course.course_code, ta.ta, instructor.instructor
+        client = Client()
+        client.force_login(admin)
+
+        def get(url):
+            def fetch():
+                response = client.get(url)
+                if response.status_code != 200:
+                    raise ValueError(f"GET {url} returned {response.status_code}")
+                if response.streaming:
+                    for _ in response.streaming_content:
+                        pass
+            return fetch
+
+        def record_requests():
+            for _ in range(_RECORDED_REQUESTS):
+                RequestMetrics.record("Benchmark", 0.05, 10, 0.01, 5000)
+
+        def rolled_back(call):
+            def run():
+                with transaction.atomic():
+                    call()
+                    transaction.set_rollback(True)
+            return run
+
+        return [
+            ("AssignmentController.propose_lab_assignments",
+             lambda: AssignmentController.propose_lab_assignments(name)),
+            ("AssignmentController.apply_lab_assignments",
+             rolled_back(lambda: AssignmentController.apply_lab_assignments(name))),
+            ("AssignmentController.find_available_tas",
+             lambda: AssignmentController.find_available_tas(name, "MW", "10:00", "10:50", code)),
+            ("CalendarController.get_feed", lambda: CalendarController.get_feed(ta.username)),
+            ("ConflictController.semester_conflicts", lambda: ConflictController.semester_conflicts(name)),
+            ("ConflictController.available_users",
+             lambda: list(ConflictController.available_users(semester.id, "TR", "13:00", "14:15"))),
+            ("CourseController.get_course", lambda: CourseController.get_course(code, name)),
+            ("CourseController.get_assigned_tas", lambda: CourseController.get_assigned_tas(code, name)),
+            ("CourseController.search_courses", lambda: CourseController.search_courses(code[:2])),
+            ("CourseController.search_course_groups", lambda: CourseController.search_course_groups("")),
+            ("CourseController.search_courses_page", lambda: CourseController.search_courses_page("", name)),
+            ("ExportController.export_rows", lambda: list(ExportController.export_rows(name))),
+            # the semester's export imported back, which updates every record of the semester
+            ("ImportController.import_rows",
+             rolled_back(lambda: ImportController.import_rows(ExportController.export_rows(name)))),
+            ("SectionController.get_course_section",
+             lambda: SectionController.get_course_section(code, name, section.course_section_number)),
+            ("SectionController.get_lab_section",
+             lambda: SectionController.get_lab_section(code, name, lab.lab_section_number)),
+            ("SemesterController.list_semester", lambda: list(SemesterController.list_semester())),
+            ("SemesterController.search_semester", lambda: list(SemesterController.search_semester(name[:4]))),
+            ("SemesterController.clone_semester",
+             rolled_back(lambda: SemesterController.clone_semester(name, _CLONE_NAME, str(semester.start_date),
+                                                                   str(semester.end_date), True))),
+            (f"RequestMetrics.record x{_RECORDED_REQUESTS}", record_requests),
+            ("UserController.getUser", lambda: UserController.getUser(ta.username, admin)),
+            ("UserController.searchUser", lambda: UserController.searchUser(ta.first_name, limit=50)),
+            ("UserController.lookupUsers", lambda: UserController.lookupUsers([ta.username, instructor.username])),
+            ("WorkloadController.get_semester_workload", lambda: WorkloadController.get_semester_workload(name)),
+            ("GET /", get("/")),
+            ("GET /profile/<username>", get(f"/profile/{instructor.username}")),
+            ("GET /course/<code>/<semester>/", get(f"/course/{code}/{name}/")),
+            ("GET /edit-course/<code>/<semester>/", get(f"/edit-course/{code}/{name}/")),
+            ("GET /edit-section/<code>/<semester>/<number>/Course",
+             get(f"/edit-section/{code}/{name}/{section.course_section_number}/Course")),
+            ("GET /search/course/", get("/search/course/")),
+            ("GET /search/user/", get("/search/user/")),
+            ("GET /workload/<semester>/", get(f"/workload/{name}/")),
+            ("GET /calendar/<token>.ics", get(f"/calendar/{CalendarController.feed_token(ta.username)}.ics")),
+            ("GET /api/search/user/", get(f"/api/search/user/?query={ta.first_name}")),
+            ("GET /api/search/course/", get(f"/api/search/course/?semester={name}")),
+            ("GET /api/conflicts/<semester>/", get(f"/api/conflicts/{name}/")),
+            ("GET /api/export/<semester>/", get(f"/api/export/{name}/")),
+        ]
+
+    @staticmethod
+    def percentile(samples: List[float], percent: float) -> float:
+        """
+        Pre-conditions: samples is sorted and not empty, 0 < percent <= 100
+        Post-conditions: Returns the nearest-rank percentile of samples, the smallest sample at least `percent`
+            percent of the samples are less than or equal to
+        Side-effects: None
+        """
+        return samples[max(0, math.ceil(percent / 100 * len(samples)) - 1)]
+
+    @staticmethod
+    def scale() -> Dict[str, int]:
+        """
+        Post-conditions: Returns the number of records of each model, stored with a baseline to tell whether
+            results were measured on the same amount of data
+        Side-effects: None
+        """
+        return {model.__name__: model.objects.count()
+                for model in (User, Semester, Course, CourseSection, LabSection, TACourseAssignment, TALabAssignment)}
+
+    @staticmethod
+    def compare(results: List[BenchmarkResult], baseline: Dict[str, dict],
+                tolerance: float = DEFAULT_TOLERANCE) -> List[BenchmarkComparison]:
+        """
+        Pre-conditions: baseline maps benchmark names to the fields of a stored BenchmarkResult
+        Post-conditions: Returns a comparison for each result that has a baseline. It has regressed if it runs
+            more queries than the baseline, or its median is more than `tolerance` (a fraction) and at least
+            MIN_REGRESSION_MS slower.
+        Side-effects: None
+        """
+        comparisons = []
+        for result in results:
+            if result.name not in baseline:
+                continue
+            stored = baseline[result.name]
+            change = (result.p50_ms - stored["p50_ms"]) / stored["p50_ms"] if stored["p50_ms"] else 0.0
+            slower = change > tolerance and result.p50_ms - stored["p50_ms"] >= MIN_REGRESSION_MS
+            comparisons.append(BenchmarkComparison(
+                name=result.name, baseline_p50_ms=stored["p50_ms"], p50_ms=result.p50_ms, change=round(change, 3),
+                baseline_queries=stored["queries"], queries=result.queries,
+                regressed=slower or result.queries > stored["queries"],
+            ))
+        return comparisons
+
+    @staticmethod
+    def _semester(semester_name):
+        if semester_name is not None:
+            semester = Semester.objects.filter(semester_name=semester_name).first()
+            if semester is None:
+                raise ValueError(f"Semester '{semester_name}' does not exist.")
+            return semester
+        semester = Semester.objects.annotate(course_count=Count("courses")).order_by("-course_count", "pk").first()
+        if semester is None:
+            raise ValueError("There are no semesters to benchmark, run generate_synthetic_data first.")
+        return semester
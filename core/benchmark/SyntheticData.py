@@ -0,0 +1,170 @@
+import random
+from datetime import date, time
+from typing import Dict
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from core.generation_cache.GenerationCache import invalidate_schedule_caches
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+# Rows per INSERT, kept below SQLite's limit on query parameters
+GENERATE_CHUNK_SIZE = 500
+
+DEPARTMENTS = {
+    "CS": "Computer Science", "MATH": "Mathematics", "PHYS": "Physics", "CHEM": "Chemistry", "BIO": "Biology",
+    "ENG": "English", "HIST": "History", "ECON": "Economics", "PSY": "Psychology", "STAT": "Statistics",
+}
+COURSE_LEVELS = ("Introduction to", "Foundations of", "Topics in", "Advanced", "Seminar in")
+SKILLS = ("Python", "Java", "C++", "SQL", "Statistics", "Calculus", "Writing", "Lab Safety", "Data Structures",
+          "Machine Learning", "Networks", "Databases")
+FIRST_NAMES = ("Alex", "Blake", "Casey", "Dana", "Eli", "Frankie", "Gray", "Harper", "Indy", "Jordan", "Kai",
+               "Logan", "Morgan", "Noor", "Oakley", "Parker", "Quinn", "Riley", "Sam", "Taylor")
+LAST_NAMES = ("Nguyen", "Smith", "Garcia", "Kim", "Patel", "Johnson", "Lee", "Brown", "Martinez", "Davis",
+              "Lopez", "Wilson", "Anderson", "Thomas", "Moore", "Chen", "Singh", "Clark", "Lewis", "Walker")
+# (days, length in minutes) of the meeting patterns lectures and labs are given
+LECTURE_PATTERNS = (("MWF", 50), ("TR", 75), ("MW", 75))
+LAB_PATTERNS = (("M", 110), ("T", 110), ("W", 110), ("R", 110), ("F", 110))
+# Share of lab sections given a TA, the rest are left for AssignmentController to fill
+LAB_ASSIGNED_SHARE = 0.9
+# Share of courses given an extra TA who only grades
+GRADER_SHARE = 0.5
+
+
+class SyntheticData:
+    @staticmethod
+    def generate(
+        users: int = 5000,
+        semesters: int = 20,
+        courses: int = 10000,
+        sections: int = 50000,
+        first_year: int = 2016,
+        password: str = "password",
+        seed: int = 0,
+    ) -> Dict[str, int]:
+        """
+        Preconditions:
+            - `users` is at least 3, `semesters` at least 1, `courses` at least `semesters` and `sections` at least
+              `courses`.
+            - None of the generated semesters ("Spring <first_year>", "Fall <first_year>", "Spring <first_year + 1>"
+              and so on) or usernames exist yet.
+
+        Postconditions:
+            - Creates `users` users, 1% of them admins, 20% instructors and the rest TAs with a few skills each.
+            - Creates `semesters` semesters with the courses spread evenly across them, and the sections spread
+              evenly across the courses. About a third of each course's sections are lectures taught by a random
+              instructor, the rest are labs, most of which have a random TA who is then also a TA of the course.
+            - Every user can log in with `password`. The same seed always generates the same data.
+            - Raises a ValueError and changes nothing if a precondition does not hold.
+
+        Side-effects:
+            - Inserts the records in a single transaction using bulk_create, and clears the course, calendar
+              and workload caches.
+
+        Returns:
+            - Dict[str, int]: The number of records created per model name.
+        """
+        if users < 3 or semesters < 1 or courses < semesters or sections < courses:
+            raise ValueError("Need at least 3 users, 1 semester, a course per semester and a section per course.")
+        rng = random.Random(seed)
+        semester_names = [f"{'Spring' if i % 2 == 0 else 'Fall'} {first_year + i // 2}" for i in range(semesters)]
+        existing = Semester.objects.filter(semester_name__in=semester_names).order_by("start_date").first()
+        if existing is not None:
+            raise ValueError(f"Semester '{existing.semester_name}' already exists.")
+
+        counts = dict.fromkeys(["User", "Semester", "Course", "CourseSection", "LabSection", "TACourseAssignment",
+                                "TALabAssignment"], 0)
+        with transaction.atomic():
+            instructors, tas = SyntheticData._create_users(users, make_password(password), rng)
+            counts["User"] = users
+            for index, semester_name in enumerate(semester_names):
+                year = first_year + index // 2
+                start, end = (date(year, 1, 15), date(year, 5, 10)) if index % 2 == 0 else \
+                    (date(year, 9, 1), date(year, 12, 15))
+                semester = Semester.objects.create(semester_name=semester_name, start_date=start, end_date=end)
+                counts["Semester"] += 1
+                semester_courses = _share(courses, semesters, index)
+                semester_sections = sum(_share(sections, courses, course) for course in
+                                        range(counts["Course"], counts["Course"] + semester_courses))
+                created = SyntheticData._create_semester(semester, semester_courses, semester_sections, instructors,
+                                                         tas, rng)
+                for model_name, count in created.items():
+                    counts[model_name] += count
+        invalidate_schedule_caches()
+        return counts
+
+    @staticmethod
+    def _create_users(count, password_hash, rng):
+        admins, instructors = max(1, count // 100), max(1, count // 5)
+        roles = ["Admin"] * admins + ["Instructor"] * instructors + ["TA"] * (count - admins - instructors)
+        users = []
+        for i, role in enumerate(roles):
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            username = f"{first_name[0]}{last_name}{i}".lower()
+            users.append(User(username=username, first_name=first_name, last_name=last_name, role=role,
+                              email=f"{username}@example.edu", password=password_hash,
+                              skills=rng.sample(SKILLS, rng.randint(0, 3)) if role == "TA" else []))
+        usernames = [user.username for user in users]
+        for start in range(0, len(usernames), GENERATE_CHUNK_SIZE):
+            taken = User.objects.filter(username__in=usernames[start:start + GENERATE_CHUNK_SIZE]).first()
+            if taken is not None:
+                raise ValueError(f"User '{taken.username}' already exists.")
+        users = User.objects.bulk_create(users, batch_size=GENERATE_CHUNK_SIZE)
+        return [user for user in users if user.role == "Instructor"], [user for user in users if user.role == "TA"]
+
+    @staticmethod
+    def _create_semester(semester, course_count, section_count, instructors, tas, rng) -> Dict[str, int]:
+        departments = list(DEPARTMENTS)
+        courses = []
+        for i in range(course_count):
+            department = departments[i % len(departments)]
+            courses.append(Course(semester=semester, course_code=f"{department}{100 + i // len(departments)}",
+                                  course_name=f"{COURSE_LEVELS[i // len(departments) % len(COURSE_LEVELS)]} "
+                                              f"{DEPARTMENTS[department]}"))
+        courses = Course.objects.bulk_create(courses, batch_size=GENERATE_CHUNK_SIZE)
+
+        course_sections, lab_sections, lab_tas = [], [], []
+        for i, course in enumerate(courses):
+            total = _share(section_count, course_count, i)
+            lectures = max(1, (total + 1) // 3)
+            for number in range(1, lectures + 1):
+                days, length = rng.choice(LECTURE_PATTERNS)
+                start, end = _meeting(rng, length)
+                course_sections.append(CourseSection(course=course, course_section_number=number,
+                                                     instructor=rng.choice(instructors), days=days,
+                                                     start_time=start, end_time=end))
+            for number in range(801, 801 + total - lectures):
+                days, length = rng.choice(LAB_PATTERNS)
+                start, end = _meeting(rng, length)
+                lab_sections.append(LabSection(course=course, lab_section_number=number, days=days, start_time=start,
+                                               end_time=end))
+                lab_tas.append(rng.choice(tas) if rng.random() < LAB_ASSIGNED_SHARE else None)
+        CourseSection.objects.bulk_create(course_sections, batch_size=GENERATE_CHUNK_SIZE)
+        lab_sections = LabSection.objects.bulk_create(lab_sections, batch_size=GENERATE_CHUNK_SIZE)
+
+        lab_assignments = [TALabAssignment(lab_section=lab, ta=ta) for lab, ta in zip(lab_sections, lab_tas)
+                           if ta is not None]
+        course_tas = {}
+        for assignment in lab_assignments:
+            course_tas.setdefault((assignment.lab_section.course_id, assignment.ta.pk), False)
+        for course in courses:
+            if rng.random() < GRADER_SHARE:
+                course_tas.setdefault((course.pk, rng.choice(tas).pk), True)
+        TALabAssignment.objects.bulk_create(lab_assignments, batch_size=GENERATE_CHUNK_SIZE)
+        TACourseAssignment.objects.bulk_create(
+            [TACourseAssignment(course_id=course_id, ta_id=ta_id, grader_status=grader)
+             for (course_id, ta_id), grader in course_tas.items()],
+            batch_size=GENERATE_CHUNK_SIZE)
+        return {"Course": len(courses), "CourseSection": len(course_sections), "LabSection": len(lab_sections),
+                "TACourseAssignment": len(course_tas), "TALabAssignment": len(lab_assignments)}
+
+
+def _share(total: int, parts: int, index: int) -> int:
+    # total split into parts that differ by at most one, the first ones taking the remainder
+    return total // parts + (1 if index < total % parts else 0)
+
+
+def _meeting(rng, length: int):
+    start = rng.randrange(8 * 60, 17 * 60, 30)
+    end = start + length
+    return time(start // 60, start % 60), time(end // 60, end % 60)
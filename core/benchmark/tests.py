@@ -0,0 +1,139 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from core.benchmark.Benchmark import Benchmark
+from core.benchmark.SyntheticData import SyntheticData
+from core.local_data_classes import BenchmarkResult
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+
+class TestSyntheticData(TestCase):
+    def test_generates_requested_scale(self):
+        counts = SyntheticData.generate(users=100, semesters=4, courses=40, sections=200)
+        self.assertEqual(counts["User"], User.objects.count())
+        self.assertEqual(User.objects.count(), 100)
+        self.assertEqual(list(Semester.objects.order_by("start_date").values_list("semester_name", flat=True)),
+                         ["Spring 2016", "Fall 2016", "Spring 2017", "Fall 2017"])
+        self.assertEqual(Course.objects.count(), 40)
+        self.assertEqual(CourseSection.objects.count() + LabSection.objects.count(), 200)
+        self.assertEqual(counts["TALabAssignment"], TALabAssignment.objects.count())
+        self.assertEqual(counts["TACourseAssignment"], TACourseAssignment.objects.count())
+        self.assertEqual(User.objects.filter(role="Admin").count(), 1)
+        self.assertEqual(User.objects.filter(role="Instructor").count(), 20)
+
+    def test_data_is_consistent(self):
+        SyntheticData.generate(users=50, semesters=2, courses=10, sections=50, password="secret")
+        self.assertTrue(self.client.login(username=User.objects.filter(role="Admin").first().username,
+                                          password="secret"))
+        self.assertFalse(CourseSection.objects.exclude(instructor__role="Instructor").exists())
+        self.assertFalse(TALabAssignment.objects.exclude(ta__role="TA").exists())
+        self.assertFalse(LabSection.objects.filter(day_mask=0).exists())
+        # every TA of a lab is a TA of its course
+        for assignment in TALabAssignment.objects.all():
+            self.assertTrue(TACourseAssignment.objects.filter(ta=assignment.ta,
+                                                              course=assignment.lab_section.course).exists())
+
+    def test_same_seed_same_data(self):
+        SyntheticData.generate(users=20, semesters=1, courses=5, sections=20, seed=3)
+        labs = LabSection.objects.order_by("course__course_code", "lab_section_number").values_list(
+            "days", "start_time", "talabassignment_set__ta__username")
+        first = list(labs)
+        Semester.objects.all().delete()
+        User.objects.all().delete()
+        SyntheticData.generate(users=20, semesters=1, courses=5, sections=20, seed=3)
+        self.assertEqual(first, list(labs.all()))
+
+    def test_existing_semester_rejected(self):
+        SyntheticData.generate(users=10, semesters=1, courses=2, sections=4)
+        with self.assertRaisesMessage(ValueError, "Semester 'Spring 2016' already exists."):
+            SyntheticData.generate(users=10, semesters=1, courses=2, sections=4)
+        self.assertEqual(User.objects.count(), 10)
+
+    def test_invalid_scale(self):
+        with self.assertRaises(ValueError):
+            SyntheticData.generate(users=10, semesters=2, courses=4, sections=3)
+
+
+class TestBenchmark(TestCase):
+    def setUp(self):
+        SyntheticData.generate(users=60, semesters=2, courses=10, sections=60)
+
+    def test_runs_every_case(self):
+        results = Benchmark.run(iterations=2)
+        self.assertEqual([result.name for result in results], [name for name, _ in Benchmark.cases()])
+        for result in results:
+            self.assertLessEqual(result.p50_ms, result.p90_ms)
+            self.assertLessEqual(result.p99_ms, result.max_ms)
+            if not result.name.startswith("RequestMetrics."):
+                self.assertGreater(result.queries, 0, result.name)
+
+    def test_writes_are_rolled_back(self):
+        Benchmark.run(iterations=1, only="clone_semester")
+        self.assertEqual(Semester.objects.count(), 2)
+
+    def test_only(self):
+        self.assertEqual([result.name for result in Benchmark.run(iterations=1, only="GET /search/")],
+                         ["GET /search/course/", "GET /search/user/"])
+
+    def test_unknown_semester(self):
+        with self.assertRaisesMessage(ValueError, "Semester 'Fall 1999' does not exist."):
+            Benchmark.run(semester_name="Fall 1999")
+
+    def test_percentile(self):
+        samples = [float(n) for n in range(1, 101)]
+        self.assertEqual(Benchmark.percentile(samples, 50), 50)
+        self.assertEqual(Benchmark.percentile(samples, 99), 99)
+        self.assertEqual(Benchmark.percentile([4.0], 90), 4)
+
+    def test_compare(self):
+        results = [BenchmarkResult("fast", 5, 2, 10.0, 11.0, 12.0, 12.0),
+                   BenchmarkResult("slow", 5, 2, 20.0, 21.0, 22.0, 22.0),
+                   BenchmarkResult("noisy", 5, 2, 0.5, 0.6, 0.6, 0.6),
+                   BenchmarkResult("queries", 5, 3, 10.0, 11.0, 12.0, 12.0),
+                   BenchmarkResult("new", 5, 2, 10.0, 11.0, 12.0, 12.0)]
+        baseline = {name: {"p50_ms": p50, "queries": 2} for name, p50 in
+                    (("fast", 10.0), ("slow", 10.0), ("noisy", 0.2), ("queries", 10.0))}
+        comparisons = {comparison.name: comparison for comparison in Benchmark.compare(results, baseline)}
+        self.assertNotIn("new", comparisons)
+        self.assertFalse(comparisons["fast"].regressed)
+        self.assertTrue(comparisons["slow"].regressed)
+        self.assertEqual(comparisons["slow"].change, 1.0)
+        self.assertFalse(comparisons["noisy"].regressed)
+        self.assertTrue(comparisons["queries"].regressed)
+
+
+class TestBenchmarkCommands(TestCase):
+    def test_generate_and_compare_with_baseline(self):
+        call_command("generate_synthetic_data", "--users", "30", "--semesters", "1", "--courses", "5",
+                     "--sections", "20", stdout=StringIO())
+        self.assertEqual(Course.objects.count(), 5)
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = Path(directory) / "baseline.json"
+            out = StringIO()
+            call_command("run_benchmarks", "--iterations", "1", "--only", "CourseController", "--baseline",
+                         str(baseline), stdout=out)
+            self.assertIn("No baseline", out.getvalue())
+
+            call_command("run_benchmarks", "--iterations", "1", "--only", "CourseController", "--baseline",
+                         str(baseline), "--save-baseline", stdout=StringIO())
+            stored = json.loads(baseline.read_text())
+            self.assertEqual(stored["scale"]["Course"], 5)
+            self.assertIn("CourseController.get_course", [result["name"] for result in stored["results"]])
+
+            # a baseline that ran no queries makes every benchmark a regression
+            for result in stored["results"]:
+                result["queries"] = 0
+            baseline.write_text(json.dumps(stored))
+            with self.assertRaisesMessage(CommandError, "regressed"):
+                call_command("run_benchmarks", "--iterations", "1", "--only", "CourseController", "--baseline",
+                             str(baseline), "--fail-on-regression", stdout=StringIO())
+
+    def test_generate_rejects_invalid_scale(self):
+        with self.assertRaises(CommandError):
+            call_command("generate_synthetic_data", "--users", "1", stdout=StringIO())
@@ -0,0 +1,150 @@
+import hashlib
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, List
+
+from django.core import signing
+from django.core.cache import cache
+
+from core.generation_cache.GenerationCache import CALENDAR_FEEDS
+from core.local_data_classes import CalendarFeed
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TALabAssignment, User
+from ta_scheduler.weekdays import Weekdays
+
+# Feeds are rebuilt when a schedule changes, this only bounds how long an unused feed stays in the cache
+CALENDAR_CACHE_SECONDS = 24 * 60 * 60
+_TOKEN_SALT = "calendar_feed"
+
+
+class CalendarController:
+    @staticmethod
+    def get_feed(username: str) -> CalendarFeed:
+        """
+        Pre-conditions: A user with the given username exists, otherwise a ValueError is raised
+        Post-conditions: Returns an iCalendar feed with one event per meeting of every course section the user
+            instructs and lab section the user TAs, between the start and end dates of the section's semester.
+            Sections whose days can't be parsed are left out. The feed is cached until a semester, course,
+            section, lab assignment or user is written to.
+        Side-effects: May store the feed in the cache
+        """
+        key = CALENDAR_FEEDS.key(hashlib.sha1(username.encode("utf-8")).hexdigest())
+        feed = cache.get(key)
+        if feed is None:
+            try:
+                user = User.objects.only("id", "username").get(username=username)
+            except User.DoesNotExist:
+                raise ValueError(f"User '{username}' does not exist.")
+            body = CalendarController._render(user)
+            feed = CalendarFeed(etag=f'"{hashlib.sha1(body.encode("utf-8")).hexdigest()}"', body=body)
+            cache.set(key, feed, CALENDAR_CACHE_SECONDS)
+        return feed
+
+    @staticmethod
+    def feed_token(username: str) -> str:
+        """
+        Post-conditions: Returns a signed token naming the user, used in the feed's URL so calendar clients
+            can fetch it without logging in
+        Side-effects: None
+        """
+        # no timestamp, so a user's feed URL stays the same for calendars subscribed to it
+        return signing.Signer(salt=_TOKEN_SALT).sign_object(username)
+
+    @staticmethod
+    def username_from_token(token: str) -> str:
+        """
+        Post-conditions: Returns the username a token from feed_token was made for, raises a ValueError if the
+            token was not made by feed_token
+        Side-effects: None
+        """
+        try:
+            return signing.Signer(salt=_TOKEN_SALT).unsign_object(token)
+        except signing.BadSignature:
+            raise ValueError("Invalid calendar token.")
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """
+        Post-conditions: Every cached feed is unreachable and will be rebuilt on next access
+        Side-effects: Moves the cache to a new generation of feed keys
+        """
+        CALENDAR_FEEDS.invalidate_all()
+
+    @staticmethod
+    def _render(user: User) -> str:
+        course_sections = CourseSection.objects.filter(instructor=user).select_related("course__semester").order_by("pk")
+        lab_sections = (LabSection.objects.filter(talabassignment_set__ta=user)
+                        .select_related("course__semester").order_by("pk"))
+        lines = [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//TA Scheduler//Schedule//EN",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:{_escape(user.username)} schedule",
+        ]
+        for section in course_sections:
+            lines += _section_events(section, "course", f"Section {section.course_section_number}")
+        for section in lab_sections:
+            lines += _section_events(section, "lab", f"Lab {section.lab_section_number}")
+        lines.append("END:VCALENDAR")
+        return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+def _section_events(section, kind: str, label: str) -> List[str]:
+    weekdays = Weekdays.from_mask(section.day_mask)
+    course, semester = section.course, section.course.semester
+    # DTSTAMP is required, using the semester start keeps an unchanged schedule byte for byte identical
+    stamp = semester.start_date.strftime("%Y%m%dT000000Z")
+    events = []
+    for day in _meeting_dates(semester.start_date, semester.end_date, weekdays):
+        events += [
+            "BEGIN:VEVENT",
+            f"UID:{kind}-{section.pk}-{day:%Y%m%d}@ta-scheduler",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{_datetime(day, section.start_time)}",
+            f"DTEND:{_datetime(day, section.end_time)}",
+            f"SUMMARY:{_escape(f'{course.course_code} {label}')}",
+            f"DESCRIPTION:{_escape(f'{course.course_name} ({semester.semester_name})')}",
+            "END:VEVENT",
+        ]
+    return events
+
+
+def _meeting_dates(start: date, end: date, weekdays: List[int]) -> Iterator[date]:
+    # first meeting on each weekday, then one week at a time
+    firsts = sorted(start + timedelta(days=(weekday - start.weekday()) % 7) for weekday in weekdays)
+    week = 0
+    while True:
+        meetings = [first + timedelta(weeks=week) for first in firsts if first + timedelta(weeks=week) <= end]
+        if not meetings:
+            return
+        yield from meetings
+        week += 1
+
+
+def _datetime(day: date, at: time) -> str:
+    # floating local time, the schedule's times have no timezone
+    return datetime.combine(day, at).strftime("%Y%m%dT%H%M%S")
+
+
+def _escape(text: str) -> str:
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _fold(line: str) -> str:
+    # content lines are limited to 75 octets, longer ones continue on lines starting with a space
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts, current = [], ""
+    for char in line:
+        limit = 75 if not parts else 74
+        if len((current + char).encode("utf-8")) > limit:
+            parts.append(current)
+            current = ""
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+# a user's name is in the feeds they appear in, and a deleted user's feed must stop being served
+CALENDAR_FEEDS.invalidate_on_write(Semester, Course, CourseSection, LabSection, TALabAssignment, User)
@@ -0,0 +1,87 @@
+from datetime import date, time
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.calendar_controller.CalendarController import CalendarController
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TALabAssignment, User
+
+
+class CalendarControllerTestBase(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Monday 2025-09-01 to Friday 2025-09-12
+        self.semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1), end_date=date(2025, 9, 12))
+        self.instructor = User.objects.create(username="instructor", role="Instructor")
+        self.ta = User.objects.create(username="ta", role="TA")
+        self.course = Course.objects.create(course_code="CS361", course_name="Software Eng, Intro", semester=self.semester)
+        self.section = CourseSection.objects.create(course=self.course, course_section_number=1, instructor=self.instructor,
+                                                    days="Mon, Wed", start_time=time(9, 0), end_time=time(10, 15))
+        self.lab = LabSection.objects.create(course=self.course, lab_section_number=801, days="F",
+                                             start_time=time(11, 0), end_time=time(12, 50))
+        TALabAssignment.objects.create(lab_section=self.lab, ta=self.ta)
+
+
+class TestGetFeed(CalendarControllerTestBase):
+    def test_expands_meetings_within_semester(self):
+        body = CalendarController.get_feed("instructor").body
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertEqual(body.count("BEGIN:VEVENT"), 4)
+        for day in ("20250901", "20250903", "20250908", "20250910"):
+            self.assertIn(f"DTSTART:{day}T090000\r\n", body)
+        self.assertIn("DTEND:20250901T101500\r\n", body)
+        self.assertIn("SUMMARY:CS361 Section 1\r\n", body)
+        self.assertIn("DESCRIPTION:Software Eng\\, Intro (Fall 2025)\r\n", body)
+
+    def test_ta_lab_meetings(self):
+        body = CalendarController.get_feed("ta").body
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+        self.assertIn("DTSTART:20250905T110000\r\n", body)
+        self.assertIn("DTSTART:20250912T110000\r\n", body)
+
+    def test_unparseable_days_left_out(self):
+        self.lab.days = "sometimes"
+        self.lab.save()
+        self.assertNotIn("BEGIN:VEVENT", CalendarController.get_feed("ta").body)
+
+    def test_unknown_user(self):
+        with self.assertRaises(ValueError):
+            CalendarController.get_feed("nobody")
+
+    def test_cached_until_schedule_changes(self):
+        feed = CalendarController.get_feed("ta")
+        with self.assertNumQueries(0):
+            self.assertEqual(CalendarController.get_feed("ta"), feed)
+        self.lab.start_time = time(13, 0)
+        self.lab.save()
+        changed = CalendarController.get_feed("ta")
+        self.assertNotEqual(changed.etag, feed.etag)
+        self.assertIn("DTSTART:20250905T130000\r\n", changed.body)
+
+    def test_deleted_user_not_served_from_cache(self):
+        CalendarController.get_feed("ta")
+        self.ta.delete()
+        with self.assertRaises(ValueError):
+            CalendarController.get_feed("ta")
+
+    def test_renamed_user_not_served_from_cache(self):
+        CalendarController.get_feed("ta")
+        self.ta.username = "renamed"
+        self.ta.save()
+        with self.assertRaises(ValueError):
+            CalendarController.get_feed("ta")
+
+    def test_same_schedule_same_etag(self):
+        feed = CalendarController.get_feed("ta")
+        CalendarController.invalidate_all()
+        self.assertEqual(CalendarController.get_feed("ta").etag, feed.etag)
+
+
+class TestFeedToken(TestCase):
+    def test_round_trip(self):
+        self.assertEqual(CalendarController.username_from_token(CalendarController.feed_token("ta")), "ta")
+
+    def test_tampered_token(self):
+        token = CalendarController.feed_token("ta")
+        with self.assertRaises(ValueError):
+            CalendarController.username_from_token(token[:-1] + ("A" if token[-1] != "A" else "B"))
@@ -0,0 +1,142 @@
+from collections import defaultdict
+from typing import List, Tuple
+
+from django.db.models import Exists, F, OuterRef, QuerySet
+
+from core.conflict_controller.ScheduleIndex import MINUTES_PER_DAY, ScheduleIndex, section_intervals
+from core.local_data_classes import ScheduleConflict
+from ta_scheduler.models import CourseSection, LabSection, Semester, TALabAssignment, User
+from ta_scheduler.weekdays import WEEKDAY_NAMES, Weekdays, minute_of_day
+
+# (kind, primary key) of a section, kind being "course" or "lab"
+SectionKey = Tuple[str, int]
+
+
+class ConflictController:
+    @staticmethod
+    def find_conflicts(user: User, semester_id: int, days: str | None, start_time, end_time,
+                       exclude: SectionKey | None = None, section_label: str = "") -> List[ScheduleConflict]:
+        """
+        Pre-conditions: start_time and end_time are times or "HH:MM" strings
+        Post-conditions: Returns a conflict for every section of the semester that the user instructs or TAs and that
+            meets at the same time as the given meeting times, skipping the section named by exclude (the section being
+            edited). Days that can't be parsed have no known meeting times and never conflict.
+        Side-effects: None
+        """
+        if start_time is None or end_time is None:
+            return []
+        try:
+            day_mask = Weekdays.mask(days)
+        except ValueError:
+            return []
+        start, end = minute_of_day(start_time), minute_of_day(end_time)
+
+        conflicts = []
+        for key, label, section in ConflictController._user_sections(user, semester_id, day_mask, start, end):
+            if key != exclude:
+                first_day = Weekdays.from_mask(section.shared_days)[0]
+                conflicts.append((first_day, section.start_minute, ScheduleConflict(
+                    username=user.username, section=section_label, conflicting_section=label,
+                    day=WEEKDAY_NAMES[first_day])))
+        return [conflict for _, _, conflict in sorted(conflicts, key=lambda conflict: conflict[:2])]
+
+    @staticmethod
+    def check_section(user: User, semester_id: int, days: str | None, start_time, end_time,
+                      exclude: SectionKey | None = None) -> None:
+        """
+        Post-conditions: Raises a ValueError naming the first conflicting section if find_conflicts finds any
+        Side-effects: None
+        """
+        conflicts = ConflictController.find_conflicts(user, semester_id, days, start_time, end_time, exclude)
+        if conflicts:
+            conflict = conflicts[0]
+            raise ValueError(f"{user.username} is already scheduled for {conflict.conflicting_section} "
+                             f"on {conflict.day} at that time.")
+
+    @staticmethod
+    def semester_conflicts(semester_name: str) -> List[ScheduleConflict]:
+        """
+        Pre-conditions: A semester with the given name exists, otherwise a ValueError is raised
+        Post-conditions: Returns every pair of sections in the semester with overlapping meeting times that are taught
+            by the same instructor or TA, once per pair, ordered by username
+        Side-effects: None
+        """
+        try:
+            semester = Semester.objects.get(semester_name=semester_name)
+        except Semester.DoesNotExist:
+            raise ValueError(f"Semester '{semester_name}' does not exist.")
+
+        meetings_by_user = defaultdict(list)
+        sections = CourseSection.objects.filter(course__semester=semester).select_related("course", "instructor")
+        for section in sections:
+            for start, end in section_intervals(section):
+                meetings_by_user[section.instructor.username].append(
+                    (start, end, (("course", section.pk), _course_section_label(section))))
+        assignments = (TALabAssignment.objects.filter(lab_section__course__semester=semester)
+                       .select_related("lab_section__course", "ta"))
+        for assignment in assignments:
+            for start, end in section_intervals(assignment.lab_section):
+                meetings_by_user[assignment.ta.username].append(
+                    (start, end, (("lab", assignment.lab_section.pk), _lab_section_label(assignment.lab_section))))
+
+        conflicts = []
+        for username in sorted(meetings_by_user):
+            # meetings are added in order of their start, so each add only appends to the index
+            index, seen = ScheduleIndex(), set()
+            for start, end, (key, label) in sorted(meetings_by_user[username], key=lambda meeting: meeting[:2]):
+                for other_key, other_label in index.overlapping(start, end):
+                    pair = frozenset((key, other_key))
+                    if other_key != key and pair not in seen:
+                        seen.add(pair)
+                        conflicts.append(ScheduleConflict(username=username, section=other_label,
+                                                          conflicting_section=label, day=_day_name(start)))
+                index.add(start, end, (key, label))
+        return conflicts
+
+    @staticmethod
+    def available_users(semester_id: int, days: str | None, start_time, end_time, role: str | None = None) -> QuerySet:
+        """
+        Pre-conditions: days is a string accepted by Weekdays.parse, otherwise a ValueError is raised. start_time
+            and end_time are times or "HH:MM" strings
+        Post-conditions: Returns a queryset of the users, of the given role if one is given, who neither instruct
+            nor TA a section of the semester meeting at the same time. The filtering is done by the database on
+            the sections' day masks and minutes.
+        Side-effects: None
+        """
+        day_mask = Weekdays.mask(days)
+        start, end = minute_of_day(start_time), minute_of_day(end_time)
+        users = User.objects.all() if role is None else User.objects.filter(role=role)
+        teaching = _overlapping(CourseSection.objects.filter(course__semester_id=semester_id,
+                                                             instructor=OuterRef("pk")), day_mask, start, end)
+        assisting = _overlapping(LabSection.objects.filter(course__semester_id=semester_id,
+                                                           talabassignment_set__ta=OuterRef("pk")), day_mask, start, end)
+        return users.filter(~Exists(teaching), ~Exists(assisting))
+
+    @staticmethod
+    def _user_sections(user: User, semester_id: int, day_mask: int, start: int, end: int):
+        sections = _overlapping(CourseSection.objects.filter(instructor=user, course__semester_id=semester_id),
+                                day_mask, start, end).select_related("course")
+        for section in sections:
+            yield ("course", section.pk), _course_section_label(section), section
+        lab_sections = _overlapping(LabSection.objects.filter(talabassignment_set__ta=user, course__semester_id=semester_id),
+                                    day_mask, start, end).select_related("course")
+        for section in lab_sections:
+            yield ("lab", section.pk), _lab_section_label(section), section
+
+
+def _overlapping(sections: QuerySet, day_mask: int, start: int, end: int) -> QuerySet:
+    # sections sharing a day with the meeting whose times overlap it, shared_days being the days they share
+    return (sections.filter(start_minute__lt=end, end_minute__gt=start)
+            .annotate(shared_days=F("day_mask").bitand(day_mask)).filter(shared_days__gt=0))
+
+
+def _course_section_label(section: CourseSection) -> str:
+    return f"{section.course.course_code} section {section.course_section_number}"
+
+
+def _lab_section_label(section: LabSection) -> str:
+    return f"{section.course.course_code} lab section {section.lab_section_number}"
+
+
+def _day_name(week_minute: int) -> str:
+    return WEEKDAY_NAMES[week_minute // MINUTES_PER_DAY]
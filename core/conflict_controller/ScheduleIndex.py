@@ -0,0 +1,77 @@
+from bisect import bisect_left, bisect_right
+from datetime import time
+from typing import Iterable, List, Tuple
+
+from ta_scheduler.weekdays import Weekdays, minute_of_day
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def weekly_intervals(days: str | None, start_time: time | str, end_time: time | str) -> List[Tuple[int, int]]:
+    """
+    Returns the [start, end) intervals a section meets in, in minutes since the start of Monday. Raises a
+    ValueError if days can't be parsed.
+    """
+    start, end = minute_of_day(start_time), minute_of_day(end_time)
+    return [(weekday * MINUTES_PER_DAY + start, weekday * MINUTES_PER_DAY + end) for weekday in Weekdays.parse(days)]
+
+
+def section_intervals(section) -> List[Tuple[int, int]]:
+    """
+    Returns the [start, end) intervals a saved section meets in, in minutes since the start of Monday, from its stored
+    day mask and minutes rather than by parsing its days
+    """
+    return [(weekday * MINUTES_PER_DAY + section.start_minute, weekday * MINUTES_PER_DAY + section.end_minute)
+            for weekday in Weekdays.from_mask(section.day_mask)]
+
+
+class ScheduleIndex:
+    """
+    The weekly meetings of one person, kept as half-open intervals sorted by start together with the running
+    maximum of their ends. Meetings that may overlap each other are allowed.
+
+    overlapping() finds the meetings that start before the end of a query with a binary search, and the running
+    maximum tells when none of those reach its start, so a check that finds no conflict is O(log n). When there are
+    conflicts it walks back only while an earlier meeting still reaches the query. add() is O(n).
+    """
+    def __init__(self, meetings: Iterable[Tuple[int, int, object]] = ()):
+        meetings = sorted(meetings, key=lambda meeting: (meeting[0], meeting[1]))
+        self._starts = [start for start, _, _ in meetings]
+        self._ends = [end for _, end, _ in meetings]
+        self._values = [value for _, _, value in meetings]
+        self._max_ends = []
+        self._update_max_ends(0)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def add(self, start: int, end: int, value) -> None:
+        """
+        Post-conditions: The meeting [start, end) is in the index and returned by overlapping queries with value
+        """
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+        self._values.insert(i, value)
+        self._max_ends.insert(i, end)
+        self._update_max_ends(i)
+
+    def overlapping(self, start: int, end: int) -> List:
+        """
+        Returns the values of the meetings overlapping [start, end), latest starting first. Meetings that only
+        touch it, ending when it starts or starting when it ends, don't overlap.
+        """
+        found = []
+        i = bisect_left(self._starts, end) - 1
+        while i >= 0 and self._max_ends[i] > start:
+            if self._ends[i] > start:
+                found.append(self._values[i])
+            i -= 1
+        return found
+
+    def _update_max_ends(self, i: int) -> None:
+        del self._max_ends[i:]
+        running = self._max_ends[-1] if self._max_ends else -1
+        for end in self._ends[i:]:
+            running = max(running, end)
+            self._max_ends.append(running)
@@ -0,0 +1,172 @@
+import random
+from datetime import date, time
+
+from django.test import SimpleTestCase, TestCase
+
+from core.conflict_controller.ConflictController import ConflictController
+from core.conflict_controller.ScheduleIndex import ScheduleIndex, weekly_intervals
+from core.local_data_classes import CourseRef, CourseSectionFormData, LabSectionFormData, UserRef
+from core.section_controller.SectionController import SectionController
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TALabAssignment, User
+
+
+class TestScheduleIndex(SimpleTestCase):
+    def test_overlapping(self):
+        index = ScheduleIndex([(0, 60, "a"), (120, 180, "b"), (150, 200, "c")])
+        self.assertEqual(index.overlapping(30, 90), ["a"])
+        self.assertEqual(index.overlapping(160, 170), ["c", "b"])
+        self.assertEqual(index.overlapping(60, 120), [])
+
+    def test_long_meeting_found_past_shorter_ones(self):
+        index = ScheduleIndex([(0, 1000, "long"), (10, 20, "short")])
+        self.assertEqual(index.overlapping(500, 600), ["long"])
+
+    def test_add_keeps_order(self):
+        index = ScheduleIndex()
+        for start, end, value in [(300, 400, "c"), (0, 100, "a"), (150, 250, "b")]:
+            index.add(start, end, value)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.overlapping(50, 320), ["c", "b", "a"])
+
+    def test_matches_brute_force(self):
+        randomizer = random.Random(1)
+        meetings = [(start, start + randomizer.randint(1, 120), i)
+                    for i, start in enumerate(randomizer.randint(0, 10000) for _ in range(500))]
+        index = ScheduleIndex(meetings)
+        for _ in range(200):
+            start = randomizer.randint(0, 10000)
+            end = start + randomizer.randint(1, 120)
+            expected = {value for s, e, value in meetings if s < end and start < e}
+            self.assertEqual(set(index.overlapping(start, end)), expected)
+
+    def test_weekly_intervals(self):
+        self.assertEqual(weekly_intervals("MW", time(9, 0), "10:15"), [(540, 615), (2 * 1440 + 540, 2 * 1440 + 615)])
+
+
+class ConflictControllerTestBase(TestCase):
+    def setUp(self):
+        self.semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1), end_date=date(2025, 12, 15))
+        self.instructor = User.objects.create(username="instructor", role="Instructor")
+        self.ta = User.objects.create(username="ta", role="TA")
+        self.course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=self.semester)
+        self.section = CourseSection.objects.create(course=self.course, course_section_number=1, instructor=self.instructor,
+                                                    days="Monday, Wednesday", start_time=time(9, 0), end_time=time(10, 15))
+        self.lab = LabSection.objects.create(course=self.course, lab_section_number=801, days="Tuesday",
+                                             start_time=time(11, 0), end_time=time(12, 50))
+        TALabAssignment.objects.create(lab_section=self.lab, ta=self.ta)
+        self.other_lab = LabSection.objects.create(course=self.course, lab_section_number=802, days="Tue, Thu",
+                                                   start_time=time(12, 0), end_time=time(13, 0))
+
+    def course_section_data(self, number, days, start, end, instructor="instructor"):
+        return CourseSectionFormData(course=CourseRef("CS361", "Software Eng"), section_number=number, days=days,
+                                     start_time=start, end_time=end, section_type="Course",
+                                     instructor=UserRef(name="", username=instructor))
+
+
+class TestFindConflicts(ConflictControllerTestBase):
+    def test_overlap_found(self):
+        conflicts = ConflictController.find_conflicts(self.instructor, self.semester.id, "W", "10:00", "11:00")
+        self.assertEqual([(c.conflicting_section, c.day) for c in conflicts], [("CS361 section 1", "Wednesday")])
+
+    def test_back_to_back_and_other_days_allowed(self):
+        self.assertEqual(ConflictController.find_conflicts(self.instructor, self.semester.id, "MW", "10:15", "11:00"), [])
+        self.assertEqual(ConflictController.find_conflicts(self.instructor, self.semester.id, "TR", "09:00", "10:15"), [])
+
+    def test_excluded_section_and_other_semesters_ignored(self):
+        self.assertEqual(ConflictController.find_conflicts(self.instructor, self.semester.id, "MW", "09:00", "10:15",
+                                                           exclude=("course", self.section.pk)), [])
+        other = Semester.objects.create(semester_name="Spring 2026", start_date=date(2026, 1, 20), end_date=date(2026, 5, 10))
+        self.assertEqual(ConflictController.find_conflicts(self.instructor, other.id, "MW", "09:00", "10:15"), [])
+
+    def test_unparseable_days_never_conflict(self):
+        self.assertEqual(ConflictController.find_conflicts(self.instructor, self.semester.id, "TBA", "09:00", "10:15"), [])
+
+
+class TestSectionControllerRejectsConflicts(ConflictControllerTestBase):
+    def test_new_course_section_overlapping_instructor(self):
+        with self.assertRaises(ValueError) as context:
+            SectionController.save_course_section(self.course_section_data(2, "Mon", "10:00", "11:00"), "Fall 2025", None)
+        self.assertEqual(str(context.exception),
+                         "instructor is already scheduled for CS361 section 1 on Monday at that time.")
+        self.assertFalse(CourseSection.objects.filter(course_section_number=2).exists())
+
+    def test_editing_section_does_not_conflict_with_itself(self):
+        SectionController.save_course_section(self.course_section_data(1, "Mon, Wed", "09:30", "10:45"), "Fall 2025", 1)
+        self.assertEqual(CourseSection.objects.get(pk=self.section.pk).start_time, time(9, 30))
+
+    def test_moving_lab_onto_ta_schedule(self):
+        data = LabSectionFormData(course=CourseRef("CS361", "Software Eng"), section_number=801, days="Tuesday",
+                                  start_time="11:00", end_time="11:30", section_type="Lab")
+        SectionController.save_lab_section(data, "Fall 2025", 801)
+        TALabAssignment.objects.create(lab_section=self.other_lab, ta=User.objects.create(username="ta2", role="TA"))
+        SectionController.assign_instructor_or_ta("Lab", 801, "CS361", "Fall 2025", UserRef(name="", username="ta2"))
+        data.start_time, data.end_time = "11:30", "12:30"
+        with self.assertRaises(ValueError):
+            SectionController.save_lab_section(data, "Fall 2025", 801)
+
+    def test_assigning_ta_to_overlapping_lab(self):
+        with self.assertRaises(ValueError) as context:
+            SectionController.assign_instructor_or_ta("Lab", 802, "CS361", "Fall 2025", UserRef(name="", username="ta"))
+        self.assertIn("ta is already scheduled for CS361 lab section 801 on Tuesday", str(context.exception))
+        self.assertFalse(TALabAssignment.objects.filter(lab_section=self.other_lab).exists())
+
+
+class TestSemesterConflicts(ConflictControllerTestBase):
+    def test_report_lists_each_pair_once(self):
+        # overlaps section 1 on both Monday and Wednesday
+        CourseSection.objects.create(course=self.course, course_section_number=2, instructor=self.instructor,
+                                     days="MW", start_time=time(10, 0), end_time=time(11, 0))
+        TALabAssignment.objects.create(lab_section=self.other_lab, ta=self.ta)
+        conflicts = ConflictController.semester_conflicts("Fall 2025")
+        self.assertEqual([(c.username, c.section, c.conflicting_section, c.day) for c in conflicts], [
+            ("instructor", "CS361 section 1", "CS361 section 2", "Monday"),
+            ("ta", "CS361 lab section 801", "CS361 lab section 802", "Tuesday"),
+        ])
+
+    def test_no_conflicts(self):
+        self.assertEqual(ConflictController.semester_conflicts("Fall 2025"), [])
+
+    def test_unknown_semester(self):
+        with self.assertRaises(ValueError):
+            ConflictController.semester_conflicts("Spring 1900")
+
+    def test_report_queries_independent_of_size(self):
+        courses = Course.objects.bulk_create([
+            Course(course_code=f"BULK{i}", course_name="Bulk", semester=self.semester) for i in range(200)
+        ])
+        labs = LabSection.objects.bulk_create([
+            LabSection(course=course, lab_section_number=1, days="MWF", start_time=time(8, 0), end_time=time(9, 0))
+            for course in courses
+        ])
+        TALabAssignment.objects.bulk_create([TALabAssignment(lab_section=lab, ta=self.ta) for lab in labs])
+        with self.assertNumQueries(3):
+            conflicts = ConflictController.semester_conflicts("Fall 2025")
+        self.assertEqual(len(conflicts), 200 * 199 // 2)
+
+
+class TestAvailableUsers(ConflictControllerTestBase):
+    def available(self, days, start, end, role=None):
+        return set(ConflictController.available_users(self.semester.id, days, start, end, role)
+                   .values_list("username", flat=True))
+
+    def test_busy_instructor_and_ta_filtered_out(self):
+        self.assertEqual(self.available("W", "09:30", "10:00"), {"ta"})
+        self.assertEqual(self.available("Tue", "12:00", "13:00", role="TA"), set())
+        self.assertEqual(self.available("Thu", "12:00", "13:00", role="TA"), {"ta"})
+
+    def test_back_to_back_is_available(self):
+        self.assertEqual(self.available("MW", "10:15", "11:00"), {"instructor", "ta"})
+
+    def test_other_semester_ignored(self):
+        other = Semester.objects.create(semester_name="Spring 2026", start_date=date(2026, 1, 20),
+                                        end_date=date(2026, 5, 10))
+        users = ConflictController.available_users(other.id, "MW", "09:00", "10:00")
+        self.assertEqual(set(users.values_list("username", flat=True)), {"instructor", "ta"})
+
+    def test_single_query(self):
+        with self.assertNumQueries(1):
+            self.available("MW", "09:00", "10:00")
+
+    def test_invalid_days(self):
+        with self.assertRaises(ValueError):
+            ConflictController.available_users(self.semester.id, "sometimes", "09:00", "10:00")
@@ -0,0 +1,88 @@
+import hashlib
+import threading
+
+from django.conf import settings
+
+from core.generation_cache.GenerationCache import COURSE_OVERVIEWS
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+# Seconds a cached course overview stays valid if no write invalidates it first
+DEFAULT_COURSE_CACHE_TIMEOUT = 300
+
+
+class CourseCache:
+    """
+    A cross-request cache of CourseOverviews built on Django's cache framework. The backend is the
+    cache alias named by settings.COURSE_CACHE_ALIAS ("default", a locmem cache, unless configured).
+
+    Entries are dropped per course by invalidate() from the controller write paths, and all at once by
+    invalidate_all() whenever a model that appears in an overview is written to outside of them.
+    """
+    _stats_lock = threading.Lock()
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def get_or_load(course_code: str, semester_name: str, loader):
+        """
+        Pre-conditions: loader takes no arguments and returns the CourseOverview for the course
+        Post-conditions: Returns the cached overview for the course, calling loader and caching its result
+            on a miss. Exceptions from loader are not cached.
+        Side-effects: May store an entry in the cache, updates the hit/miss counters
+        """
+        cache = CourseCache._cache()
+        key = CourseCache._key(course_code, semester_name)
+        overview = cache.get(key)
+        if overview is not None:
+            CourseCache._count(hit=True)
+            return overview
+
+        CourseCache._count(hit=False)
+        overview = loader()
+        cache.set(key, overview, getattr(settings, "COURSE_CACHE_TIMEOUT", DEFAULT_COURSE_CACHE_TIMEOUT))
+        return overview
+
+    @staticmethod
+    def invalidate(course_code: str, semester_name: str) -> None:
+        """
+        Post-conditions: The cached overview of the given course, if any, is removed
+        Side-effects: Deletes an entry from the cache
+        """
+        CourseCache._cache().delete(CourseCache._key(course_code, semester_name))
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """
+        Post-conditions: Every cached overview is unreachable and will be reloaded on next access
+        Side-effects: Moves the cache to a new generation of keys
+        """
+        COURSE_OVERVIEWS.invalidate_all()
+
+    @staticmethod
+    def stats() -> dict:
+        """
+        Returns: the number of cache hits and misses served by this process
+        """
+        with CourseCache._stats_lock:
+            return {"hits": CourseCache._hits, "misses": CourseCache._misses}
+
+    @staticmethod
+    def _count(hit: bool) -> None:
+        with CourseCache._stats_lock:
+            if hit:
+                CourseCache._hits += 1
+            else:
+                CourseCache._misses += 1
+
+    @staticmethod
+    def _cache():
+        return COURSE_OVERVIEWS.cache()
+
+    @staticmethod
+    def _key(course_code: str, semester_name: str) -> str:
+        # hash the names so any course code or semester name is a valid key for every backend
+        return COURSE_OVERVIEWS.key(hashlib.sha1(f"{course_code}\0{semester_name}".encode("utf-8")).hexdigest())
+
+
+COURSE_OVERVIEWS.invalidate_on_write(Semester, Course, CourseSection, LabSection, TALabAssignment, TACourseAssignment,
+                                      User)
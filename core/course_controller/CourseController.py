@@ -1,8 +1,15 @@
-from typing import List
+from typing import List, Tuple
 
-from core.local_data_classes import CourseFormData, CourseOverview, CourseRef, UserRef, CourseSectionRef, LabSectionRef
-from django.db import models
-from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, User
+from core.local_data_classes import CourseFormData, CourseOverview, CourseRef, UserRef, CourseSectionRef, LabSectionRef, \
+    SemesterCoursePage
+from core.course_controller.CourseCache import CourseCache
+from core.request_cache.RequestCache import RequestCache
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, Prefetch
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+# Courses per page of a semester group in the course search
+COURSE_SEARCH_PAGE_SIZE = 50
 
 
 class CourseController:
@@ -31,18 +38,6 @@ class CourseController:
         if not course_code and not Semester.objects.filter(semester_name=course_data.semester).exists():
             raise ValueError("Valid semester is required for creating a new course.")
 
-        # Check for duplicate course if creating a new course or modifying semester
-        if (
-            (
-                course_code is None
-                or (semester_name != course_data.semester)
-            ) and Course.objects.filter(
-                course_code=course_data.course_code,
-                semester__semester_name=course_data.semester
-            ).exists()
-        ):
-            raise ValueError("A course with the same code already exists in the selected semester.")
-
         # Handle course update
         if course_code:
             try:
@@ -58,39 +53,32 @@ class CourseController:
         except Semester.DoesNotExist:
             raise ValueError("Given semester does not exist")
 
-        ta_assignment_list = []
-        ta_assignment_remove_list = []
-        try:
-            for user in course_data.ta_username_list.split(","):
-                if user:
-                    ta = User.objects.get(username=user)
-                    if not TACourseAssignment.objects.filter(course=course, ta=ta).exists():
-                        ta_assignment = TACourseAssignment()
-                        ta_assignment.course = course
-                        ta_assignment.ta = User.objects.get(username=user)
-                        ta_assignment.grader_status = False
-                        ta_assignment_list.append(ta_assignment)
-            for a in TACourseAssignment.objects.filter(course=course):
-                found = False
-                for user in course_data.ta_username_list.split(","):
-                    if user:
-                        if a.ta.username == user:
-                            found = True
-                if not found:
-                    ta_assignment_remove_list.append(a)
-
-        except User.DoesNotExist:
+        ta_usernames = {username for username in course_data.ta_username_list.split(",") if username}
+        tas = list(User.objects.filter(username__in=ta_usernames)) if ta_usernames else []
+        if len(tas) != len(ta_usernames):
             raise ValueError("One of the users in the TA list does not exist")
 
-        course.course_name = course_data.course_name
-        course.semester = semester
-        course.save()
+        with transaction.atomic():
+            course.course_name = course_data.course_name
+            course.semester = semester
+            # Duplicate courses are rejected by the unique_course_code_per_semester constraint
+            try:
+                course.save()
+            except IntegrityError:
+                raise ValueError("A course with the same code already exists in the selected semester.")
 
-        for a in ta_assignment_list:
-            a.save()
+            # Diff the requested TAs against the current assignments instead of checking each user
+            assignments = TACourseAssignment.objects.filter(course=course)
+            assigned_usernames = set(assignments.values_list("ta__username", flat=True))
+            assignments.exclude(ta__username__in=ta_usernames).delete()
+            TACourseAssignment.objects.bulk_create([
+                TACourseAssignment(course=course, ta=ta, grader_status=False)
+                for ta in tas if ta.username not in assigned_usernames
+            ])
 
-        for a in ta_assignment_remove_list:
-            a.delete()
+        if course_code:
+            CourseController.invalidate_course(course_code, semester_name)
+        CourseController.invalidate_course(course.course_code, semester.semester_name)
 
     @staticmethod
     def get_course(course_code: str, semester_name: str) -> CourseOverview:
@@ -99,37 +87,99 @@ class CourseController:
             has the name the name semester_name
         Post-conditions: Returns an object containing course, sections, and assignment
             information for object in the Courses table with the given course_code and semester_name
-        Side-effects: N/A
+        Side-effects: The overview is cached for the rest of the request and in CourseCache
         """
+        return RequestCache.get_or_set(
+            CourseController._course_cache_key(course_code, semester_name),
+            lambda: CourseCache.get_or_load(
+                course_code, semester_name,
+                lambda: CourseController._load_course_overview(course_code, semester_name),
+            ),
+        )
+
+    @staticmethod
+    def _load_course_overview(course_code: str, semester_name: str) -> CourseOverview:
         try:
-            course = Course.objects.get(course_code=course_code, semester__semester_name=semester_name)
+            course = CourseController._course_overview_queryset().get(
+                course_code=course_code, semester__semester_name=semester_name
+            )
         except Course.DoesNotExist:
             raise ValueError("Course with the given code and semester name does not exist.")
 
-        course_sections = []
-        lab_sections = []
-        ta_list = []
+        return CourseController._build_course_overview(course)
+
+    @staticmethod
+    def _course_cache_key(course_code: str, semester_name: str):
+        return "course_overview", str(course_code), str(semester_name)
 
-        for ta_assignment in TACourseAssignment.objects.filter(course=course):
-            ta = UserRef(
+    @staticmethod
+    def invalidate_course(course_code: str, semester_name: str) -> None:
+        """
+        Pre-conditions: N/A
+        Post-conditions: Any cached CourseOverview for the given course is discarded, so the next
+            get_course call reloads it from the database
+        Side-effects: Removes entries from the course overview caches
+        """
+        RequestCache.delete(CourseController._course_cache_key(course_code, semester_name))
+        CourseCache.invalidate(course_code, semester_name)
+
+    @staticmethod
+    def is_instructor_of(course_code: str, semester_name: str, user: User) -> bool:
+        """
+        Pre-conditions: user is a saved User instance
+        Post-conditions: Returns True if user is the instructor of any section of the course with the
+            given code in the semester named semester_name, otherwise False
+        Side-effects: N/A
+        """
+        return CourseSection.objects.filter(
+            course__course_code=course_code,
+            course__semester__semester_name=semester_name,
+            instructor=user,
+        ).exists()
+
+    @staticmethod
+    def _course_overview_queryset():
+        """
+        Returns a Course queryset that loads everything a CourseOverview needs up front, so
+        building the overview costs a fixed number of queries no matter how many sections,
+        labs or TAs the course has.
+        """
+        return Course.objects.select_related("semester").prefetch_related(
+            Prefetch("tacourseassignment_set", queryset=TACourseAssignment.objects.select_related("ta")),
+            Prefetch("coursesection_set", queryset=CourseSection.objects.select_related("instructor")),
+            Prefetch("labsection_set", queryset=LabSection.objects.prefetch_related(
+                Prefetch("talabassignment_set", queryset=TALabAssignment.objects.select_related("ta").order_by("pk"))
+            )),
+        )
+
+    @staticmethod
+    def _build_course_overview(course: Course) -> CourseOverview:
+        """
+        Pre-conditions: course was loaded through _course_overview_queryset
+        Post-conditions: Returns the CourseOverview for the course using only the prefetched data
+        Side-effects: N/A
+        """
+        ta_list = [
+            UserRef(
                 name=f"{ta_assignment.ta.first_name} {ta_assignment.ta.last_name}",
                 username=ta_assignment.ta.username
             )
-            ta_list.append(ta)
+            for ta_assignment in course.tacourseassignment_set.all()
+        ]
 
-        # Retrieve course sections
-        for section in CourseSection.objects.filter(course=course):
-            section_instructor = UserRef(
-                name=f"{section.instructor.first_name} {section.instructor.last_name}",
-                username=section.instructor.username,
-            )
-            course_sections.append(CourseSectionRef(
+        course_sections = [
+            CourseSectionRef(
                 section_number=str(section.course_section_number),
-                instructor=section_instructor,
-            ))
+                instructor=UserRef(
+                    name=f"{section.instructor.first_name} {section.instructor.last_name}",
+                    username=section.instructor.username,
+                ),
+            )
+            for section in course.coursesection_set.all()
+        ]
 
-        # Retrieve lab sections
-        for lab in LabSection.objects.filter(course=course):
+        lab_sections = []
+        for lab in course.labsection_set.all():
             ta = lab.get_ta()
             ta_ref = UserRef(
                 name=f"{ta.first_name} {ta.last_name}",
@@ -173,6 +223,61 @@ class CourseController:
             for course in results
         ]
     
+    @staticmethod
+    def search_course_groups(course_search: str, semester_name: str | None = None, open_semester: str | None = None,
+                             page_size: int = COURSE_SEARCH_PAGE_SIZE) -> List[SemesterCoursePage]:
+        """
+        Pre-conditions: page_size is positive
+        Post-conditions: Returns every semester with a course whose title or code matches course_search (only
+            semester_name if given) with the number of matching courses, ordered by semester start date. Only
+            the group of open_semester, or of the latest semester if open_semester is None, holds its first page
+            of courses, the others hold none and are filled by search_courses_page when opened.
+        Side-effects: N/A
+        """
+        counts = (CourseController._matching_courses(course_search, semester_name)
+                  .values("semester__semester_name", "semester__start_date", "semester_id")
+                  .annotate(course_count=Count("id")).order_by("semester__start_date", "semester_id"))
+        groups = [SemesterCoursePage(semester=row["semester__semester_name"], course_count=row["course_count"],
+                                     courses=[], next_cursor=None, loaded=False)
+                  for row in counts]
+        if groups:
+            open_group = next((group for group in groups if group.semester == open_semester), groups[-1])
+            open_group.courses, open_group.next_cursor = CourseController.search_courses_page(
+                course_search, open_group.semester, page_size=page_size)
+            open_group.loaded = True
+        return groups
+
+    @staticmethod
+    def search_courses_page(course_search: str, semester_name: str, after: str | None = None,
+                            page_size: int = COURSE_SEARCH_PAGE_SIZE) -> Tuple[List[CourseRef], str | None]:
+        """
+        Pre-conditions: page_size is positive
+        Post-conditions: Returns up to page_size courses of the semester whose title or code matches
+            course_search, ordered by course code and starting after the code `after`, together with the cursor
+            to pass as `after` for the next page, or None if there are no more courses
+        Side-effects: N/A
+        """
+        courses = (CourseController._matching_courses(course_search, semester_name)
+                   .order_by("course_code").only("course_code", "course_name"))
+        if after:
+            courses = courses.filter(course_code__gt=after)
+        # fetch one extra course to tell whether there is a next page
+        page = [CourseRef(course_code=course.course_code, course_name=course.course_name)
+                for course in courses[:page_size + 1]]
+        if len(page) > page_size:
+            return page[:page_size], page[page_size - 1].course_code
+        return page, None
+
+    @staticmethod
+    def _matching_courses(course_search: str, semester_name: str | None):
+        courses = Course.objects.all()
+        if semester_name:
+            courses = courses.filter(semester__semester_name=semester_name)
+        if course_search:
+            courses = courses.filter(models.Q(course_name__icontains=course_search) |
+                                     models.Q(course_code__icontains=course_search))
+        return courses
+
     @staticmethod
     def delete_course(course_code: str, semester_name: str) -> None:
         """
@@ -185,6 +290,7 @@ class CourseController:
             course.delete()
         except Course.DoesNotExist:
             raise ValueError("Course with the given code does not exist.")
+        CourseController.invalidate_course(course_code, semester_name)
 
     @staticmethod
     def get_assigned_tas(course_code: str, semester_name: str) -> List[UserRef]:
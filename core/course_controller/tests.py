@@ -1,8 +1,13 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from datetime import date
-from ta_scheduler.models import Course, CourseSection, LabSection, User, Semester, TACourseAssignment
+from ta_scheduler.models import Course, CourseSection, LabSection, User, Semester, TACourseAssignment, TALabAssignment
 from core.local_data_classes import CourseFormData, CourseOverview
+from core.course_controller.CourseCache import CourseCache
 from core.course_controller.CourseController import CourseController
+from core.section_controller.SectionController import SectionController
 
 
 class CourseControllerTestBase(TestCase):
@@ -61,7 +66,8 @@ class TestSaveCourse(CourseControllerTestBase):
         self.assertTrue(Course.objects.filter(course_code="NewCourse").exists())
         course = Course.objects.get(course_code="NewCourse")
         self.assertTrue(TACourseAssignment.objects.filter(course=course).exists())
-        self.assertEqual(len(TACourseAssignment.objects.filter(course=course)), 2)
+        # Repeated usernames in the list only produce a single assignment
+        self.assertEqual(len(TACourseAssignment.objects.filter(course=course)), 1)
 
     def test_duplicate_course_code_same_semester_fails(self):
         course_data = CourseFormData(course_code="Test1", course_name="Duplicate Course", semester=self.semester, ta_username_list="")
@@ -125,6 +131,42 @@ class TestSaveCourse(CourseControllerTestBase):
             CourseController.save_course(course_data, course.course_code, course.semester.semester_name)
         self.assertTrue(Course.objects.filter(course_code=course.course_code, semester=course.semester).exists())
 
+    def test_save_course_syncs_ta_assignments(self):
+        course = Course.objects.get(course_code="Test1")
+        ta_list = list(User.objects.filter(role="TA").order_by("username"))
+        course_data = CourseFormData(course_code="Test1", course_name="Soft Eng", semester=self.semester.semester_name,
+                                     ta_username_list=f"{ta_list[1].username},{ta_list[2].username}")
+        CourseController.save_course(course_data, "Test1", self.semester.semester_name)
+        self.assertEqual(
+            set(TACourseAssignment.objects.filter(course=course).values_list("ta__username", flat=True)),
+            {ta_list[1].username, ta_list[2].username}
+        )
+
+    def test_save_course_unknown_ta_fails_without_changes(self):
+        course = Course.objects.get(course_code="Test1")
+        course_data = CourseFormData(course_code="Test1", course_name="Renamed", semester=self.semester.semester_name,
+                                     ta_username_list="not_a_user")
+        with self.assertRaises(ValueError):
+            CourseController.save_course(course_data, "Test1", self.semester.semester_name)
+        self.assertEqual(Course.objects.get(id=course.id).course_name, "Soft Eng")
+        self.assertEqual(TACourseAssignment.objects.filter(course=course).count(), 1)
+
+    def test_save_course_ta_query_count_constant(self):
+        def save_with_tas(prefix, count):
+            tas = [User.objects.create(username=f"{prefix}_{i}", role="TA") for i in range(count)]
+            course_data = CourseFormData(course_code="Test1", course_name="Soft Eng",
+                                         semester=self.semester.semester_name,
+                                         ta_username_list=",".join(ta.username for ta in tas))
+            with CaptureQueriesContext(connection) as queries:
+                CourseController.save_course(course_data, "Test1", self.semester.semester_name)
+            self.assertEqual(TACourseAssignment.objects.filter(course__course_code="Test1").count(), count)
+            return len(queries)
+
+        # each save replaces every assignment of the previous one. The course cache's post_delete receiver makes
+        # the removal a SELECT followed by a DELETE
+        self.assertEqual(save_with_tas("few_ta", 5), 10)
+        self.assertEqual(save_with_tas("many_ta", 60), 10)
+
 
 # Testing get courses
 class TestGetCourse(CourseControllerTestBase):
@@ -164,6 +206,76 @@ class TestGetCourse(CourseControllerTestBase):
         with self.assertRaises(ValueError):
             CourseController.get_course("FAKE CODE", course.semester.semester_name)
 
+    def test_get_course_query_count_constant(self):
+        course = Course.objects.first()
+        semester_name = course.semester.semester_name
+        with self.assertNumQueries(5):
+            CourseController.get_course(course.course_code, semester_name)
+
+        for i in range(2, 42):
+            instructor = User.objects.create_user(username=f"inst_{i}", password="password", role="Instructor")
+            ta = User.objects.create_user(username=f"ta_{i}", password="password", role="TA")
+            CourseSection.objects.create(
+                course=course, course_section_number=i, instructor=instructor, start_time="09:00", end_time="10:30"
+            )
+            lab = LabSection.objects.create(course=course, lab_section_number=i, start_time="13:00", end_time="15:00")
+            TALabAssignment.objects.create(lab_section=lab, ta=ta)
+            TACourseAssignment.objects.create(course=course, grader_status=False, ta=ta)
+
+        with self.assertNumQueries(5):
+            result = CourseController.get_course(course.course_code, semester_name)
+        self.assertEqual(len(result.lab_sections), 41)
+        self.assertEqual(result.lab_sections[-1].instructor.username, "ta_41")
+
+
+class TestCourseCache(CourseControllerTestBase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_second_get_served_from_cache(self):
+        CourseController.get_course("Test1", "Fall 2024")
+        stats = CourseCache.stats()
+        with self.assertNumQueries(0):
+            CourseController.get_course("Test1", "Fall 2024")
+        self.assertEqual(CourseCache.stats()["hits"], stats["hits"] + 1)
+
+    def test_invalidated_by_section_write(self):
+        CourseController.get_course("Test1", "Fall 2024")
+        SectionController.delete_lab_section("Test1", "Fall 2024", 1)
+        self.assertEqual(len(CourseController.get_course("Test1", "Fall 2024").lab_sections), 0)
+
+    def test_invalidated_by_save_course(self):
+        CourseController.get_course("Test1", "Fall 2024")
+        course_data = CourseFormData(course_code="Test1", course_name="Renamed", semester="Fall 2024", ta_username_list="")
+        CourseController.save_course(course_data, "Test1", "Fall 2024")
+        overview = CourseController.get_course("Test1", "Fall 2024")
+        self.assertEqual(overview.name, "Renamed")
+        self.assertEqual(overview.ta_list, [])
+
+    def test_invalidated_by_other_writes(self):
+        CourseController.get_course("Test1", "Fall 2024")
+        instructor = User.objects.get(username="user_0")
+        instructor.first_name = "Changed"
+        instructor.save()
+        overview = CourseController.get_course("Test1", "Fall 2024")
+        self.assertEqual(overview.course_sections[0].instructor.name, "Changed Last_0")
+
+
+class TestIsInstructorOf(CourseControllerTestBase):
+    def test_section_instructor(self):
+        instructor = User.objects.get(username="user_0")
+        with self.assertNumQueries(1):
+            self.assertTrue(CourseController.is_instructor_of("Test1", "Fall 2024", instructor))
+
+    def test_instructor_of_other_course(self):
+        instructor = User.objects.get(username="user_0")
+        self.assertFalse(CourseController.is_instructor_of("Test2", "Fall 2024", instructor))
+
+    def test_missing_course(self):
+        instructor = User.objects.get(username="user_0")
+        self.assertFalse(CourseController.is_instructor_of("Test1", "Spring 2030", instructor))
+
 
 # Testing search courses
 class TestSearchCourses(CourseControllerTestBase):
@@ -192,6 +304,46 @@ class TestSearchCourses(CourseControllerTestBase):
         self.assertTrue(any(course.course_name.lower() == "soft eng" for course in result))
 
 
+class TestSearchCourseGroups(CourseControllerTestBase):
+    def setUp(self):
+        super().setUp()
+        self.spring = Semester.objects.create(
+            semester_name="Spring 2025", start_date=date(2025, 1, 1), end_date=date(2025, 5, 15)
+        )
+        Course.objects.bulk_create([
+            Course(course_code=f"SP{i:03}", course_name="Spring Course", semester=self.spring) for i in range(7)
+        ])
+
+    def test_groups_counted_and_latest_opened(self):
+        groups = CourseController.search_course_groups("", page_size=5)
+        self.assertEqual([(group.semester, group.course_count, group.loaded) for group in groups],
+                         [("Fall 2024", 3, False), ("Spring 2025", 7, True)])
+        self.assertEqual(groups[0].courses, [])
+        self.assertEqual([course.course_code for course in groups[1].courses], [f"SP{i:03}" for i in range(5)])
+        self.assertEqual(groups[1].next_cursor, "SP004")
+
+    def test_open_semester_and_query(self):
+        groups = CourseController.search_course_groups("Soft", open_semester="Fall 2024")
+        self.assertEqual([(group.semester, group.course_count) for group in groups], [("Fall 2024", 2)])
+        self.assertTrue(groups[0].loaded)
+        self.assertIsNone(groups[0].next_cursor)
+
+    def test_two_queries_regardless_of_size(self):
+        with self.assertNumQueries(2):
+            CourseController.search_course_groups("")
+
+    def test_pages_follow_cursor(self):
+        codes, cursor = [], None
+        while True:
+            page, cursor = CourseController.search_courses_page("", "Spring 2025", cursor, page_size=3)
+            codes += [course.course_code for course in page]
+            if cursor is None:
+                break
+        self.assertEqual(codes, [f"SP{i:03}" for i in range(7)])
+
+    def test_unknown_semester_has_no_courses(self):
+        self.assertEqual(CourseController.search_courses_page("", "Winter 1900"), ([], None))
+
 # Testing course deletion
 class TestDeleteCourse(CourseControllerTestBase):
     def test_delete_valid_course(self):
@@ -0,0 +1,114 @@
+import csv
+import json
+from typing import Iterator
+
+from django.db.models import Prefetch
+
+from core.import_controller.ImportController import IMPORT_FORMATS
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment
+
+# Columns of an export, the same ones ImportController.import_rows reads so an export can be imported again
+EXPORT_COLUMNS = ("type", "semester", "start_date", "end_date", "course_code", "course_name", "section_number",
+                  "instructor", "ta", "grader_status", "days", "start_time", "end_time")
+# Courses fetched (with their sections and assignments) per round of queries while streaming
+EXPORT_CHUNK_SIZE = 500
+
+
+class ExportController:
+    @staticmethod
+    def export_rows(semester_name: str) -> Iterator[dict]:
+        """
+        Pre-conditions: A semester with the given name exists, otherwise a ValueError is raised before any row is returned
+        Post-conditions: Returns an iterator over the semester's rows in the format read by ImportController.import_rows:
+            the semester, then each course followed by its course sections, lab sections, TA course assignments
+            and TA lab assignments. Courses are read EXPORT_CHUNK_SIZE at a time, so memory use does not grow
+            with the size of the semester.
+        Side-effects: None
+        """
+        try:
+            semester = Semester.objects.get(semester_name=semester_name)
+        except Semester.DoesNotExist:
+            raise ValueError(f"Semester '{semester_name}' does not exist.")
+        return ExportController._rows(semester)
+
+    @staticmethod
+    def stream_export(semester_name: str, file_format: str) -> Iterator[str]:
+        """
+        Pre-conditions: file_format is one of IMPORT_FORMATS and the semester exists, otherwise a ValueError is
+            raised before any output is returned
+        Post-conditions: Returns an iterator over pieces of text that together form the csv file (with a header row)
+            or json list of the semester's rows
+        Side-effects: None
+        """
+        if file_format not in IMPORT_FORMATS:
+            raise ValueError(f"Unsupported export format '{file_format}'. Must be one of: {', '.join(IMPORT_FORMATS)}.")
+        rows = ExportController.export_rows(semester_name)
+        if file_format == "csv":
+            return ExportController._stream_csv(rows)
+        return ExportController._stream_json(rows)
+
+    @staticmethod
+    def _rows(semester: Semester) -> Iterator[dict]:
+        yield {"type": "semester", "semester": semester.semester_name,
+               "start_date": semester.start_date.isoformat(), "end_date": semester.end_date.isoformat()}
+        courses = (
+            Course.objects.filter(semester=semester)
+            .order_by("course_code")
+            .prefetch_related(
+                Prefetch("coursesection_set",
+                         queryset=CourseSection.objects.select_related("instructor").order_by("course_section_number")),
+                Prefetch("labsection_set", queryset=LabSection.objects.order_by("lab_section_number")),
+                Prefetch("labsection_set__talabassignment_set",
+                         queryset=TALabAssignment.objects.select_related("ta").order_by("pk")),
+                Prefetch("tacourseassignment_set",
+                         queryset=TACourseAssignment.objects.select_related("ta").order_by("ta__username")),
+            )
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        for course in courses:
+            course_key = {"semester": semester.semester_name, "course_code": course.course_code}
+            yield {"type": "course", **course_key, "course_name": course.course_name}
+            for section in course.coursesection_set.all():
+                yield {"type": "course_section", **course_key, "section_number": section.course_section_number,
+                       "instructor": section.instructor.username, "days": section.days,
+                       **_times(section)}
+            for section in course.labsection_set.all():
+                yield {"type": "lab_section", **course_key, "section_number": section.lab_section_number,
+                       "days": section.days, **_times(section)}
+            for assignment in course.tacourseassignment_set.all():
+                yield {"type": "ta_course_assignment", **course_key, "ta": assignment.ta.username,
+                       "grader_status": assignment.grader_status}
+            for section in course.labsection_set.all():
+                ta = section.get_ta()
+                if ta is not None:
+                    yield {"type": "ta_lab_assignment", **course_key, "section_number": section.lab_section_number,
+                           "ta": ta.username}
+
+    @staticmethod
+    def _stream_csv(rows: Iterator[dict]) -> Iterator[str]:
+        writer = csv.DictWriter(_Echo(), fieldnames=EXPORT_COLUMNS, restval="")
+        yield writer.writeheader()
+        for row in rows:
+            yield writer.writerow(row)
+
+    @staticmethod
+    def _stream_json(rows: Iterator[dict]) -> Iterator[str]:
+        separator = "[\n"
+        for row in rows:
+            yield separator + json.dumps(row)
+            separator = ",\n"
+        # an empty list if there were no rows, otherwise close the list
+        yield "[]\n" if separator == "[\n" else "\n]\n"
+
+
+class _Echo:
+    """
+    A file-like object whose write returns what was written, so csv.writer produces strings to stream
+    instead of buffering them.
+    """
+    def write(self, value):
+        return value
+
+
+def _times(section) -> dict:
+    return {"start_time": section.start_time.strftime("%H:%M"), "end_time": section.end_time.strftime("%H:%M")}
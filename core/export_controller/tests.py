@@ -0,0 +1,75 @@
+import io
+import json
+from datetime import date, time
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.export_controller.ExportController import EXPORT_CHUNK_SIZE, ExportController
+from core.import_controller.ImportController import ImportController
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+
+class ExportControllerTestBase(TestCase):
+    def setUp(self):
+        self.semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1), end_date=date(2025, 12, 15))
+        self.instructor = User.objects.create(username="instructor", role="Instructor")
+        self.ta = User.objects.create(username="ta", role="TA")
+        course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=self.semester)
+        CourseSection.objects.create(course=course, course_section_number=1, instructor=self.instructor, days="MW",
+                                     start_time=time(9, 0), end_time=time(10, 15))
+        lab = LabSection.objects.create(course=course, lab_section_number=801, days="F",
+                                        start_time=time(11, 0), end_time=time(12, 50))
+        TACourseAssignment.objects.create(course=course, ta=self.ta, grader_status=True)
+        TALabAssignment.objects.create(lab_section=lab, ta=self.ta)
+        Course.objects.create(course_code="CS337", course_name="Systems", semester=self.semester)
+
+
+class TestExportRows(ExportControllerTestBase):
+    def test_rows_in_import_format(self):
+        rows = list(ExportController.export_rows("Fall 2025"))
+        self.assertEqual([row["type"] for row in rows], [
+            "semester", "course", "course", "course_section", "lab_section", "ta_course_assignment", "ta_lab_assignment",
+        ])
+        self.assertEqual(rows[1], {"type": "course", "semester": "Fall 2025", "course_code": "CS337", "course_name": "Systems"})
+        self.assertEqual(rows[3]["instructor"], "instructor")
+        self.assertEqual((rows[4]["start_time"], rows[4]["end_time"]), ("11:00", "12:50"))
+
+    def test_unknown_semester_raises_before_streaming(self):
+        with self.assertRaises(ValueError):
+            ExportController.export_rows("Spring 1900")
+        with self.assertRaises(ValueError):
+            ExportController.stream_export("Fall 2025", "xml")
+
+    def test_csv_export_imports_back(self):
+        exported = "".join(ExportController.stream_export("Fall 2025", "csv"))
+        self.semester.delete()
+        result = ImportController.import_rows(ImportController.read_rows(io.StringIO(exported), "csv"))
+        self.assertEqual(result.errors, [])
+        self.assertEqual(Course.objects.count(), 2)
+        self.assertEqual(LabSection.objects.get().get_ta(), self.ta)
+        self.assertTrue(TACourseAssignment.objects.get().grader_status)
+
+    def test_json_export(self):
+        rows = json.loads("".join(ExportController.stream_export("Fall 2025", "json")))
+        self.assertEqual(len(rows), 7)
+        empty = Semester.objects.create(semester_name="Empty", start_date=date(2026, 1, 1), end_date=date(2026, 5, 1))
+        self.assertEqual(len(json.loads("".join(ExportController.stream_export(empty.semester_name, "json")))), 1)
+
+    def test_queries_per_chunk_of_courses(self):
+        Course.objects.bulk_create([
+            Course(course_code=f"BULK{i}", course_name="Bulk", semester=self.semester) for i in range(EXPORT_CHUNK_SIZE * 2)
+        ])
+        # the semester and one cursor over the courses, then for each of the 3 chunks of courses at most one query
+        # for each of course sections, lab sections, lab assignments and course assignments
+        with CaptureQueriesContext(connection) as queries:
+            for _ in ExportController.export_rows("Fall 2025"):
+                pass
+        self.assertLessEqual(len(queries), 2 + 3 * 4)
+
+    def test_export_command(self):
+        out = io.StringIO()
+        call_command("export_schedule", "Fall 2025", "--format", "json", stdout=out)
+        self.assertEqual(json.loads(out.getvalue())[0]["type"], "semester")
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+
+
+class GenerationCache:
+    """
+    A generation counter kept in one of Django's caches. Keys made by key() include the current generation, so
+    invalidate_all() makes every entry stored under them unreachable at once, without knowing which entries
+    exist; they expire from the backend on their own.
+
+    The cache used is the alias named by the setting alias_setting, read on every access, or "default".
+    """
+    def __init__(self, prefix: str, alias_setting: str | None = None):
+        self.prefix = prefix
+        self.alias_setting = alias_setting
+        self._generation_key = f"{prefix}:generation"
+
+    def cache(self):
+        alias = getattr(settings, self.alias_setting, "default") if self.alias_setting else "default"
+        return caches[alias]
+
+    def key(self, name: str) -> str:
+        """
+        Post-conditions: Returns the key to store the entry called name under in the current generation
+        Side-effects: Starts the counter at 0 if it isn't in the cache
+        """
+        return f"{self.prefix}:{self.generation()}:{name}"
+
+    def generation(self) -> int:
+        return self.cache().get_or_set(self._generation_key, 0, None)
+
+    def invalidate_all(self) -> None:
+        """
+        Post-conditions: Every entry stored under a key from key() is unreachable
+        Side-effects: Moves the cache to a new generation of keys
+        """
+        cache = self.cache()
+        try:
+            cache.incr(self._generation_key)
+        except ValueError:
+            # incr fails when the generation key expired or was never set
+            cache.set(self._generation_key, 1, None)
+
+    def invalidate_on_write(self, *models) -> None:
+        """
+        Post-conditions: Saving or deleting an instance of any of the models calls invalidate_all, except saves
+            that only update last_login, which is what logging in writes and nothing cached shows
+        Side-effects: Connects post_save and post_delete receivers
+        """
+        def invalidate(sender, update_fields=None, **kwargs):
+            if update_fields is not None and set(update_fields) <= {"last_login"}:
+                return
+            self.invalidate_all()
+
+        for model in models:
+            for signal in (post_save, post_delete):
+                signal.connect(invalidate, sender=model, weak=False,
+                               dispatch_uid=f"{self.prefix}:invalidate:{model.__name__}")
+
+
+# The caches of data derived from the schedule, each invalidated by its own module's receivers
+COURSE_OVERVIEWS = GenerationCache("course_overview", "COURSE_CACHE_ALIAS")
+CALENDAR_FEEDS = GenerationCache("calendar_feed")
+WORKLOADS = GenerationCache("workload")
+SCHEDULE_CACHES = (COURSE_OVERVIEWS, CALENDAR_FEEDS, WORKLOADS)
+
+
+def invalidate_schedule_caches() -> None:
+    """
+    Invalidates every cache in SCHEDULE_CACHES. Called after bulk writes, which don't send the model signals that
+    normally invalidate them.
+    """
+    for generation_cache in SCHEDULE_CACHES:
+        generation_cache.invalidate_all()
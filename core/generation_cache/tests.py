@@ -0,0 +1,49 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.generation_cache.GenerationCache import SCHEDULE_CACHES, GenerationCache, invalidate_schedule_caches
+from ta_scheduler.models import Semester, User
+
+GENERATIONS = GenerationCache("generation_cache_test")
+GENERATIONS.invalidate_on_write(Semester, User)
+
+
+class TestGenerationCache(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_invalidate_all_moves_keys(self):
+        key = GENERATIONS.key("entry")
+        cache.set(key, "value")
+        self.assertEqual(cache.get(GENERATIONS.key("entry")), "value")
+        GENERATIONS.invalidate_all()
+        self.assertNotEqual(GENERATIONS.key("entry"), key)
+        self.assertIsNone(cache.get(GENERATIONS.key("entry")))
+
+    def test_lost_generation_restarts(self):
+        GENERATIONS.invalidate_all()
+        cache.clear()
+        GENERATIONS.invalidate_all()
+        self.assertEqual(GENERATIONS.generation(), 1)
+
+    def test_writes_invalidate(self):
+        start = GENERATIONS.generation()
+        user = User.objects.create(username="ta", role="TA")
+        self.assertEqual(GENERATIONS.generation(), start + 1)
+        user.delete()
+        self.assertEqual(GENERATIONS.generation(), start + 2)
+
+    def test_login_does_not_invalidate(self):
+        user = User.objects.create_user(username="ta", password="tapass", role="TA")
+        start = GENERATIONS.generation()
+        self.assertTrue(self.client.login(username="ta", password="tapass"))
+        self.assertEqual(GENERATIONS.generation(), start)
+        user.first_name = "T"
+        user.save(update_fields=["first_name", "last_login"])
+        self.assertEqual(GENERATIONS.generation(), start + 1)
+
+    def test_invalidate_schedule_caches(self):
+        before = [generation_cache.generation() for generation_cache in SCHEDULE_CACHES]
+        invalidate_schedule_caches()
+        self.assertEqual([generation_cache.generation() for generation_cache in SCHEDULE_CACHES],
+                         [generation + 1 for generation in before])
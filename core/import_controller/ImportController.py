@@ -0,0 +1,428 @@
+import csv
+import json
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.db import IntegrityError, transaction
+
+from core.generation_cache.GenerationCache import invalidate_schedule_caches
+from core.local_data_classes import ImportResult, ImportRowError
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+# Row types in the order they are written within a batch, so a row can refer to a record created
+# by an earlier row of the same batch
+ROW_TYPES = ("semester", "course", "course_section", "lab_section", "ta_course_assignment", "ta_lab_assignment")
+IMPORT_FORMATS = ("csv", "json")
+DEFAULT_IMPORT_BATCH_SIZE = 2000
+# Rows per INSERT/UPDATE statement, kept below SQLite's limit on query parameters
+WRITE_CHUNK_SIZE = 500
+
+# Characters read from a json stream at a time
+JSON_READ_SIZE = 64 * 1024
+
+_TRUE_VALUES = {"true", "1", "yes", "y"}
+_FALSE_VALUES = {"false", "0", "no", "n", ""}
+
+
+class ImportController:
+    @staticmethod
+    def read_rows(stream, file_format: str) -> Iterator[dict]:
+        """
+        Pre-conditions: stream is a text stream. A csv stream has a header row naming the columns, a json
+            stream holds a list of objects.
+        Post-conditions: Yields each row of the stream as a dict of column name to value. Rows are read lazily,
+            csv one line at a time and json one list item at a time, so only the current row is held in memory.
+            Raises a ValueError when the stream is malformed, once the bad line or item is reached.
+        Side-effects: Reads from stream
+        """
+        if file_format == "csv":
+            reader = csv.DictReader(stream)
+            try:
+                yield from reader
+            except csv.Error as e:
+                raise ValueError(f"Malformed csv after line {reader.line_num}: {e}")
+        elif file_format == "json":
+            yield from _json_list_items(stream)
+        else:
+            raise ValueError(f"Unsupported import format '{file_format}'. Must be one of: {', '.join(IMPORT_FORMATS)}.")
+
+    @staticmethod
+    def import_rows(rows: Iterable[dict], batch_size: int = DEFAULT_IMPORT_BATCH_SIZE) -> ImportResult:
+        """
+        Pre-conditions: Each row is a dict with a "type" key naming one of ROW_TYPES and the columns that type uses:
+            semester: semester, start_date, end_date (YYYY-MM-DD)
+            course: semester, course_code, course_name
+            course_section: semester, course_code, section_number, instructor, start_time, end_time (HH:MM), days
+            lab_section: semester, course_code, section_number, start_time, end_time (HH:MM), days
+            ta_course_assignment: semester, course_code, ta, grader_status
+            ta_lab_assignment: semester, course_code, section_number, ta
+            A row may only refer to records that exist or are created by an earlier row.
+        Post-conditions: Creates records that don't exist yet and updates the ones that do, keyed the same way as the
+            forms (semester name, course code within a semester, section number within a course, one TA per lab).
+            Rows are numbered from 1; invalid rows are skipped and reported in the result's errors.
+        Side-effects: Writes to the database in one transaction per batch of rows, clears the course, calendar and
+            workload caches
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        result = ImportResult(created=dict.fromkeys(ROW_TYPES, 0), updated=dict.fromkeys(ROW_TYPES, 0), errors=[])
+        state = _ImportState()
+        numbered_rows = enumerate(rows, start=1)
+        try:
+            while batch := list(islice(numbered_rows, batch_size)):
+                state.import_batch(batch, result)
+        finally:
+            invalidate_schedule_caches()
+        return result
+
+
+class _RowError(Exception):
+    pass
+
+
+class _ImportState:
+    """
+    Maps from natural keys to records, filled with one query per batch for the keys it mentions and kept
+    up to date as records are created so later rows and batches resolve foreign keys without querying.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.semesters: Dict[str, Semester] | None = None
+        self.courses: Dict[Tuple[int, str], Course] = {}
+        self.users: Dict[str, User | None] = {}
+        self.loaded_course_ids = set()
+        self.course_sections: Dict[Tuple[int, int], CourseSection] = {}
+        self.lab_sections: Dict[Tuple[int, int], LabSection] = {}
+        self.course_assignments: Dict[Tuple[int, int], TACourseAssignment] = {}
+        self.lab_assignments: Dict[int, TALabAssignment] = {}
+
+    def import_batch(self, batch: List[Tuple[int, dict]], result: ImportResult) -> None:
+        rows_by_type = defaultdict(list)
+        errors = []
+        for number, row in batch:
+            if not isinstance(row, dict):
+                errors.append(ImportRowError(number, "Row must be an object of column names to values."))
+                continue
+            # json values may be numbers or booleans, compare everything as text like csv does
+            row = {key.strip(): (str(value).strip() if value is not None else None)
+                   for key, value in row.items() if isinstance(key, str)}
+            if row.get("type") not in ROW_TYPES:
+                errors.append(ImportRowError(number, f"Unknown row type '{row.get('type')}'."))
+                continue
+            rows_by_type[row["type"]].append((number, row))
+
+        created = dict.fromkeys(ROW_TYPES, 0)
+        updated = dict.fromkeys(ROW_TYPES, 0)
+        try:
+            with transaction.atomic():
+                self._load_semesters()
+                self._load_users(rows_by_type)
+                for row_type in ROW_TYPES:
+                    # loaded once the records they hang off of are written, so rows can refer to those
+                    if row_type == "course":
+                        self._load_courses(rows_by_type)
+                    elif row_type == "course_section":
+                        self._load_course_children()
+                    handler = getattr(self, f"_import_{row_type}")
+                    to_create, to_update = {}, {}
+                    for number, row in rows_by_type[row_type]:
+                        try:
+                            handler(row, to_create, to_update)
+                        except _RowError as e:
+                            errors.append(ImportRowError(number, str(e)))
+                    self._write(row_type, to_create, to_update)
+                    created[row_type] += len(to_create)
+                    updated[row_type] += len(to_update)
+        except IntegrityError as e:
+            # the batch was rolled back, so records cached in the maps may not exist anymore
+            self.reset()
+            first, last = batch[0][0], batch[-1][0]
+            errors.append(ImportRowError(first, f"Rows {first}-{last} were not imported: {e}"))
+        else:
+            for row_type in ROW_TYPES:
+                result.created[row_type] += created[row_type]
+                result.updated[row_type] += updated[row_type]
+        result.errors.extend(sorted(errors, key=lambda error: error.row))
+
+    # Loading
+
+    def _load_semesters(self):
+        # semesters are few, so all of them are loaded once
+        if self.semesters is None:
+            self.semesters = {semester.semester_name: semester for semester in Semester.objects.all()}
+
+    def _load_users(self, rows_by_type):
+        usernames = {row.get(column) for rows in rows_by_type.values() for _, row in rows
+                     for column in ("instructor", "ta") if row.get(column)}
+        missing = usernames - self.users.keys()
+        if not missing:
+            return
+        self.users.update(dict.fromkeys(missing))
+        for user in User.objects.filter(username__in=missing).only("id", "username", "role"):
+            self.users[user.username] = user
+
+    def _load_courses(self, rows_by_type):
+        keys = set()
+        for rows in rows_by_type.values():
+            for _, row in rows:
+                semester = self.semesters.get(row.get("semester"))
+                if semester and row.get("course_code"):
+                    keys.add((semester.id, row["course_code"]))
+        missing = keys - self.courses.keys()
+        if not missing:
+            return
+        courses = Course.objects.filter(semester_id__in={semester_id for semester_id, _ in missing},
+                                        course_code__in={code for _, code in missing})
+        for course in courses:
+            self.courses[(course.semester_id, course.course_code)] = course
+
+    def _load_course_children(self):
+        course_ids = {course.id for course in self.courses.values()} - self.loaded_course_ids
+        if not course_ids:
+            return
+        for section in CourseSection.objects.filter(course_id__in=course_ids):
+            self.course_sections[(section.course_id, section.course_section_number)] = section
+        for section in LabSection.objects.filter(course_id__in=course_ids):
+            self.lab_sections[(section.course_id, section.lab_section_number)] = section
+        for assignment in TACourseAssignment.objects.filter(course_id__in=course_ids):
+            self.course_assignments[(assignment.course_id, assignment.ta_id)] = assignment
+        for assignment in TALabAssignment.objects.filter(lab_section__course_id__in=course_ids):
+            self.lab_assignments[assignment.lab_section_id] = assignment
+        self.loaded_course_ids |= course_ids
+
+    # Writing
+
+    def _write(self, row_type, to_create, to_update):
+        model, update_fields = _WRITE_TARGETS[row_type]
+        if to_create:
+            model.objects.bulk_create(list(to_create.values()), batch_size=WRITE_CHUNK_SIZE)
+            for key, record in to_create.items():
+                self._remember(row_type, key, record)
+        if to_update:
+            model.objects.bulk_update(list(to_update.values()), update_fields, batch_size=WRITE_CHUNK_SIZE)
+        if row_type == "course":
+            # new courses have no sections or assignments to load
+            self.loaded_course_ids |= {course.id for course in to_create.values()}
+
+    def _remember(self, row_type, key, record):
+        maps = {
+            "semester": self.semesters,
+            "course": self.courses,
+            "course_section": self.course_sections,
+            "lab_section": self.lab_sections,
+            "ta_course_assignment": self.course_assignments,
+            "ta_lab_assignment": self.lab_assignments,
+        }
+        maps[row_type][key] = record
+
+    @staticmethod
+    def _stage(key, existing, to_create, to_update, factory):
+        """
+        Returns the record a row should write to: the one already staged for its key in this batch, the
+        existing record (staged for update) or a new record (staged for creation).
+        """
+        if key in to_create:
+            return to_create[key]
+        if existing is not None:
+            return to_update.setdefault(key, existing)
+        record = factory()
+        to_create[key] = record
+        return record
+
+    # Row handlers, each validates a row and stages its record for writing
+
+    def _import_semester(self, row, to_create, to_update):
+        name = _required(row, "semester")
+        start_date = _parse_date(_required(row, "start_date"), "start_date")
+        end_date = _parse_date(_required(row, "end_date"), "end_date")
+        if start_date > end_date:
+            raise _RowError("start_date cannot be after end_date")
+        semester = self._stage(name, self.semesters.get(name), to_create, to_update,
+                               lambda: Semester(semester_name=name))
+        semester.start_date = start_date
+        semester.end_date = end_date
+
+    def _import_course(self, row, to_create, to_update):
+        semester = self._semester(row)
+        code = _required(row, "course_code")
+        name = _required(row, "course_name")
+        key = (semester.id, code)
+        course = self._stage(key, self.courses.get(key), to_create, to_update,
+                             lambda: Course(course_code=code, semester=semester))
+        course.course_name = name
+
+    def _import_course_section(self, row, to_create, to_update):
+        course = self._course(row)
+        number = _parse_section_number(row)
+        instructor = self._user(row, "instructor", "Instructor")
+        start_time, end_time = _parse_time(row, "start_time"), _parse_time(row, "end_time")
+        key = (course.id, number)
+        section = self._stage(key, self.course_sections.get(key), to_create, to_update,
+                              lambda: CourseSection(course=course, course_section_number=number))
+        section.instructor = instructor
+        section.days = row.get("days") or None
+        section.start_time = start_time
+        section.end_time = end_time
+
+    def _import_lab_section(self, row, to_create, to_update):
+        course = self._course(row)
+        number = _parse_section_number(row)
+        start_time, end_time = _parse_time(row, "start_time"), _parse_time(row, "end_time")
+        key = (course.id, number)
+        section = self._stage(key, self.lab_sections.get(key), to_create, to_update,
+                              lambda: LabSection(course=course, lab_section_number=number))
+        section.days = row.get("days") or None
+        section.start_time = start_time
+        section.end_time = end_time
+
+    def _import_ta_course_assignment(self, row, to_create, to_update):
+        course = self._course(row)
+        ta = self._user(row, "ta", "TA")
+        grader_status = str(row.get("grader_status") or "").lower()
+        if grader_status not in _TRUE_VALUES | _FALSE_VALUES:
+            raise _RowError(f"Invalid grader_status '{row.get('grader_status')}'.")
+        key = (course.id, ta.id)
+        assignment = self._stage(key, self.course_assignments.get(key), to_create, to_update,
+                                 lambda: TACourseAssignment(course=course, ta=ta))
+        assignment.grader_status = grader_status in _TRUE_VALUES
+
+    def _import_ta_lab_assignment(self, row, to_create, to_update):
+        course = self._course(row)
+        number = _parse_section_number(row)
+        lab_section = self.lab_sections.get((course.id, number))
+        if lab_section is None:
+            raise _RowError(f"Lab section {number} does not exist.")
+        ta = self._user(row, "ta", "TA")
+        assignment = self._stage(lab_section.id, self.lab_assignments.get(lab_section.id), to_create, to_update,
+                                 lambda: TALabAssignment(lab_section=lab_section))
+        assignment.ta = ta
+
+    # Reference lookups
+
+    def _semester(self, row) -> Semester:
+        name = _required(row, "semester")
+        semester = self.semesters.get(name)
+        if semester is None:
+            raise _RowError(f"Semester '{name}' does not exist.")
+        return semester
+
+    def _course(self, row) -> Course:
+        semester = self._semester(row)
+        code = _required(row, "course_code")
+        course = self.courses.get((semester.id, code))
+        if course is None:
+            raise _RowError(f"Course '{code}' does not exist in semester '{semester.semester_name}'.")
+        return course
+
+    def _user(self, row, column, role) -> User:
+        username = _required(row, column)
+        user = self.users.get(username)
+        if user is None:
+            raise _RowError(f"User '{username}' does not exist.")
+        if user.role != role:
+            raise _RowError(f"User '{username}' must have the '{role}' role.")
+        return user
+
+
+_WRITE_TARGETS = {
+    "semester": (Semester, ["start_date", "end_date"]),
+    "course": (Course, ["course_name"]),
+    "course_section": (CourseSection, ["instructor", "days", "start_time", "end_time"]),
+    "lab_section": (LabSection, ["days", "start_time", "end_time"]),
+    "ta_course_assignment": (TACourseAssignment, ["grader_status"]),
+    "ta_lab_assignment": (TALabAssignment, ["ta"]),
+}
+
+
+def _json_list_items(stream) -> Iterator:
+    # decodes the items of a top level json list one at a time, keeping only the unread part of the stream
+    decoder = json.JSONDecoder()
+    buffer, position, consumed, at_end = "", 0, 0, False
+
+    def read_more():
+        nonlocal buffer, position, consumed, at_end
+        more = stream.read(JSON_READ_SIZE)
+        at_end = more == ""
+        consumed += position
+        buffer, position = buffer[position:] + more, 0
+
+    def next_char():
+        # the next non-whitespace character, "" at the end of the stream
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\n\r":
+                position += 1
+            if position < len(buffer) or at_end:
+                return buffer[position:position + 1]
+            read_more()
+
+    def malformed(message, at=None):
+        return ValueError(f"Malformed json at character {consumed + (position if at is None else at)}: {message}")
+
+    if next_char() != "[":
+        raise ValueError("A json import must be a list of objects.")
+    position += 1
+    if next_char() == "]":
+        position += 1
+    else:
+        while True:
+            next_char()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    # a number ending with the buffer may continue in the unread part of the stream
+                    if end < len(buffer) or at_end:
+                        break
+                except json.JSONDecodeError as e:
+                    if at_end:
+                        raise malformed(e.msg, e.pos)
+                read_more()
+            position = end
+            yield item
+            separator = next_char()
+            if separator not in (",", "]"):
+                raise malformed("Expecting ',' or ']' after a list item")
+            position += 1
+            if separator == "]":
+                break
+    if next_char() != "":
+        raise malformed("Extra data after the list")
+
+
+def _required(row, column) -> str:
+    value = row.get(column)
+    if value is None or value == "":
+        raise _RowError(f"Missing required column '{column}'.")
+    return str(value)
+
+
+def _parse_date(value, column):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise _RowError(f"Invalid {column} '{value}', expected YYYY-MM-DD.")
+
+
+def _parse_time(row, column):
+    value = _required(row, column)
+    for time_format in ("%H:%M", "%H:%M:%S"):
+        try:
+            return datetime.strptime(value, time_format).time()
+        except ValueError:
+            pass
+    raise _RowError(f"Invalid {column} '{value}', expected HH:MM.")
+
+
+def _parse_section_number(row) -> int:
+    value = _required(row, "section_number")
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise _RowError(f"Invalid section_number '{value}', expected a positive integer.")
+    return number
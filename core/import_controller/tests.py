@@ -0,0 +1,211 @@
+import io
+import json
+import os
+import tempfile
+from datetime import date
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.course_controller.CourseController import CourseController
+from core.import_controller.ImportController import ImportController
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+CSV_HEADER = "type,semester,start_date,end_date,course_code,course_name,section_number,instructor,ta,grader_status,days,start_time,end_time\n"
+
+
+class _Trickle(io.StringIO):
+    # a stream returning at most three characters per read
+    def read(self, size=-1):
+        return super().read(3)
+
+
+def _csv(*lines):
+    return io.StringIO(CSV_HEADER + "".join(line + "\n" for line in lines))
+
+
+class ImportControllerTestBase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.instructor = User.objects.create(username="instructor", first_name="In", last_name="Structor", role="Instructor")
+        self.ta = User.objects.create(username="ta", first_name="T", last_name="A", role="TA")
+
+    def import_csv(self, *lines, batch_size=2000):
+        return ImportController.import_rows(ImportController.read_rows(_csv(*lines), "csv"), batch_size=batch_size)
+
+
+class TestImportRows(ImportControllerTestBase):
+    def test_import_every_row_type(self):
+        result = self.import_csv(
+            "semester,Fall 2025,2025-09-01,2025-12-15,,,,,,,,,",
+            "course,Fall 2025,,,CS361,Software Eng,,,,,,,",
+            "course_section,Fall 2025,,,CS361,,1,instructor,,,MW,09:00,10:15",
+            "lab_section,Fall 2025,,,CS361,,801,,,,F,11:00,12:50",
+            "ta_course_assignment,Fall 2025,,,CS361,,,,ta,true,,,",
+            "ta_lab_assignment,Fall 2025,,,CS361,,801,,ta,,,,",
+        )
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.created, {"semester": 1, "course": 1, "course_section": 1, "lab_section": 1,
+                                          "ta_course_assignment": 1, "ta_lab_assignment": 1})
+        course = Course.objects.get(course_code="CS361", semester__semester_name="Fall 2025")
+        section = CourseSection.objects.get(course=course)
+        self.assertEqual((section.course_section_number, section.instructor, section.days), (1, self.instructor, "MW"))
+        lab = LabSection.objects.get(course=course)
+        self.assertEqual(lab.get_ta(), self.ta)
+        self.assertTrue(TACourseAssignment.objects.get(course=course, ta=self.ta).grader_status)
+
+    def test_reimport_updates_instead_of_duplicating(self):
+        rows = ("semester,Fall 2025,2025-09-01,2025-12-15,,,,,,,,,",
+                "course,Fall 2025,,,CS361,Software Eng,,,,,,,",
+                "lab_section,Fall 2025,,,CS361,,801,,,,F,11:00,12:50")
+        self.import_csv(*rows)
+        result = self.import_csv(*rows[:2], "lab_section,Fall 2025,,,CS361,,801,,,,TR,13:00,14:50")
+        self.assertEqual(result.created["lab_section"], 0)
+        self.assertEqual(result.updated["lab_section"], 1)
+        lab = LabSection.objects.get()
+        self.assertEqual((lab.days, lab.start_time.hour), ("TR", 13))
+
+    def test_repeated_key_in_batch_writes_once(self):
+        result = self.import_csv(
+            "semester,Fall 2025,2025-09-01,2025-12-15,,,,,,,,,",
+            "course,Fall 2025,,,CS361,First Name,,,,,,,",
+            "course,Fall 2025,,,CS361,Second Name,,,,,,,",
+        )
+        self.assertEqual(result.created["course"], 1)
+        self.assertEqual(Course.objects.get().course_name, "Second Name")
+
+    def test_rows_refer_to_records_from_earlier_batches(self):
+        result = self.import_csv(
+            "semester,Fall 2025,2025-09-01,2025-12-15,,,,,,,,,",
+            "course,Fall 2025,,,CS361,Software Eng,,,,,,,",
+            "lab_section,Fall 2025,,,CS361,,801,,,,F,11:00,12:50",
+            "ta_lab_assignment,Fall 2025,,,CS361,,801,,ta,,,,",
+            batch_size=1,
+        )
+        self.assertEqual(result.errors, [])
+        self.assertEqual(TALabAssignment.objects.get().ta, self.ta)
+
+    def test_invalid_rows_reported_and_skipped(self):
+        result = self.import_csv(
+            "semester,Fall 2025,2025-12-15,2025-09-01,,,,,,,,,",
+            "course,Spring 2030,,,CS361,Software Eng,,,,,,,",
+            "unknown,,,,,,,,,,,,",
+            "semester,Spring 2026,2026-01-20,2026-05-10,,,,,,,,,",
+            "course,Spring 2026,,,CS361,,,,,,,,",
+            "course,Spring 2026,,,CS337,Systems,,,,,,,",
+            "course_section,Spring 2026,,,CS337,,1,ta,,,MW,09:00,10:15",
+            "lab_section,Spring 2026,,,CS337,,abc,,,,F,11:00,12:50",
+            "lab_section,Spring 2026,,,CS337,,801,,,,F,25:00,12:50",
+            "ta_lab_assignment,Spring 2026,,,CS337,,802,,ta,,,,",
+            "ta_course_assignment,Spring 2026,,,CS337,,,,nobody,false,,,",
+        )
+        self.assertEqual([(error.row, error.message) for error in result.errors], [
+            (1, "start_date cannot be after end_date"),
+            (2, "Semester 'Spring 2030' does not exist."),
+            (3, "Unknown row type 'unknown'."),
+            (5, "Missing required column 'course_name'."),
+            (7, "User 'ta' must have the 'Instructor' role."),
+            (8, "Invalid section_number 'abc', expected a positive integer."),
+            (9, "Invalid start_time '25:00', expected HH:MM."),
+            (10, "Lab section 802 does not exist."),
+            (11, "User 'nobody' does not exist."),
+        ])
+        self.assertEqual(list(Semester.objects.values_list("semester_name", flat=True)), ["Spring 2026"])
+        self.assertEqual(list(Course.objects.values_list("course_code", flat=True)), ["CS337"])
+
+    def test_import_json(self):
+        rows = [
+            {"type": "semester", "semester": "Fall 2025", "start_date": "2025-09-01", "end_date": "2025-12-15"},
+            {"type": "course", "semester": "Fall 2025", "course_code": "CS361", "course_name": "Software Eng"},
+            {"type": "ta_course_assignment", "semester": "Fall 2025", "course_code": "CS361", "ta": "ta",
+             "grader_status": False},
+        ]
+        result = ImportController.import_rows(ImportController.read_rows(io.StringIO(json.dumps(rows)), "json"))
+        self.assertEqual(result.errors, [])
+        self.assertFalse(TACourseAssignment.objects.get().grader_status)
+
+    def test_json_read_one_item_at_a_time(self):
+        rows = [{"type": "semester", "semester": f"Fall {year}", "start_date": f"{year}-09-01",
+                 "end_date": f"{year}-12-15", "size": 10 ** 20} for year in range(2000, 4000)]
+        text = json.dumps(rows, indent=1)
+        stream = io.StringIO(text)
+        items = ImportController.read_rows(stream, "json")
+        self.assertEqual(next(items), rows[0])
+        self.assertLess(stream.tell(), len(text))
+        self.assertEqual(list(items), rows[1:])
+        # a few characters per read splits items, numbers and whitespace across reads
+        self.assertEqual(list(ImportController.read_rows(_Trickle(json.dumps(rows[:20], indent=1)), "json")),
+                         rows[:20])
+
+    def test_malformed_json(self):
+        with self.assertRaisesMessage(ValueError, "A json import must be a list of objects."):
+            list(ImportController.read_rows(io.StringIO('{"type": "semester"}'), "json"))
+        for text in ('[{"type": "semester"}', '[{"type": }]', '[1 2]', "[1] []"):
+            with self.assertRaisesMessage(ValueError, "Malformed json at character"):
+                list(ImportController.read_rows(_Trickle(text), "json"))
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            list(ImportController.read_rows(io.StringIO(""), "xml"))
+
+    def test_malformed_csv(self):
+        # an unterminated quote reads the rest of the file into one field, past the csv module's field size limit
+        stream = _csv("semester,Fall 2025,2025-09-01,2025-12-15,,,,,,,,,", 'course,"Fall 2025' + "x" * 200000)
+        with self.assertRaisesMessage(ValueError, "Malformed csv after line 2"):
+            list(ImportController.read_rows(stream, "csv"))
+
+    def test_cached_course_pages_refreshed(self):
+        semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1), end_date=date(2025, 12, 15))
+        Course.objects.create(course_code="CS361", course_name="Software Eng", semester=semester)
+        self.assertEqual(CourseController.get_course("CS361", "Fall 2025").lab_sections, [])
+        self.import_csv("lab_section,Fall 2025,,,CS361,,801,,,,F,11:00,12:50")
+        self.assertEqual(len(CourseController.get_course("CS361", "Fall 2025").lab_sections), 1)
+
+
+class TestImportCommand(ImportControllerTestBase):
+    def test_command_imports_file_and_reports_errors(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as file:
+            file.write(CSV_HEADER)
+            file.write("semester,Fall 2025,2025-09-01,2025-12-15,,,,,,,,,\n")
+            file.write("course,Fall 2030,,,CS361,Software Eng,,,,,,,\n")
+        self.addCleanup(os.remove, file.name)
+        out, err = io.StringIO(), io.StringIO()
+        call_command("import_schedule", file.name, stdout=out, stderr=err)
+        self.assertIn("semester: 1 created, 0 updated", out.getvalue())
+        self.assertIn("row 2: Semester 'Fall 2030' does not exist.", err.getvalue())
+        self.assertTrue(Semester.objects.filter(semester_name="Fall 2025").exists())
+
+
+class TestImportAtScale(ImportControllerTestBase):
+    """
+    Checks the number of queries an import runs depends on the number of batches rather than the number of rows.
+    run_benchmarks times importing a whole semester of the synthetic data.
+    """
+    SECTIONS_PER_COURSE = 4
+
+    def rows(self, semester, courses):
+        yield {"type": "semester", "semester": semester, "start_date": "2025-09-01", "end_date": "2025-12-15"}
+        for i in range(courses):
+            yield {"type": "course", "semester": semester, "course_code": f"CS{i}", "course_name": f"Course {i}"}
+        for i in range(courses):
+            for number in range(1, self.SECTIONS_PER_COURSE // 2 + 1):
+                yield {"type": "course_section", "semester": semester, "course_code": f"CS{i}",
+                       "section_number": number, "instructor": "instructor", "days": "MW",
+                       "start_time": "09:00", "end_time": "10:15"}
+                yield {"type": "lab_section", "semester": semester, "course_code": f"CS{i}",
+                       "section_number": 800 + number, "days": "F", "start_time": "11:00", "end_time": "12:50"}
+
+    def count_queries(self, semester, courses):
+        with CaptureQueriesContext(connection) as queries:
+            result = ImportController.import_rows(self.rows(semester, courses), batch_size=1000)
+        self.assertEqual(result.errors, [])
+        return len(queries)
+
+    def test_queries_independent_of_row_count(self):
+        # both fit in one batch and in one INSERT per model
+        small, large = self.count_queries("Fall 2025", 10), self.count_queries("Spring 2026", 25)
+        self.assertEqual(small, large)
+        self.assertEqual(CourseSection.objects.count() + LabSection.objects.count(), 35 * self.SECTIONS_PER_COURSE)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from datetime import time
-from typing import List
+from datetime import datetime, time
+from typing import Dict, List
 
 from ta_scheduler.models import Semester, Course, User
 
@@ -50,6 +50,18 @@ class CourseRef:
     course_code: str
     course_name: str
 
+@dataclass
+class SemesterCoursePage:
+    """
+    A dataclass that exposes a semester of a course search with its number of matching courses and, once
+    loaded, the first page of them together with the cursor of the next page
+    """
+    semester: str
+    course_count: int
+    courses: List[CourseRef]
+    next_cursor: str | None
+    loaded: bool
+
 @dataclass
 class TACourseRef(CourseRef):
     """
@@ -133,3 +145,125 @@ class CourseSectionFormData(SectionFormData):
     """
     instructor: UserRef
     section_type = "Course"
+
+@dataclass
+class ImportRowError:
+    """
+    A dataclass that exposes why a single row of a bulk import was rejected
+    """
+    row: int
+    message: str
+
+@dataclass
+class ImportResult:
+    """
+    A dataclass that exposes the outcome of a bulk import: the number of records created and updated
+    per row type and the rows that were rejected
+    """
+    created: Dict[str, int]
+    updated: Dict[str, int]
+    errors: List[ImportRowError]
+
+@dataclass
+class CalendarFeed:
+    """
+    A dataclass that exposes a rendered iCalendar feed and the entity tag identifying its content
+    """
+    etag: str
+    body: str
+
+@dataclass
+class ScheduleConflict:
+    """
+    A dataclass that exposes two sections whose meeting times overlap for the person teaching both
+    """
+    username: str
+    section: str
+    conflicting_section: str
+    day: str
+
+@dataclass
+class ProposedLabAssignment:
+    """
+    A dataclass that exposes the TA proposed for an unassigned lab section, or why no TA could be proposed
+    """
+    course_code: str
+    lab_section_number: int
+    ta: UserRef | None
+    reason: str | None
+
+@dataclass
+class AvailableTA:
+    """
+    A dataclass that exposes a TA who is free at a given time, with their lab load in the semester and how many of
+    their skills the course being staffed mentions
+    """
+    ta: UserRef
+    load: int
+    skill_matches: int
+
+@dataclass
+class Workload:
+    """
+    A dataclass that exposes how much a TA or instructor teaches in a semester: weekly contact hours of their
+    sections and labs, and the number of lab sections, course sections and courses they are assigned to
+    """
+    user: UserRef
+    role: str
+    weekly_hours: float
+    lab_sections: int
+    course_sections: int
+    courses: int
+    graded_courses: int
+
+@dataclass
+class RepeatedQuery:
+    """
+    A dataclass that exposes a query shape run more often than the N+1 detector allows, how often it ran and
+    the project stack frames that first ran it past the threshold
+    """
+    sql: str
+    count: int
+    stack: List[str]
+
+@dataclass
+class BenchmarkResult:
+    """
+    A dataclass that exposes how long a benchmarked controller call or view took over a number of runs, as
+    percentiles in milliseconds, and how many queries it ran
+    """
+    name: str
+    iterations: int
+    queries: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+@dataclass
+class BenchmarkComparison:
+    """
+    A dataclass that exposes a benchmark's median time and query count next to the ones stored in a baseline,
+    and whether it is slower or runs more queries than the baseline allows
+    """
+    name: str
+    baseline_p50_ms: float
+    p50_ms: float
+    change: float
+    baseline_queries: int
+    queries: int
+    regressed: bool
+
+@dataclass
+class SlowQuery:
+    """
+    A dataclass that exposes a query that took longer than the slow query threshold: its SQL and parameters, how
+    long it took, the request and function that ran it and SQLite's plan for it
+    """
+    sql: str
+    params: List[str]
+    duration_ms: float
+    caller: str
+    plan: List[str]
+    path: str
+    recorded_at: datetime
@@ -0,0 +1,162 @@
+import logging
+import re
+import sys
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from typing import Dict, List
+
+from django.conf import settings
+from django.db import connection
+
+from core.local_data_classes import RepeatedQuery
+from core.request_metrics.RequestMetrics import view_name
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "log", "raise")
+DEFAULT_THRESHOLD = 5
+# Project frames kept in a report, the innermost last
+STACK_DEPTH = 6
+
+_IN_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_PROJECT_ROOT = str(Path(settings.BASE_DIR).resolve())
+
+
+class NPlusOneError(AssertionError):
+    """
+    Raised in "raise" mode when a query shape runs more times than the threshold, an AssertionError so a test
+    that triggers it is reported as a failure
+    """
+
+
+class NPlusOneDetector:
+    """
+    Counts the SELECT statements run inside a block by their shape, the SQL with parameters left out and IN lists
+    collapsed, and reports every shape run more than a threshold number of times: the sign of a lazy foreign key
+    or reverse relation being loaded once per row of a loop.
+
+    The mode and threshold default to settings.NPLUSONE_MODE and settings.NPLUSONE_THRESHOLD. In "log" mode
+    reports are logged as warnings, in "raise" mode they raise NPlusOneError, "off" does nothing.
+    """
+    @staticmethod
+    @contextmanager
+    def watch(label: str, threshold: int | None = None, mode: str | None = None):
+        """
+        Pre-conditions: mode is one of MODES or None
+        Post-conditions: Yields a QueryShapeCounter counting the queries of the block. When the block finishes
+            without an exception the repeated queries are reported under label.
+        Side-effects: Logs a warning or raises NPlusOneError for repeated queries, depending on the mode
+        """
+        mode = mode or NPlusOneDetector.mode()
+        counter = QueryShapeCounter(threshold if threshold is not None else NPlusOneDetector.threshold())
+        if mode == "off":
+            yield counter
+            return
+        with connection.execute_wrapper(counter):
+            yield counter
+        NPlusOneDetector.report(label, counter.repeated(), mode)
+
+    @staticmethod
+    def report(label: str, repeated: List[RepeatedQuery], mode: str | None = None) -> None:
+        """
+        Post-conditions: Does nothing if repeated is empty or the mode is "off"
+        Side-effects: Logs a warning or raises NPlusOneError describing the repeated queries
+        """
+        mode = mode or NPlusOneDetector.mode()
+        if not repeated or mode == "off":
+            return
+        message = format_report(label, repeated)
+        if mode == "raise":
+            raise NPlusOneError(message)
+        logger.warning(message)
+
+    @staticmethod
+    def mode() -> str:
+        mode = getattr(settings, "NPLUSONE_MODE", "off")
+        if mode not in MODES:
+            raise ValueError(f"NPLUSONE_MODE must be one of {', '.join(MODES)}, not '{mode}'.")
+        return mode
+
+    @staticmethod
+    def threshold() -> int:
+        return getattr(settings, "NPLUSONE_THRESHOLD", DEFAULT_THRESHOLD)
+
+
+class QueryShapeCounter:
+    """
+    A database execute wrapper counting SELECT statements by shape. The stack is only captured when a shape first
+    passes the threshold, so counting costs a regex per query.
+    """
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.counts: Counter = Counter()
+        self.stacks: Dict[str, List[str]] = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip()[:6].upper() == "SELECT":
+            shape = fingerprint(sql)
+            self.counts[shape] += 1
+            if self.counts[shape] == self.threshold + 1:
+                self.stacks[shape] = _project_stack()
+        return execute(sql, params, many, context)
+
+    def repeated(self) -> List[RepeatedQuery]:
+        return [RepeatedQuery(sql=shape, count=count, stack=self.stacks.get(shape, []))
+                for shape, count in self.counts.most_common() if count > self.threshold]
+
+
+class NPlusOneMiddleware:
+    """
+    Watches every request that resolves to a view with NPlusOneDetector, reporting under the view's name.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        mode = NPlusOneDetector.mode()
+        if mode == "off":
+            return self.get_response(request)
+        counter = QueryShapeCounter(NPlusOneDetector.threshold())
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        match = getattr(request, "resolver_match", None)
+        if match is not None:
+            NPlusOneDetector.report(f"{view_name(match.func)} ({request.method} {request.path})", counter.repeated(),
+                                    mode)
+        return response
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Returns the shape of a parameterized SQL statement: whitespace normalized and IN lists of any length collapsed
+    """
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("(%s, ...)", sql)).strip()
+
+
+def format_report(label: str, repeated: List[RepeatedQuery]) -> str:
+    lines = [f"Possible N+1 queries in {label}:"]
+    for query in repeated:
+        lines.append(f"  {query.count}x {query.sql[:300]}")
+        lines += [f"    {frame}" for frame in query.stack]
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _wrapper_files() -> frozenset:
+    # this module and the project's middleware only wrap the code that ran the query
+    modules = [sys.modules[__name__]] + [import_module(path.rsplit(".", 1)[0]) for path in settings.MIDDLEWARE]
+    return frozenset(str(Path(module.__file__).resolve()) for module in modules)
+
+
+def _project_stack() -> List[str]:
+    # frames of the project's own code, leaving out installed packages and wrappers
+    frames = [frame for frame in traceback.extract_stack()
+              if frame.filename.startswith(_PROJECT_ROOT) and frame.filename not in _wrapper_files()
+              and "site-packages" not in frame.filename]
+    return [f"{Path(frame.filename).relative_to(_PROJECT_ROOT)}:{frame.lineno} in {frame.name}: {frame.line}"
+            for frame in frames[-STACK_DEPTH:]]
@@ -0,0 +1,69 @@
+from datetime import date, time
+
+from django.core.cache import cache
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+
+from core.query_detector.NPlusOneDetector import NPlusOneDetector, NPlusOneError, fingerprint
+from ta_scheduler.models import Course, CourseSection, Semester, User
+
+
+class TestFingerprint(SimpleTestCase):
+    def test_in_lists_and_whitespace_collapsed(self):
+        self.assertEqual(fingerprint('SELECT * FROM "t"\n  WHERE "id" IN (%s, %s,%s)'),
+                         fingerprint('SELECT * FROM "t" WHERE "id" IN (%s)'))
+
+
+class TestNPlusOneDetector(TestCase):
+    def setUp(self):
+        semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                           end_date=date(2025, 12, 15))
+        course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=semester)
+        for number in range(1, 5):
+            instructor = User.objects.create(username=f"instructor{number}", role="Instructor")
+            CourseSection.objects.create(course=course, course_section_number=number, instructor=instructor,
+                                         days="MW", start_time=time(9, 0), end_time=time(10, 0))
+
+    def test_lazy_loop_raises_with_stack(self):
+        with self.assertRaises(NPlusOneError) as context:
+            with NPlusOneDetector.watch("lazy loop", threshold=2, mode="raise"):
+                [section.instructor.username for section in CourseSection.objects.all()]
+        message = str(context.exception)
+        self.assertIn("Possible N+1 queries in lazy loop", message)
+        self.assertIn('4x SELECT "ta_scheduler_user"', message)
+        self.assertIn("core/query_detector/tests.py", message)
+
+    def test_select_related_is_clean(self):
+        with NPlusOneDetector.watch("joined", threshold=2, mode="raise") as counter:
+            [section.instructor.username for section in CourseSection.objects.select_related("instructor")]
+        self.assertEqual(counter.repeated(), [])
+
+    def test_writes_not_counted(self):
+        with NPlusOneDetector.watch("writes", threshold=2, mode="raise") as counter:
+            for number in range(5):
+                User.objects.bulk_create([User(username=f"bulk{number}", role="TA")])
+        self.assertEqual(counter.repeated(), [])
+
+    def test_log_mode_warns(self):
+        with self.assertLogs("core.query_detector.NPlusOneDetector", level="WARNING") as logs:
+            with NPlusOneDetector.watch("lazy loop", threshold=2, mode="log"):
+                [section.instructor.username for section in CourseSection.objects.all()]
+        self.assertIn("4x", logs.output[0])
+
+
+class TestNPlusOneMiddleware(TestCase):
+    def setUp(self):
+        # user search results are cached, a cached page would run no query at all
+        cache.clear()
+        self.client = Client()
+        User.objects.create_user(username="admin", password="adminpass", role="Admin")
+        self.client.login(username="admin", password="adminpass")
+
+    @override_settings(NPLUSONE_MODE="raise", NPLUSONE_THRESHOLD=0)
+    def test_raise_mode_fails_request(self):
+        with self.assertRaises(NPlusOneError) as context:
+            self.client.get("/api/search/user/")
+        self.assertIn("search_user_api (GET /api/search/user/)", str(context.exception))
+
+    @override_settings(NPLUSONE_MODE="off", NPLUSONE_THRESHOLD=0)
+    def test_off_mode(self):
+        self.assertEqual(self.client.get("/api/search/user/").status_code, 200)
@@ -0,0 +1,52 @@
+from contextvars import ContextVar
+
+# Holds the cache dict of the request currently being handled, or None outside of a request
+_request_cache: ContextVar[dict | None] = ContextVar("request_cache", default=None)
+
+
+class RequestCache:
+    """
+    A cache that only lives for the duration of a single request. Lets controllers memoize lookups
+    that several views/helpers repeat while handling one request without ever serving data from an
+    earlier request. Outside of a request (e.g. controller unit tests) nothing is cached.
+    """
+    @staticmethod
+    def get_or_set(key, default_func):
+        """
+        Pre-conditions: key is hashable, default_func takes no arguments
+        Post-conditions: Returns the value cached under key for the current request, calling default_func
+            and caching its result if there is none. Exceptions from default_func are not cached.
+        Side-effects: May store a value in the current request's cache
+        """
+        cache = _request_cache.get()
+        if cache is None:
+            return default_func()
+        if key not in cache:
+            cache[key] = default_func()
+        return cache[key]
+
+    @staticmethod
+    def delete(key) -> None:
+        """
+        Pre-conditions: key is hashable
+        Post-conditions: The value cached under key for the current request, if any, is removed
+        Side-effects: Modifies the current request's cache
+        """
+        cache = _request_cache.get()
+        if cache is not None:
+            cache.pop(key, None)
+
+
+class RequestCacheMiddleware:
+    """
+    Opens a fresh RequestCache for every request and discards it once the response is produced.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _request_cache.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            _request_cache.reset(token)
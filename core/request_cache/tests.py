@@ -0,0 +1,64 @@
+from datetime import date
+
+from django.test import TestCase, RequestFactory
+
+from core.course_controller.CourseController import CourseController
+from core.request_cache.RequestCache import RequestCache, RequestCacheMiddleware
+from ta_scheduler.models import Course, Semester
+
+
+def _run_in_request(func):
+    return RequestCacheMiddleware(lambda request: func())(RequestFactory().get("/"))
+
+
+class TestRequestCache(TestCase):
+    def setUp(self):
+        self.calls = 0
+
+    def _count(self):
+        self.calls += 1
+        return self.calls
+
+    def test_nothing_cached_outside_request(self):
+        RequestCache.get_or_set("key", self._count)
+        RequestCache.get_or_set("key", self._count)
+        self.assertEqual(self.calls, 2)
+
+    def test_cached_within_request(self):
+        values = _run_in_request(lambda: [RequestCache.get_or_set("key", self._count) for _ in range(3)])
+        self.assertEqual(values, [1, 1, 1])
+
+    def test_not_shared_between_requests(self):
+        _run_in_request(lambda: RequestCache.get_or_set("key", self._count))
+        self.assertEqual(_run_in_request(lambda: RequestCache.get_or_set("key", self._count)), 2)
+
+    def test_delete(self):
+        def body():
+            RequestCache.get_or_set("key", self._count)
+            RequestCache.delete("key")
+            return RequestCache.get_or_set("key", self._count)
+        self.assertEqual(_run_in_request(body), 2)
+
+
+class TestCourseOverviewRequestCache(TestCase):
+    def setUp(self):
+        semester = Semester.objects.create(semester_name="Fall 2024", start_date=date(2024, 9, 1), end_date=date(2024, 12, 15))
+        Course.objects.create(course_code="CS101", course_name="Intro", semester=semester)
+
+    def test_get_course_loaded_once_per_request(self):
+        def body():
+            # course, TA assignments, course sections and lab sections; no labs means no lab TA query
+            with self.assertNumQueries(4):
+                first = CourseController.get_course("CS101", "Fall 2024")
+                second = CourseController.get_course("CS101", "Fall 2024")
+            return first, second
+        first, second = _run_in_request(body)
+        self.assertIs(first, second)
+
+    def test_invalidated_by_delete(self):
+        def body():
+            CourseController.get_course("CS101", "Fall 2024")
+            CourseController.delete_course("CS101", "Fall 2024")
+            with self.assertRaises(ValueError):
+                CourseController.get_course("CS101", "Fall 2024")
+        _run_in_request(body)
@@ -0,0 +1,149 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from django.db import connection
+
+# Upper bounds of the histogram buckets, an observation is counted in the first bucket it fits
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# name, help text and buckets of every histogram, in the order they are exposed
+METRICS = (
+    ("ta_scheduler_request_duration_seconds", "Wall time spent handling a request, by view.", DURATION_BUCKETS),
+    ("ta_scheduler_request_queries", "Database queries run while handling a request, by view.", QUERY_COUNT_BUCKETS),
+    ("ta_scheduler_request_db_duration_seconds", "Time spent in database queries while handling a request, by view.",
+     DURATION_BUCKETS),
+    ("ta_scheduler_response_size_bytes", "Size of the rendered response body, by view. Streamed responses are not "
+                                         "counted.", SIZE_BUCKETS),
+)
+
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # one count per bucket plus one for observations above the last bound
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+
+class RequestMetrics:
+    """
+    In-process histograms of the wall time, query count, database time and response size of the requests
+    handled by each view. Every worker process keeps its own, so a scrape only covers the process that served it.
+    Recording an observation is a few list increments under a lock, cheap enough to leave on for every request.
+    """
+    _lock = threading.Lock()
+    # metric name -> view name -> histogram
+    _histograms: Dict[str, Dict[str, _Histogram]] = {name: {} for name, _, _ in METRICS}
+
+    @staticmethod
+    def record(view: str, duration: float, query_count: int, db_duration: float, response_size: int | None) -> None:
+        """
+        Pre-conditions: durations are in seconds, response_size is in bytes or None for a streamed response
+        Post-conditions: The observations are counted in the view's histograms
+        Side-effects: Updates the shared histograms
+        """
+        values = (duration, query_count, db_duration, response_size)
+        with RequestMetrics._lock:
+            for (name, _, buckets), value in zip(METRICS, values):
+                if value is None:
+                    continue
+                histograms = RequestMetrics._histograms[name]
+                if view not in histograms:
+                    histograms[view] = _Histogram(buckets)
+                histograms[view].observe(value)
+
+    @staticmethod
+    def render_prometheus() -> str:
+        """
+        Post-conditions: Returns every histogram in the Prometheus text exposition format, version 0.0.4
+        Side-effects: None
+        """
+        with RequestMetrics._lock:
+            snapshot = {name: {view: (list(histogram.counts), histogram.total)
+                               for view, histogram in histograms.items()}
+                        for name, histograms in RequestMetrics._histograms.items()}
+        lines: List[str] = []
+        for name, help_text, buckets in METRICS:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for view in sorted(snapshot[name]):
+                counts, total = snapshot[name][view]
+                label = _escape_label(view)
+                cumulative = 0
+                for bound, count in zip(buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _format_number(bound)
+                    lines.append(f'{name}_bucket{{view="{label}",le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{view="{label}"}} {_format_number(total)}')
+                lines.append(f'{name}_count{{view="{label}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Post-conditions: Every histogram is removed
+        Side-effects: Clears the shared histograms
+        """
+        with RequestMetrics._lock:
+            for histograms in RequestMetrics._histograms.values():
+                histograms.clear()
+
+
+class RequestMetricsMiddleware:
+    """
+    Measures every request whose URL resolved to a view and records it in RequestMetrics under the view's name,
+    the class name for class based views. Queries are counted and timed with a database execute wrapper, so it
+    works without DEBUG and without keeping the SQL.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = _QueryTimer()
+        started = time.perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        match = getattr(request, "resolver_match", None)
+        if match is not None:
+            response_size = None if response.streaming else len(response.content)
+            RequestMetrics.record(view_name(match.func), duration, queries.count, queries.duration, response_size)
+        return response
+
+
+class _QueryTimer:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+def view_name(func) -> str:
+    """
+    Returns the name a view is reported under: the class name for class based views, the function name otherwise
+    """
+    view_class = getattr(func, "view_class", None)
+    return view_class.__name__ if view_class is not None else getattr(func, "__name__", repr(func))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
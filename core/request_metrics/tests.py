@@ -0,0 +1,62 @@
+from django.test import Client, SimpleTestCase, TestCase
+
+from core.request_metrics.RequestMetrics import RequestMetrics
+from ta_scheduler.models import User
+
+
+class TestRequestMetrics(SimpleTestCase):
+    def setUp(self):
+        RequestMetrics.reset()
+
+    def test_histogram_buckets_are_cumulative(self):
+        RequestMetrics.record("CourseView", 0.02, 3, 0.004, 2000)
+        RequestMetrics.record("CourseView", 0.3, 12, 0.1, None)
+        text = RequestMetrics.render_prometheus()
+        self.assertIn('ta_scheduler_request_duration_seconds_bucket{view="CourseView",le="0.025"} 1', text)
+        self.assertIn('ta_scheduler_request_duration_seconds_bucket{view="CourseView",le="0.5"} 2', text)
+        self.assertIn('ta_scheduler_request_duration_seconds_bucket{view="CourseView",le="+Inf"} 2', text)
+        self.assertIn('ta_scheduler_request_queries_sum{view="CourseView"} 15', text)
+        self.assertIn('ta_scheduler_request_queries_bucket{view="CourseView",le="5"} 1', text)
+        # the streamed response has no size
+        self.assertIn('ta_scheduler_response_size_bytes_count{view="CourseView"} 1', text)
+        self.assertIn("# TYPE ta_scheduler_request_db_duration_seconds histogram", text)
+
+    def test_memory_grows_with_views_not_requests(self):
+        for i in range(10000):
+            RequestMetrics.record(f"View{i % 20}", 0.05, 10, 0.01, 5000)
+        text = RequestMetrics.render_prometheus()
+        self.assertEqual(text.count("ta_scheduler_request_duration_seconds_count{"), 20)
+        self.assertIn('ta_scheduler_request_duration_seconds_count{view="View7"} 500', text)
+
+    def test_label_escaped(self):
+        RequestMetrics.record('odd"view', 0.01, 0, 0, 0)
+        self.assertIn('view="odd\\"view"', RequestMetrics.render_prometheus())
+
+
+class TestRequestMetricsMiddleware(TestCase):
+    def setUp(self):
+        RequestMetrics.reset()
+        self.client = Client()
+        User.objects.create_user(username="admin", password="adminpass", role="Admin")
+        User.objects.create_user(username="ta", password="tapass", role="TA")
+
+    def test_records_resolved_views(self):
+        self.client.login(username="admin", password="adminpass")
+        self.client.get("/search/course/")
+        self.client.get("/api/search/user/")
+        self.client.get("/no-such-page/")
+        text = self.client.get("/metrics").content.decode()
+        self.assertIn('ta_scheduler_request_duration_seconds_count{view="SearchView"} 1', text)
+        self.assertIn('ta_scheduler_request_queries_count{view="search_user_api"} 1', text)
+        self.assertNotIn("no-such-page", text)
+        self.assertRegex(text, r'ta_scheduler_response_size_bytes_sum\{view="SearchView"\} [1-9]')
+        self.assertRegex(text, r'ta_scheduler_request_queries_sum\{view="SearchView"\} [1-9]')
+
+    def test_metrics_admin_only(self):
+        self.client.login(username="ta", password="tapass")
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 403)
+
+    def test_prometheus_content_type(self):
+        self.client.login(username="admin", password="adminpass")
+        self.assertTrue(self.client.get("/metrics")["Content-Type"].startswith("text/plain; version=0.0.4"))
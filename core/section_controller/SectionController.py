@@ -1,3 +1,7 @@
+from django.db import IntegrityError, transaction
+
+from core.conflict_controller.ConflictController import ConflictController
+from core.course_controller.CourseController import CourseController
 from core.local_data_classes import LabSectionFormData, CourseSectionFormData, CourseRef, UserRef
 from ta_scheduler.models import CourseSection, LabSection, Course, Semester, User, TALabAssignment
 
@@ -8,6 +12,7 @@ class SectionController:
         """
         Pre-conditions: lab section data is valid in the form provided, if the lab_section_id is provided, a lab section with that id exists.
         Post-conditions: Adds/updates a record to the LabSection table with the relation to the course provided in LabFormData.
+            Raises a ValueError if the new times overlap another section of the TA assigned to the lab.
         Side-effects: new record added to the LabSection table or an existing record is updated if lab_section_id is provided.
         Returns: course id of the course that the lab section was added for and the lab section number.
         """
@@ -28,31 +33,34 @@ class SectionController:
                 )
             except LabSection.DoesNotExist:
                 raise ValueError(f"Lab section {lab_section_number} does not exist.")
+            # the new times must still fit the schedule of the TA already assigned to the lab
+            ta = lab_section.get_ta()
+            if ta is not None:
+                ConflictController.check_section(ta, course.semester_id, lab_section_data.days, lab_section_data.start_time,
+                                                 lab_section_data.end_time, exclude=("lab", lab_section.pk))
 
-        # Ensure no duplicates excluding the current section's ID
-        if LabSection.objects.filter(
-                course=course,
-                lab_section_number=lab_section_data.section_number
-        ).exclude(pk=lab_section.pk if lab_section else None).exists():
+        # Update or create the LabSection, duplicates are rejected by the unique_lab_section_number constraint
+        try:
+            with transaction.atomic():
+                if lab_section:
+                    # Update existing section
+                    lab_section.lab_section_number = lab_section_data.section_number
+                    lab_section.days = lab_section_data.days
+                    lab_section.start_time = lab_section_data.start_time
+                    lab_section.end_time = lab_section_data.end_time
+                    lab_section.save()
+                else:
+                    # Create new section
+                    LabSection.objects.create(
+                        course=course,
+                        lab_section_number=lab_section_data.section_number,
+                        days=lab_section_data.days,
+                        start_time=lab_section_data.start_time,
+                        end_time=lab_section_data.end_time,
+                    )
+        except IntegrityError:
             raise ValueError("A lab section with this section number already exists for the course and semester.")
-
-        # Update or create the LabSection
-        if lab_section:
-            # Update existing section
-            lab_section.lab_section_number = lab_section_data.section_number
-            lab_section.days = lab_section_data.days
-            lab_section.start_time = lab_section_data.start_time
-            lab_section.end_time = lab_section_data.end_time
-            lab_section.save()
-        else:
-            # Create new section
-            LabSection.objects.create(
-                course=course,
-                lab_section_number=lab_section_data.section_number,
-                days=lab_section_data.days,
-                start_time=lab_section_data.start_time,
-                end_time=lab_section_data.end_time,
-            )
+        CourseController.invalidate_course(course.course_code, semester_name)
 
 
     @staticmethod
@@ -70,6 +78,7 @@ class SectionController:
             # Find and delete the lab section
             lab_section = LabSection.objects.get(course=course, lab_section_number=lab_section_number)
             lab_section.delete()
+            CourseController.invalidate_course(course_code, semester_name)
         except Semester.DoesNotExist:
             raise ValueError(f"Semester '{semester_name}' does not exist.")
         except Course.DoesNotExist:
@@ -83,6 +92,7 @@ class SectionController:
         """
         Pre-conditions: course_section_data is valid in the CourseSectionFormData provided, if course section id is provided, a course section with matching id exists.
         Post-conditions: Adds/updates a record to/in the CourseSection table with the relation to the course provided in CourseFormData.
+            Raises a ValueError if the section's times overlap another section of its instructor in the semester.
         Side-effects: new record added to the CourseSection table or an existing record is updated if course_section_id is provided.
         Returns: course id of the course that the lab section was added for and the course section number.
         """
@@ -105,32 +115,34 @@ class SectionController:
             except CourseSection.DoesNotExist:
                 raise ValueError(f"Course section {course_section_number} does not exist.")
 
-        # Ensure no duplicates excluding the current section's ID
-        if CourseSection.objects.filter(
-                course=course,
-                course_section_number=course_section_data.section_number
-        ).exclude(pk=course_section.pk if course_section else None).exists():
-            raise ValueError("A course section with this section number already exists for the course and semester.")
+        ConflictController.check_section(instructor, course.semester_id, course_section_data.days,
+                                         course_section_data.start_time, course_section_data.end_time,
+                                         exclude=("course", course_section.pk) if course_section else None)
 
-        # Update or create the CourseSection
-        if course_section:
-            # Update existing section
-            course_section.course_section_number = course_section_data.section_number
-            course_section.instructor = instructor
-            course_section.days = course_section_data.days
-            course_section.start_time = course_section_data.start_time
-            course_section.end_time = course_section_data.end_time
-            course_section.save()
-        else:
-            # Create new section
-            CourseSection.objects.create(
-                course=course,
-                instructor=instructor,
-                course_section_number=course_section_data.section_number,
-                days=course_section_data.days,
-                start_time=course_section_data.start_time,
-                end_time=course_section_data.end_time,
-            )
+        # Update or create the CourseSection, duplicates are rejected by the unique_course_section_number constraint
+        try:
+            with transaction.atomic():
+                if course_section:
+                    # Update existing section
+                    course_section.course_section_number = course_section_data.section_number
+                    course_section.instructor = instructor
+                    course_section.days = course_section_data.days
+                    course_section.start_time = course_section_data.start_time
+                    course_section.end_time = course_section_data.end_time
+                    course_section.save()
+                else:
+                    # Create new section
+                    CourseSection.objects.create(
+                        course=course,
+                        instructor=instructor,
+                        course_section_number=course_section_data.section_number,
+                        days=course_section_data.days,
+                        start_time=course_section_data.start_time,
+                        end_time=course_section_data.end_time,
+                    )
+        except IntegrityError:
+            raise ValueError("A course section with this section number already exists for the course and semester.")
+        CourseController.invalidate_course(course.course_code, semester_name)
 
     @staticmethod
     def delete_course_section(course_code: str, semester_name: str, course_section_number: int) -> None:
@@ -147,6 +159,7 @@ class SectionController:
             # Find and delete the course section
             course_section = CourseSection.objects.get(course=course, course_section_number=course_section_number)
             course_section.delete()
+            CourseController.invalidate_course(course_code, semester_name)
         except Semester.DoesNotExist:
             raise ValueError(f"Semester '{semester_name}' does not exist.")
         except Course.DoesNotExist:
@@ -258,6 +271,8 @@ class SectionController:
         - If 'section_type' is "Course", the specified user is assigned as the instructor for the course section.
         - If 'section_type' is "Lab", the specified user is assigned as the TA for the lab section via a TALabAssignment entry.
         - Raises a ValueError if the user, course, or section does not exist, or if invalid data is provided.
+        - Raises a ValueError if the section meets at the same time as another section the user instructs or TAs
+            in the semester.
 
         Side-effects:
         - For "Course" sections:
@@ -291,6 +306,8 @@ class SectionController:
                     raise ValueError("User must have the 'Instructor' role for Course sections.")
                 # Update the instructor for the course section
                 section = CourseSection.objects.get(course=course, course_section_number=section_number)
+                ConflictController.check_section(user, semester.id, section.days, section.start_time, section.end_time,
+                                                 exclude=("course", section.pk))
                 section.instructor = user
                 section.save()
 
@@ -299,12 +316,15 @@ class SectionController:
                     raise ValueError("User must have the 'TA' role for Lab sections.")
                 # Update the TA for the lab section
                 lab_section = LabSection.objects.get(course=course, lab_section_number=section_number)
+                ConflictController.check_section(user, semester.id, lab_section.days, lab_section.start_time,
+                                                 lab_section.end_time, exclude=("lab", lab_section.pk))
                 TALabAssignment.objects.update_or_create(
                     lab_section=lab_section,
                     defaults={"ta": user}
                 )
             else:
                 raise ValueError("Invalid section type. Must be 'Course' or 'Lab'.")
+            CourseController.invalidate_course(course_code, semester_name)
 
         except User.DoesNotExist:
             raise ValueError(f"User '{instructor_ref.username}' does not exist.")
@@ -1,8 +1,15 @@
 from datetime import datetime
-from typing import List
+from typing import Dict, List
+
+from django.db import models, transaction
+
+from core.generation_cache.GenerationCache import invalidate_schedule_caches
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment
+
+# Rows copied per query when cloning, both for reading the source semester and for each INSERT
+CLONE_CHUNK_SIZE = 500
+
 
-from django.db import models
-from ta_scheduler.models import Semester
 class SemesterController:
     @staticmethod
     def save_semester(
@@ -124,3 +131,108 @@ class SemesterController:
             - List[str]: A list of all semester names sorted by their start date.
         """
         return Semester.objects.all().order_by("start_date")
+
+    @staticmethod
+    def clone_semester(
+        source_semester_name: str,
+        semester_name: str,
+        start_date: str,
+        end_date: str,
+        include_assignments: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Preconditions:
+            - `source_semester_name` names an existing semester.
+            - `semester_name` is not the name of an existing semester.
+            - `start_date` and `end_date` are valid YYYY-MM-DD strings with start_date not after end_date.
+
+        Postconditions:
+            - Creates the semester `semester_name` with a copy of every course, course section (with its
+              instructor) and lab section of the source semester.
+            - If `include_assignments` is True, the TA course assignments and TA lab assignments are copied too.
+            - Raises a ValueError and changes nothing if a precondition does not hold.
+
+        Side-effects:
+            - Inserts the new records in a single transaction using bulk_create, and clears the course,
+              calendar and workload caches.
+
+        Parameters:
+            - source_semester_name (str): Name of the semester to copy.
+            - semester_name (str): Name of the new semester.
+            - start_date (str): Start date of the new semester in YYYY-MM-DD format.
+            - end_date (str): End date of the new semester in YYYY-MM-DD format.
+            - include_assignments (bool): Whether TA assignments are copied.
+
+        Returns:
+            - Dict[str, int]: The number of records created per model name.
+        """
+        if not semester_name:
+            raise ValueError("semester_name cannot be None")
+        if not start_date or not end_date:
+            raise ValueError("start_date and end_date cannot be None")
+        if SemesterController._not_valid_date(start_date, end_date):
+            raise ValueError("start_date cannot be before end_date")
+        source = SemesterController.get_semester(source_semester_name)
+        if SemesterController.semester_exists(semester_name):
+            raise ValueError(f"Semester '{semester_name}' already exists.")
+
+        counts = dict.fromkeys(["Course", "CourseSection", "LabSection", "TACourseAssignment", "TALabAssignment"], 0)
+        with transaction.atomic():
+            semester = Semester.objects.create(semester_name=semester_name, start_date=start_date, end_date=end_date)
+
+            # bulk_create sets the primary keys of the copies, so later copies can point at them by source id
+            courses = {}
+            for chunk in _chunks(Course.objects.filter(semester=source).values_list("id", "course_code", "course_name")):
+                copies = Course.objects.bulk_create([Course(semester=semester, course_code=code, course_name=name)
+                                                     for _, code, name in chunk])
+                courses.update((source_id, copy.pk) for (source_id, _, _), copy in zip(chunk, copies))
+            counts["Course"] = len(courses)
+
+            sections = CourseSection.objects.filter(course__semester=source).values_list(
+                "course_id", "instructor_id", "course_section_number", "days", "start_time", "end_time")
+            for chunk in _chunks(sections):
+                counts["CourseSection"] += len(CourseSection.objects.bulk_create([
+                    CourseSection(course_id=courses[course_id], instructor_id=instructor_id, course_section_number=number,
+                                  days=days, start_time=start, end_time=end)
+                    for course_id, instructor_id, number, days, start, end in chunk
+                ]))
+
+            labs = {}
+            lab_sections = LabSection.objects.filter(course__semester=source).values_list(
+                "id", "course_id", "lab_section_number", "days", "start_time", "end_time")
+            for chunk in _chunks(lab_sections):
+                copies = LabSection.objects.bulk_create([
+                    LabSection(course_id=courses[course_id], lab_section_number=number, days=days, start_time=start,
+                               end_time=end)
+                    for _, course_id, number, days, start, end in chunk
+                ])
+                labs.update((row[0], copy.pk) for row, copy in zip(chunk, copies))
+            counts["LabSection"] = len(labs)
+
+            if include_assignments:
+                course_assignments = TACourseAssignment.objects.filter(course__semester=source).values_list(
+                    "course_id", "ta_id", "grader_status")
+                for chunk in _chunks(course_assignments):
+                    counts["TACourseAssignment"] += len(TACourseAssignment.objects.bulk_create([
+                        TACourseAssignment(course_id=courses[course_id], ta_id=ta_id, grader_status=grader_status)
+                        for course_id, ta_id, grader_status in chunk
+                    ]))
+                lab_assignments = TALabAssignment.objects.filter(lab_section__course__semester=source).values_list(
+                    "lab_section_id", "ta_id")
+                for chunk in _chunks(lab_assignments):
+                    counts["TALabAssignment"] += len(TALabAssignment.objects.bulk_create([
+                        TALabAssignment(lab_section_id=labs[lab_id], ta_id=ta_id) for lab_id, ta_id in chunk
+                    ]))
+        invalidate_schedule_caches()
+        return counts
+
+
+def _chunks(queryset):
+    chunk = []
+    for row in queryset.iterator(chunk_size=CLONE_CHUNK_SIZE):
+        chunk.append(row)
+        if len(chunk) == CLONE_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -1,5 +1,7 @@
+from django.db import connection
 from django.test import TestCase
-from ta_scheduler.models import Semester
+from django.test.utils import CaptureQueriesContext
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
 from core.semester_controller.SemesterController import SemesterController
 
 
@@ -138,4 +140,75 @@ class TestListSemester(TestCase):
         semesters = SemesterController.list_semester()
         self.assertEqual(len(semesters), 2)
         self.assertEqual(semesters[0].semester_name, "Fall 2023")
-        self.assertEqual(semesters[1].semester_name, "Spring 2024")
\ No newline at end of file
+        self.assertEqual(semesters[1].semester_name, "Spring 2024")
+
+class TestCloneSemester(TestCase):
+    def setUp(self):
+        self.source = Semester.objects.create(semester_name="Fall 2025", start_date="2025-09-01", end_date="2025-12-15")
+        self.instructor = User.objects.create(username="instructor", role="Instructor")
+        self.ta = User.objects.create(username="ta", role="TA")
+        course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=self.source)
+        CourseSection.objects.create(course=course, course_section_number=1, instructor=self.instructor,
+                                     days="MW", start_time="09:00", end_time="10:15")
+        lab = LabSection.objects.create(course=course, lab_section_number=801, days="TR",
+                                        start_time="11:00", end_time="12:50")
+        TACourseAssignment.objects.create(course=course, ta=self.ta, grader_status=True)
+        TALabAssignment.objects.create(lab_section=lab, ta=self.ta)
+
+    def clone(self, include_assignments=False, **overrides):
+        arguments = {"source_semester_name": "Fall 2025", "semester_name": "Fall 2026", "start_date": "2026-09-01",
+                     "end_date": "2026-12-15", "include_assignments": include_assignments, **overrides}
+        return SemesterController.clone_semester(**arguments)
+
+    def test_copies_courses_and_sections(self):
+        counts = self.clone()
+        self.assertEqual(counts, {"Course": 1, "CourseSection": 1, "LabSection": 1, "TACourseAssignment": 0,
+                                  "TALabAssignment": 0})
+        course = Course.objects.get(semester__semester_name="Fall 2026")
+        section = CourseSection.objects.get(course=course)
+        self.assertEqual((section.instructor, section.days, section.day_mask, section.start_time.strftime("%H:%M")),
+                         (self.instructor, "MW", 0b101, "09:00"))
+        self.assertEqual(LabSection.objects.get(course=course).lab_section_number, 801)
+        self.assertFalse(TACourseAssignment.objects.filter(course=course).exists())
+
+    def test_copies_assignments_when_asked(self):
+        self.clone(include_assignments=True)
+        course = Course.objects.get(semester__semester_name="Fall 2026")
+        self.assertTrue(TACourseAssignment.objects.get(course=course).grader_status)
+        self.assertEqual(TALabAssignment.objects.get(lab_section__course=course).ta, self.ta)
+        self.assertEqual(TALabAssignment.objects.count(), 2)
+
+    def test_invalid_requests_change_nothing(self):
+        with self.assertRaises(ValueError):
+            self.clone(source_semester_name="Spring 1900")
+        with self.assertRaises(ValueError):
+            self.clone(semester_name="Fall 2025")
+        with self.assertRaises(ValueError):
+            self.clone(start_date="2026-12-15", end_date="2026-09-01")
+        self.assertEqual(Semester.objects.count(), 1)
+
+    def test_query_count_independent_of_semester_size(self):
+        def count_queries(semester_name):
+            with CaptureQueriesContext(connection) as queries:
+                self.clone(include_assignments=True, semester_name=semester_name)
+            return len(queries)
+
+        small = count_queries("Fall 2026")
+        courses = Course.objects.bulk_create([
+            Course(course_code=f"BULK{i}", course_name=f"Bulk {i}", semester=self.source) for i in range(20)
+        ])
+        CourseSection.objects.bulk_create([
+            CourseSection(course=course, course_section_number=n, instructor=self.instructor, days="MWF",
+                          start_time="09:00", end_time="09:50")
+            for course in courses for n in range(1, 3)
+        ])
+        labs = LabSection.objects.bulk_create([
+            LabSection(course=course, lab_section_number=800 + n, days="TR", start_time="11:00", end_time="12:50")
+            for course in courses for n in range(3)
+        ])
+        TALabAssignment.objects.bulk_create([TALabAssignment(lab_section=lab, ta=self.ta) for lab in labs])
+        # every source row is read in one chunk and every model is written in one INSERT at both sizes
+        self.assertEqual(count_queries("Spring 2027"), small)
+        self.assertEqual(Course.objects.filter(semester__semester_name="Spring 2027").count(), 21)
+        self.assertEqual(TALabAssignment.objects.filter(lab_section__course__semester__semester_name="Spring 2027")
+                         .count(), 61)
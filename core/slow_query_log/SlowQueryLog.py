@@ -0,0 +1,190 @@
+import logging
+import re
+import sys
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from typing import Deque, List
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+from core.local_data_classes import SlowQuery
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD_MS = 100.0
+DEFAULT_LOG_SIZE = 100
+# Parameters kept per query, an IN list can have hundreds
+MAX_PARAMS = 50
+MAX_PARAM_LENGTH = 200
+
+# Statements SQLite can explain, anything else (SAVEPOINT, PRAGMA, ...) is recorded without a plan
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+_PROJECT_ROOT = str(Path(settings.BASE_DIR).resolve())
+_CORE_ROOT = str(Path(settings.BASE_DIR).resolve() / "core")
+
+
+class SlowQueryLog:
+    """
+    A ring buffer of recent slow queries: every query a request runs that takes at least
+    settings.SLOW_QUERY_MS is kept with its parameters, the controller function (or failing that the view) that ran
+    it and SQLite's EXPLAIN QUERY PLAN for it. Only the newest settings.SLOW_QUERY_LOG_SIZE are kept, and every
+    worker process keeps its own.
+    """
+    _lock = threading.Lock()
+    _entries: Deque[SlowQuery] = deque(maxlen=DEFAULT_LOG_SIZE)
+
+    @staticmethod
+    def record(query: SlowQuery) -> None:
+        """
+        Post-conditions: query is the newest entry, the oldest entry is dropped if the log is full
+        Side-effects: Updates the shared log and logs it at debug level
+        """
+        size = SlowQueryLog.size()
+        with SlowQueryLog._lock:
+            if SlowQueryLog._entries.maxlen != size:
+                SlowQueryLog._entries = deque(SlowQueryLog._entries, maxlen=size)
+            SlowQueryLog._entries.append(query)
+        logger.debug("Slow query (%.1f ms) in %s from %s: %s", query.duration_ms, query.path, query.caller,
+                       query.sql[:300])
+
+    @staticmethod
+    def entries() -> List[SlowQuery]:
+        """
+        Post-conditions: Returns the recorded queries, newest first
+        Side-effects: None
+        """
+        with SlowQueryLog._lock:
+            return list(reversed(SlowQueryLog._entries))
+
+    @staticmethod
+    def clear() -> None:
+        """
+        Post-conditions: The log is empty
+        Side-effects: Clears the shared log
+        """
+        with SlowQueryLog._lock:
+            SlowQueryLog._entries.clear()
+
+    @staticmethod
+    def threshold_ms() -> float:
+        return getattr(settings, "SLOW_QUERY_MS", DEFAULT_THRESHOLD_MS)
+
+    @staticmethod
+    def size() -> int:
+        return getattr(settings, "SLOW_QUERY_LOG_SIZE", DEFAULT_LOG_SIZE)
+
+    @staticmethod
+    def explain(sql: str, params) -> List[str]:
+        """
+        Pre-conditions: sql and params are a statement as passed to a database cursor
+        Post-conditions: Returns SQLite's EXPLAIN QUERY PLAN for the statement, one line per step indented under
+            its parent, or an empty list if the database isn't SQLite or the statement can't be explained
+        Side-effects: Runs the EXPLAIN on its own cursor, which bypasses execute wrappers
+        """
+        if connection.vendor != "sqlite" or not _EXPLAINABLE.match(sql):
+            return []
+        cursor = connection.create_cursor()
+        try:
+            with connection.wrap_database_errors:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                rows = cursor.fetchall()
+        except DatabaseError:
+            return []
+        finally:
+            cursor.close()
+        # rows are (id, parent, notused, detail), every parent listed before its children
+        depths, lines = {0: -1}, []
+        for step_id, parent, _, detail in rows:
+            depths[step_id] = depths.get(parent, -1) + 1
+            lines.append("  " * depths[step_id] + detail)
+        return lines
+
+
+class SlowQueryMiddleware:
+    """
+    Times every query a request runs with a database execute wrapper and records those over the threshold in
+    SlowQueryLog. Queries are explained once the response is ready, so explaining doesn't add to the time measured
+    for the queries that follow.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        collector = SlowQueryCollector(SlowQueryLog.threshold_ms())
+        with connection.execute_wrapper(collector):
+            response = self.get_response(request)
+        for sql, params, many, duration_ms, caller in collector.slow:
+            SlowQueryLog.record(SlowQuery(
+                sql=sql, params=_format_params(params, many), duration_ms=round(duration_ms, 3), caller=caller,
+                plan=[] if many else SlowQueryLog.explain(sql, params), path=f"{request.method} {request.path}",
+                recorded_at=timezone.now(),
+            ))
+        return response
+
+
+class SlowQueryCollector:
+    """
+    A database execute wrapper keeping each query that takes at least threshold_ms, with the function that ran it.
+    Only a slow query pays for looking up its caller, every other query costs two clock reads.
+    """
+    def __init__(self, threshold_ms: float):
+        self.threshold_ms = threshold_ms
+        self.slow = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            if duration_ms >= self.threshold_ms:
+                self.slow.append((sql, params, many, duration_ms, calling_function()))
+
+
+def calling_function() -> str:
+    """
+    Returns the innermost controller function on the current stack as "Class.function (file:line)", or the
+    innermost function of the project if no controller is on it. Execute wrappers and middleware are skipped,
+    they only wrap the code that ran the query.
+    """
+    frame, fallback = sys._getframe(1), None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_PROJECT_ROOT) and "site-packages" not in filename and filename not in _wrapper_files():
+            code = frame.f_code
+            name = (f"{getattr(code, 'co_qualname', code.co_name)} "
+                    f"({Path(filename).relative_to(_PROJECT_ROOT)}:{frame.f_lineno})")
+            if filename.startswith(_CORE_ROOT) and filename.endswith("Controller.py"):
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+@lru_cache(maxsize=None)
+def _wrapper_files() -> frozenset:
+    # this module and the project's middleware, whose execute wrappers run in front of this one
+    modules = [sys.modules[__name__]] + [import_module(path.rsplit(".", 1)[0]) for path in settings.MIDDLEWARE]
+    return frozenset(str(Path(module.__file__).resolve()) for module in modules)
+
+
+def _format_params(params, many: bool) -> List[str]:
+    if params is None:
+        return []
+    if many:
+        return [f"{len(params)} parameter sets"] if hasattr(params, "__len__") else []
+    values = list(params.values()) if isinstance(params, dict) else list(params)
+    formatted = [_truncate(repr(value)) for value in values[:MAX_PARAMS]]
+    if len(values) > MAX_PARAMS:
+        formatted.append(f"... {len(values) - MAX_PARAMS} more")
+    return formatted
+
+
+def _truncate(value: str) -> str:
+    return value if len(value) <= MAX_PARAM_LENGTH else value[:MAX_PARAM_LENGTH] + "..."
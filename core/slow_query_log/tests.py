@@ -0,0 +1,96 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.local_data_classes import SlowQuery
+from core.request_metrics.RequestMetrics import _QueryTimer
+from core.semester_controller.SemesterController import SemesterController
+from core.slow_query_log.SlowQueryLog import MAX_PARAMS, SlowQueryCollector, SlowQueryLog, _format_params
+from ta_scheduler.models import Course, Semester
+
+
+def slow_query(sql):
+    return SlowQuery(sql=sql, params=[], duration_ms=150.0, caller="caller", plan=[], path="GET /",
+                     recorded_at=timezone.now())
+
+
+class TestSlowQueryLog(TestCase):
+    def setUp(self):
+        SlowQueryLog.clear()
+
+    def tearDown(self):
+        SlowQueryLog.clear()
+
+    def test_newest_first(self):
+        SlowQueryLog.record(slow_query("SELECT 1"))
+        SlowQueryLog.record(slow_query("SELECT 2"))
+        self.assertEqual([query.sql for query in SlowQueryLog.entries()], ["SELECT 2", "SELECT 1"])
+
+    @override_settings(SLOW_QUERY_LOG_SIZE=3)
+    def test_ring_buffer_keeps_newest(self):
+        for n in range(5):
+            SlowQueryLog.record(slow_query(f"SELECT {n}"))
+        self.assertEqual([query.sql for query in SlowQueryLog.entries()], ["SELECT 4", "SELECT 3", "SELECT 2"])
+
+    def test_clear(self):
+        SlowQueryLog.record(slow_query("SELECT 1"))
+        SlowQueryLog.clear()
+        self.assertEqual(SlowQueryLog.entries(), [])
+
+    def test_explain_shows_index_use(self):
+        semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                           end_date=date(2025, 12, 15))
+        sql, params = Course.objects.filter(semester=semester).query.sql_with_params()
+        plan = SlowQueryLog.explain(sql, params)
+        self.assertTrue(plan)
+        self.assertTrue(any("USING INDEX" in line for line in plan), plan)
+
+    def test_explain_nested_steps(self):
+        plan = SlowQueryLog.explain("SELECT id FROM ta_scheduler_course WHERE semester_id IN "
+                                    "(SELECT id FROM ta_scheduler_semester WHERE semester_name = %s)", ["Fall 2025"])
+        self.assertTrue(any(line.startswith("  ") for line in plan), plan)
+
+    def test_explain_skips_other_statements(self):
+        self.assertEqual(SlowQueryLog.explain("SAVEPOINT s1", None), [])
+        self.assertEqual(SlowQueryLog.explain("SELECT * FROM missing_table", []), [])
+
+    def test_format_params(self):
+        self.assertEqual(_format_params(None, False), [])
+        self.assertEqual(_format_params(["Fall 2025", 3], False), ["'Fall 2025'", "3"])
+        self.assertEqual(_format_params([[1], [2]], True), ["2 parameter sets"])
+        formatted = _format_params(list(range(MAX_PARAMS + 5)), False)
+        self.assertEqual(len(formatted), MAX_PARAMS + 1)
+        self.assertEqual(formatted[-1], "... 5 more")
+
+
+class TestSlowQueryCollector(TestCase):
+    def test_records_queries_over_threshold_with_controller(self):
+        collector = SlowQueryCollector(0)
+        with connection.execute_wrapper(collector):
+            SemesterController.semester_exists("Fall 2025")
+        self.assertEqual(len(collector.slow), 1)
+        sql, params, many, duration_ms, caller = collector.slow[0]
+        self.assertIn("ta_scheduler_semester", sql)
+        self.assertFalse(many)
+        self.assertGreaterEqual(duration_ms, 0)
+        self.assertTrue(caller.startswith("SemesterController.semester_exists (core/semester_controller/"), caller)
+
+    def test_falls_back_to_project_function(self):
+        collector = SlowQueryCollector(0)
+        with connection.execute_wrapper(collector):
+            Semester.objects.count()
+        self.assertIn("test_falls_back_to_project_function", collector.slow[0][4])
+
+    def test_skips_wrappers_in_front(self):
+        collector = SlowQueryCollector(0)
+        with connection.execute_wrapper(_QueryTimer()), connection.execute_wrapper(collector):
+            Semester.objects.count()
+        self.assertIn("test_skips_wrappers_in_front", collector.slow[0][4])
+
+    def test_fast_queries_not_recorded(self):
+        collector = SlowQueryCollector(60 * 1000)
+        with connection.execute_wrapper(collector):
+            Semester.objects.count()
+        self.assertEqual(collector.slow, [])
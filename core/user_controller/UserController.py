@@ -1,8 +1,13 @@
 from django.core.exceptions import ValidationError, PermissionDenied, ObjectDoesNotExist
-from django.db import models
+from django.db import connection, models
+from django.db.models import Prefetch
+from django.db.models.expressions import RawSQL
 from django.shortcuts import get_object_or_404
 from core.local_data_classes import UserRef, LabSectionRef, UserProfile, PrivateUserProfile, CourseSectionRef, CourseOverview
-from ta_scheduler.models import User, Course, CourseSection, LabSection
+from ta_scheduler.models import User, Course, CourseSection, LabSection, TALabAssignment
+
+# The trigram tokenizer of the user search index can only answer substrings of at least this length
+USER_SEARCH_INDEX_MIN_LENGTH = 3
 
 """
 Helper Methods start with an underscore ______
@@ -30,8 +35,7 @@ class UserController:
             raise ValueError("Invalid requesting_user: must be a valid User instance")
 
         user = get_object_or_404(User, username=username)
-        course_ids = UserController._get_course_ids_based_on_role(user)
-        courses = Course.objects.filter(id__in=course_ids)
+        courses = UserController._get_profile_courses(user)
         course_overviews = UserController._construct_course_overviews(user, courses)
 
         return UserController._create_user_profile(user, requesting_user, course_overviews)
@@ -69,27 +73,41 @@ class UserController:
             skills = skills
         )
 
+    @staticmethod
+    def _get_profile_courses(user):
+        """
+        Returns the users assigned courses with the sections shown on their profile prefetched into
+        `profile_course_sections` and `profile_lab_sections`, so the whole profile is built from a
+        fixed number of queries however many courses the user has.
+        """
+        course_ids = UserController._get_course_ids_based_on_role(user)
+        course_sections = CourseSection.objects.select_related("instructor")
+        lab_sections = LabSection.objects.prefetch_related(
+            Prefetch("talabassignment_set", queryset=TALabAssignment.objects.select_related("ta"))
+        )
+        if user.role in ["Instructor", "Admin"]:
+            course_sections = course_sections.filter(instructor=user)
+        elif user.role == "TA":
+            lab_sections = lab_sections.filter(talabassignment_set__ta=user)
+
+        return Course.objects.filter(id__in=course_ids).select_related("semester").prefetch_related(
+            Prefetch("coursesection_set", queryset=course_sections, to_attr="profile_course_sections"),
+            Prefetch("labsection_set", queryset=lab_sections, to_attr="profile_lab_sections"),
+        )
+
     @staticmethod
     def _construct_course_overviews(user, courses):
-        course_overviews = []
-        for course in courses:
-            if user.role in ["Instructor", "Admin"]:
-                course_sections = CourseSection.objects.filter(course=course, instructor=user)
-                lab_sections = LabSection.objects.filter(course=course)
-            elif user.role == "TA":
-                course_sections = CourseSection.objects.filter(course=course)
-                lab_sections = LabSection.objects.filter(course=course, talabassignment_set__ta=user)
-
-            course_overviews.append(CourseOverview(
+        return [
+            CourseOverview(
                 code=course.course_code,
                 name=course.course_name,
                 semester=course.semester,
-                course_sections=UserController._get_course_section_refs(course_sections),
-                lab_sections=UserController._get_lab_section_refs(lab_sections),
+                course_sections=UserController._get_course_section_refs(course.profile_course_sections),
+                lab_sections=UserController._get_lab_section_refs(course.profile_lab_sections),
                 ta_list=[]
-            ))
-
-        return course_overviews
+            )
+            for course in courses
+        ]
 
     @staticmethod
     def _get_course_section_refs(course_sections):
@@ -103,17 +121,17 @@ class UserController:
 
     @staticmethod
     def _get_lab_section_refs(lab_sections):
-        return [
-            LabSectionRef(
+        lab_section_refs = []
+        for ls in lab_sections:
+            ta = ls.get_ta()
+            lab_section_refs.append(LabSectionRef(
                 section_number=str(ls.lab_section_number),
-                instructor=(
-                    UserRef(
-                        name=f"{ls.get_ta().first_name} {ls.get_ta().last_name}".strip(),
-                        username=ls.get_ta().username
-                    ) if ls.get_ta() else None)
-            )
-            for ls in lab_sections
-        ]
+                instructor=UserRef(
+                    name=f"{ta.first_name} {ta.last_name}".strip(),
+                    username=ta.username
+                ) if ta else None
+            ))
+        return lab_section_refs
 
     @staticmethod
     def saveUser(user_data, requesting_user):
@@ -213,17 +231,21 @@ class UserController:
             raise ValueError(f"User {username} does not exist.")
 
     @staticmethod
-    def searchUser(user_search_string="", user_role=None):
+    def searchUser(user_search_string="", user_role=None, limit=None, offset=0):
         """
         Preconditions:
         - 'user_search_string' must be a string and can be empty, representing partial or full user details
           (e.g., username, first name, or last name).
         - 'user_role', if provided, must be a valid role to filter users (e.g., 'Instructor', 'Admin', etc.).
+        - 'limit', if provided, must be a positive integer and 'offset' a non-negative integer.
 
         Postconditions:
         - Returns a list of users that match the search criteria:
           - Filters users based on the 'user_search_string' across 'username', 'first name', or 'last name'.
           - If 'user_role' is specified, the search results are further filtered by the role.
+          - Results are ranked: exact username matches first, then users with a field starting with the
+            search string, then any other match. Ties are ordered by username.
+          - If 'limit' is given, at most 'limit' users starting at 'offset' are returned.
         - If no users match the given criteria, an empty list is returned.
 
         Side-effects: None.
@@ -231,27 +253,95 @@ class UserController:
         Parameters:
         - user_search_string: A string used as the search query for matching user attributes.
         - user_role: (Optional) A string representing the role to filter users (e.g., 'Instructor').
+        - limit: (Optional) The maximum number of users to return.
+        - offset: (Optional) The number of ranked results to skip, used for pagination.
 
         Returns:
         - A list of `UserRef` objects:
           - Each `UserRef` object contains minimal user data (name and username) for display purposes.
         - Returns an empty list if no matching users are found.
         """
-
-        query = models.Q(username__icontains=user_search_string) | \
-                models.Q(first_name__icontains=user_search_string) | \
-                models.Q(last_name__icontains=user_search_string)
-
+        matching_users = User.objects.all()
         if user_role:
-            matching_users = User.objects.filter(query, role=user_role)
+            matching_users = matching_users.filter(role=user_role)
+
+        if user_search_string:
+            matching_users = UserController._filter_by_search_string(matching_users, user_search_string)
+            matching_users = matching_users.annotate(search_rank=models.Case(
+                models.When(username__iexact=user_search_string, then=models.Value(0)),
+                models.When(
+                    models.Q(username__istartswith=user_search_string) |
+                    models.Q(first_name__istartswith=user_search_string) |
+                    models.Q(last_name__istartswith=user_search_string),
+                    then=models.Value(1)
+                ),
+                default=models.Value(2),
+            )).order_by("search_rank", "username")
         else:
-            matching_users = User.objects.filter(query)
+            matching_users = matching_users.order_by("username")
+
+        if limit is not None:
+            matching_users = matching_users[offset:offset + limit]
 
         return [
             UserRef(name=f"{user.first_name} {user.last_name}", username=user.username)
-            for user in matching_users
+            for user in matching_users.only("username", "first_name", "last_name")
         ]
 
+    @staticmethod
+    def lookupUsers(usernames):
+        """
+        Preconditions:
+        - 'usernames' must be a list of strings.
+
+        Postconditions:
+        - Returns a `UserRef` for every username in 'usernames' that exactly matches an existing user, in the
+          order the usernames were given. Unknown or repeated usernames are skipped.
+
+        Side-effects: None.
+
+        Parameters:
+        - usernames: A list of usernames to resolve.
+
+        Returns:
+        - A list of `UserRef` objects, resolved with a single query.
+        """
+        users = {
+            user.username: user
+            for user in User.objects.filter(username__in=set(usernames)).only("username", "first_name", "last_name")
+        }
+        user_refs = []
+        for username in dict.fromkeys(usernames):
+            if username in users:
+                user = users[username]
+                user_refs.append(UserRef(name=f"{user.first_name} {user.last_name}", username=user.username))
+        return user_refs
+
+    @staticmethod
+    def _filter_by_search_string(users, user_search_string):
+        """
+        Preconditions: 'user_search_string' is a non-empty string.
+        Postconditions: Returns 'users' narrowed to those whose username, first name or last name contain
+        'user_search_string' (case-insensitive). On SQLite, strings of three or more characters are looked
+        up in the ta_scheduler_user_search trigram index instead of scanning the user table.
+        Side-effects: None.
+        Parameters:
+        - users: A User queryset to filter.
+        - user_search_string: The substring to look for.
+        Returns: A filtered User queryset.
+        """
+        if connection.vendor == "sqlite" and len(user_search_string) >= USER_SEARCH_INDEX_MIN_LENGTH:
+            # Quote the string as an FTS5 phrase so it is matched literally
+            phrase = '"' + user_search_string.replace('"', '""') + '"'
+            return users.filter(id__in=RawSQL(
+                "SELECT rowid FROM ta_scheduler_user_search WHERE ta_scheduler_user_search MATCH %s", (phrase,)
+            ))
+        return users.filter(
+            models.Q(username__icontains=user_search_string) |
+            models.Q(first_name__icontains=user_search_string) |
+            models.Q(last_name__icontains=user_search_string)
+        )
+
     @staticmethod
     def _request_permission_check(requesting_user, user_data, user_to_edit):
         """
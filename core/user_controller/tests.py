@@ -1,5 +1,6 @@
 import django
 from django.core.exceptions import ValidationError, PermissionDenied, ObjectDoesNotExist
+from django.db import connection
 from django.test import TestCase
 
 django.setup()
@@ -87,10 +88,11 @@ class TestGetUser(TestCase):
         self.instructor = _create_user("Instructor", 88888)
         self.ta = _create_user("TA", 99999)
         self.course = Course.objects.get(course_code='CS101')
-        _create_course_section(self.course, 0, self.instructor)
-        _create_course_section(self.course, 1, self.admin_user)
+        # CS101 already has sections 0-4 from _setup_database and section numbers are unique per course
+        _create_course_section(self.course, 5, self.instructor)
+        _create_course_section(self.course, 6, self.admin_user)
         _create_ta_course_assignment(self.course, self.ta)
-        self.lab_section = _create_lab_section(self.course, 0)
+        self.lab_section = _create_lab_section(self.course, 5)
         _create_lab_assignment(self.lab_section, self.ta)
 
     def test_validAssignments_for_instructor(self):
@@ -139,6 +141,36 @@ class TestGetUser(TestCase):
         self.assertEqual(profile.phone, user.phone)
 
 
+class TestGetUserQueryCount(TestCase):
+    def setUp(self):
+        self.admin_user = _create_user("Admin", 11111)
+        self.instructor = _create_user("Instructor", 88888)
+        self.ta = _create_user("TA", 99999)
+        semester = Semester.objects.create(
+            semester_name="semester_name", start_date=date(2024, 9, 1),
+            end_date=date(2024, 12, 15))
+        for course_number in range(20):
+            course = Course.objects.create(
+                course_code=f"CS{course_number}", course_name=f"Course {course_number}", semester=semester)
+            _create_course_section(course, 0, self.instructor)
+            _create_ta_course_assignment(course, self.ta)
+            for lab_number in range(5):
+                _create_lab_assignment(_create_lab_section(course, lab_number), self.ta)
+
+    def test_ta_profile_query_count(self):
+        with self.assertNumQueries(5):
+            profile = UserController.getUser(self.ta.username, self.admin_user)
+        self.assertEqual(len(profile.courses_assigned), 20)
+        self.assertEqual(sum(len(c.lab_sections) for c in profile.courses_assigned), 100)
+        self.assertEqual(profile.courses_assigned[0].lab_sections[0].instructor.username, self.ta.username)
+
+    def test_instructor_profile_query_count(self):
+        with self.assertNumQueries(5):
+            profile = UserController.getUser(self.instructor.username, self.admin_user)
+        self.assertEqual(len(profile.courses_assigned), 20)
+        self.assertEqual(sum(len(c.course_sections) for c in profile.courses_assigned), 20)
+
+
 class TestSearchUserCaseInsensitive(TestCase):
     def setUp(self):
         self.admin_user = User.objects.create_user(
@@ -253,6 +285,69 @@ class TestSearchUserCaseInsensitive(TestCase):
         self.assertEqual(len(result), 0, "Expected no users for an invalid role.")
 
 
+class TestSearchUserRanking(TestCase):
+    def setUp(self):
+        for username, first_name, last_name in [
+            ("zsmith", "Ann", "Smith"),
+            ("smith", "Bob", "Jones"),
+            ("asmithers", "Cal", "Blacksmith"),
+            ("dlee", "Smithy", "Lee"),
+            ("other", "No", "Match"),
+        ]:
+            User.objects.create(username=username, first_name=first_name, last_name=last_name, role="TA")
+
+    def test_exact_then_prefix_then_substring(self):
+        result = UserController.searchUser("smith")
+        self.assertEqual([user.username for user in result], ["smith", "dlee", "zsmith", "asmithers"])
+
+    def test_short_search_string(self):
+        result = UserController.searchUser("mi")
+        self.assertEqual({user.username for user in result}, {"zsmith", "smith", "asmithers", "dlee"})
+
+    def test_limit_and_offset(self):
+        first_page = UserController.searchUser("smith", limit=2)
+        second_page = UserController.searchUser("smith", limit=2, offset=2)
+        self.assertEqual([user.username for user in first_page + second_page],
+                         ["smith", "dlee", "zsmith", "asmithers"])
+
+    def test_index_follows_updates_and_deletes(self):
+        user = User.objects.get(username="other")
+        user.last_name = "Goldsmith"
+        user.save()
+        self.assertIn("other", [u.username for u in UserController.searchUser("smith")])
+        user.delete()
+        self.assertNotIn("other", [u.username for u in UserController.searchUser("smith")])
+        self.assertEqual(UserController.searchUser("Goldsmith"), [])
+
+
+class TestSearchUserAtScale(TestCase):
+    """
+    User search against a few thousand users, the search string lookups must come from the trigram index rather
+    than a scan of the user table. run_benchmarks times it against the synthetic data.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.bulk_create([
+            User(username=f"user{i:05d}", first_name=f"First{i}", last_name=f"Last{i % 97}",
+                 role="TA" if i % 3 else "Instructor")
+            for i in range(3000)
+        ], batch_size=1000)
+
+    def test_search_uses_index(self):
+        users = UserController._filter_by_search_string(User.objects.all(), "Last96")
+        sql, params = users.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn("VIRTUAL TABLE INDEX", plan)
+
+    def test_search_results_at_scale(self):
+        with self.assertNumQueries(1):
+            result = UserController.searchUser("Last96", user_role="TA", limit=20)
+        self.assertEqual(len(result), 20)
+        self.assertTrue(all(user.name.endswith("Last96") for user in result))
+
+
 class TestDeleteUser(TestCase):
     def setUp(self):
         self.course_list = [
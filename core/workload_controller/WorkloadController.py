@@ -0,0 +1,151 @@
+import operator
+from functools import reduce
+from typing import Dict, Iterable, List
+
+from django.core.cache import cache
+from django.db.models import Count, F, IntegerField, Q, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.generation_cache.GenerationCache import WORKLOADS
+from core.local_data_classes import UserRef, Workload
+from ta_scheduler.models import (Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment,
+                                 User)
+
+# Changes are applied to cached workloads on the next read, this only bounds how long an unread one is kept
+WORKLOAD_CACHE_SECONDS = 24 * 60 * 60
+_CHANGE_SEQ_KEY = "workload:change_seq"
+
+
+class WorkloadController:
+    """
+    Weekly contact hours and section and course counts per TA and instructor of a semester, summed by the database.
+
+    A semester's workloads are cached whole. Writes to TA lab and course assignments append the TA to a change
+    log, along with the TA an assignment was moved away from, and the next read recomputes only the users logged
+    since the cached copy was made. Any other write to a semester, course, section or user drops every cached copy.
+    """
+    @staticmethod
+    def get_semester_workload(semester_name: str) -> List[Workload]:
+        """
+        Pre-conditions: A semester with the given name exists, otherwise a ValueError is raised
+        Post-conditions: Returns the workload of every TA assigned to a course or lab and every instructor of a
+            section in the semester, most weekly hours first
+        Side-effects: May store the workloads in the cache
+        """
+        try:
+            semester = Semester.objects.only("id").get(semester_name=semester_name)
+        except Semester.DoesNotExist:
+            raise ValueError(f"Semester '{semester_name}' does not exist.")
+
+        key = WORKLOADS.key(str(semester.id))
+        snapshot = cache.get(key)
+        seq = WorkloadController._change_seq()
+        if snapshot is None:
+            snapshot = {"seq": seq, "rows": _compute(semester.id)}
+            cache.set(key, snapshot, WORKLOAD_CACHE_SECONDS)
+        elif snapshot["seq"] < seq:
+            changes = cache.get_many([f"workload:change:{n}" for n in range(snapshot["seq"] + 1, seq + 1)])
+            if len(changes) < seq - snapshot["seq"]:
+                # part of the log expired, so which users changed is unknown
+                rows = _compute(semester.id)
+            else:
+                user_ids = set(changes.values())
+                rows = {user_id: row for user_id, row in snapshot["rows"].items() if user_id not in user_ids}
+                rows.update(_compute(semester.id, user_ids))
+            snapshot = {"seq": seq, "rows": rows}
+            cache.set(key, snapshot, WORKLOAD_CACHE_SECONDS)
+        return sorted(snapshot["rows"].values(), key=lambda row: (-row.weekly_hours, row.user.username))
+
+    @staticmethod
+    def record_change(user_id: int) -> None:
+        """
+        Post-conditions: The user's workload is recomputed on the next read of any cached semester
+        Side-effects: Appends the user to the change log in the cache
+        """
+        seq = WorkloadController._next_change_seq()
+        cache.set(f"workload:change:{seq}", user_id, WORKLOAD_CACHE_SECONDS)
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """
+        Post-conditions: Every cached workload is unreachable and will be recomputed on next access
+        Side-effects: Moves the cache to a new generation of workload keys
+        """
+        WORKLOADS.invalidate_all()
+
+    @staticmethod
+    def _change_seq():
+        return cache.get_or_set(_CHANGE_SEQ_KEY, 0, None)
+
+    @staticmethod
+    def _next_change_seq():
+        try:
+            return cache.incr(_CHANGE_SEQ_KEY)
+        except ValueError:
+            # the sequence was lost, so the logged changes can't be trusted either
+            WorkloadController.invalidate_all()
+            cache.set(_CHANGE_SEQ_KEY, 1, None)
+            return 1
+
+
+def _weekly_minutes(prefix: str = ""):
+    # (end - start) times the number of bits set in the day mask
+    day_count = reduce(operator.add, (F(f"{prefix}day_mask").bitrightshift(day).bitand(1) for day in range(7)))
+    return Sum((F(f"{prefix}end_minute") - F(f"{prefix}start_minute")) * day_count, output_field=IntegerField())
+
+
+def _compute(semester_id: int, user_ids: Iterable[int] | None = None) -> Dict[int, Workload]:
+    labs = TALabAssignment.objects.filter(lab_section__course__semester_id=semester_id)
+    courses = TACourseAssignment.objects.filter(course__semester_id=semester_id)
+    sections = CourseSection.objects.filter(course__semester_id=semester_id)
+    if user_ids is not None:
+        labs, courses = labs.filter(ta_id__in=user_ids), courses.filter(ta_id__in=user_ids)
+        sections = sections.filter(instructor_id__in=user_ids)
+
+    totals: Dict[int, Dict[str, int]] = {}
+
+    def add(user_id, **counts):
+        user_totals = totals.setdefault(user_id, {"minutes": 0, "lab_sections": 0, "course_sections": 0,
+                                                  "courses": 0, "graded_courses": 0})
+        for name, count in counts.items():
+            user_totals[name] += count or 0
+
+    for row in labs.values("ta_id").annotate(count=Count("id"), minutes=_weekly_minutes("lab_section__")):
+        add(row["ta_id"], lab_sections=row["count"], minutes=row["minutes"])
+    for row in courses.values("ta_id").annotate(count=Count("course_id", distinct=True),
+                                                graded=Count("course_id", distinct=True, filter=Q(grader_status=True))):
+        add(row["ta_id"], courses=row["count"], graded_courses=row["graded"])
+    for row in sections.values("instructor_id").annotate(count=Count("id"), courses=Count("course_id", distinct=True),
+                                                         minutes=_weekly_minutes()):
+        add(row["instructor_id"], course_sections=row["count"], courses=row["courses"], minutes=row["minutes"])
+
+    users = User.objects.filter(pk__in=totals).only("username", "first_name", "last_name", "role")
+    return {user.pk: Workload(user=UserRef(name=f"{user.first_name} {user.last_name}", username=user.username),
+                              role=user.role,
+                              weekly_hours=round(totals[user.pk]["minutes"] / 60, 2),
+                              lab_sections=totals[user.pk]["lab_sections"],
+                              course_sections=totals[user.pk]["course_sections"],
+                              courses=totals[user.pk]["courses"],
+                              graded_courses=totals[user.pk]["graded_courses"])
+            for user in users}
+
+
+@receiver(pre_save, sender=TALabAssignment)
+@receiver(pre_save, sender=TACourseAssignment)
+def _remember_previous_ta(sender, instance, raw=False, **kwargs):
+    # an assignment moved to another TA, like update_or_create does, changes the previous TA's workload too
+    if instance.pk is not None and not raw:
+        instance._previous_ta_id = sender.objects.filter(pk=instance.pk).values_list("ta_id", flat=True).first()
+
+
+@receiver([post_save, post_delete], sender=TALabAssignment)
+@receiver([post_save, post_delete], sender=TACourseAssignment)
+def _record_assignment_change(sender, instance, **kwargs):
+    previous_ta_id = instance.__dict__.pop("_previous_ta_id", None)
+    if previous_ta_id is not None and previous_ta_id != instance.ta_id:
+        WorkloadController.record_change(previous_ta_id)
+    WorkloadController.record_change(instance.ta_id)
+
+
+WORKLOADS.invalidate_on_write(Semester, Course, CourseSection, LabSection, User)
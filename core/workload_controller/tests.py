@@ -0,0 +1,86 @@
+from datetime import date, time
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.local_data_classes import UserRef
+from core.section_controller.SectionController import SectionController
+from core.workload_controller.WorkloadController import WorkloadController
+from ta_scheduler.models import Course, CourseSection, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+
+
+class TestSemesterWorkload(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                                end_date=date(2025, 12, 15))
+        self.course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=self.semester)
+        self.instructor = User.objects.create(username="instructor", first_name="Ida", last_name="Ng",
+                                              role="Instructor")
+        self.ta = User.objects.create(username="ta", role="TA")
+        # 75 minutes twice a week
+        CourseSection.objects.create(course=self.course, course_section_number=1, instructor=self.instructor,
+                                     days="MW", start_time=time(9, 0), end_time=time(10, 15))
+        TACourseAssignment.objects.create(course=self.course, ta=self.ta, grader_status=False)
+        self.lab = LabSection.objects.create(course=self.course, lab_section_number=801, days="TR",
+                                             start_time=time(11, 0), end_time=time(12, 0))
+        TALabAssignment.objects.create(lab_section=self.lab, ta=self.ta)
+
+    def rows(self):
+        return [(w.user.username, w.role, w.weekly_hours, w.lab_sections, w.course_sections, w.courses,
+                 w.graded_courses) for w in WorkloadController.get_semester_workload("Fall 2025")]
+
+    def test_aggregates_hours_and_counts(self):
+        self.assertEqual(self.rows(), [
+            ("instructor", "Instructor", 2.5, 0, 1, 1, 0),
+            ("ta", "TA", 2.0, 1, 0, 1, 0),
+        ])
+
+    def test_other_semesters_and_unparseable_days_ignored(self):
+        other = Semester.objects.create(semester_name="Spring 2026", start_date=date(2026, 1, 20),
+                                        end_date=date(2026, 5, 10))
+        other_course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=other)
+        TALabAssignment.objects.create(ta=self.ta, lab_section=LabSection.objects.create(
+            course=other_course, lab_section_number=801, days="MWF", start_time=time(8, 0), end_time=time(9, 0)))
+        tba = LabSection.objects.create(course=self.course, lab_section_number=802, days="TBA",
+                                        start_time=time(8, 0), end_time=time(9, 0))
+        TALabAssignment.objects.create(lab_section=tba, ta=self.ta)
+        self.assertIn(("ta", "TA", 2.0, 2, 0, 1, 0), self.rows())
+
+    def test_cached_until_changed(self):
+        self.rows()
+        with self.assertNumQueries(1):
+            self.rows()
+
+    def test_assignment_change_refreshes_only_that_user(self):
+        self.rows()
+        grader = User.objects.create(username="grader", role="TA")
+        TACourseAssignment.objects.create(course=self.course, ta=grader, grader_status=True)
+        TALabAssignment.objects.filter(ta=self.ta).delete()
+        with self.assertNumQueries(5):
+            rows = self.rows()
+        self.assertEqual(rows[1:], [("grader", "TA", 0.0, 0, 0, 1, 1), ("ta", "TA", 0.0, 0, 0, 1, 0)])
+
+    def test_reassigned_lab_leaves_previous_ta(self):
+        other = User.objects.create(username="other", role="TA")
+        self.rows()
+        SectionController.assign_instructor_or_ta("Lab", 801, "CS361", "Fall 2025", UserRef(name="", username="other"))
+        rows = self.rows()
+        self.assertIn(("ta", "TA", 0.0, 0, 0, 1, 0), rows)
+        self.assertIn(("other", "TA", 2.0, 1, 0, 0, 0), rows)
+
+    def test_section_change_recomputes(self):
+        self.rows()
+        self.lab.end_time = time(13, 0)
+        self.lab.save()
+        self.assertIn(("ta", "TA", 4.0, 1, 0, 1, 0), self.rows())
+
+    def test_lost_change_log_recomputes(self):
+        self.rows()
+        TALabAssignment.objects.filter(ta=self.ta).delete()
+        cache.delete(f"workload:change:{cache.get('workload:change_seq')}")
+        self.assertIn(("ta", "TA", 0.0, 0, 0, 1, 0), self.rows())
+
+    def test_unknown_semester(self):
+        with self.assertRaises(ValueError):
+            WorkloadController.get_semester_workload("Spring 1900")
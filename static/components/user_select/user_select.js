@@ -1,49 +1,108 @@
 const selectedUsers = [ ];
 
+const SEARCH_DEBOUNCE_MS = 250;
+const SEARCH_CACHE_SIZE = 50;
+// Recent search results keyed by request url. Map keeps insertion order, so the first key is the least recently used
+const searchCache = new Map();
+let searchController = null;
+let searchDebounceTimer = null;
+
+function getCachedSearch(url) {
+    if (!searchCache.has(url)) return undefined;
+    const data = searchCache.get(url);
+    // Re-insert to mark as most recently used
+    searchCache.delete(url);
+    searchCache.set(url, data);
+    return data;
+}
+
+function cacheSearch(url, data) {
+    searchCache.delete(url);
+    searchCache.set(url, data);
+    if (searchCache.size > SEARCH_CACHE_SIZE) {
+        searchCache.delete(searchCache.keys().next().value);
+    }
+}
+
 function fetchUsers(query = "") {
-    fetch(`/api/search/user` + (search_role ? ("/" + search_role) : "") + `/?query=${encodeURIComponent(query)}`)
+    const url = `/api/search/user` + (search_role ? ("/" + search_role) : "") + `/?query=${encodeURIComponent(query)}`;
+
+    // Cancel the previous request so a slow stale response can't overwrite newer results
+    if (searchController) searchController.abort();
+    searchController = null;
+
+    const cached = getCachedSearch(url);
+    if (cached) {
+        displayUsers(cached);
+        return;
+    }
+
+    const controller = new AbortController();
+    searchController = controller;
+    fetch(url, { signal: controller.signal })
         .then((response) => response.json())
         .then((data) => {
-            const resultsContainer = document.getElementById("dynamic-results");
-            resultsContainer.innerHTML = "";
-            let displayedUsers = 0;
-
-            // Display results
-            data.forEach((user) => {
-                if (selectedUsers.find((u) => u.username === user.username)) return; // Don't show selected users
-                if (!displayedUsers) {
-                    const header = document.createElement("div");
-                    header.style = "text-decoration: underline"
-                    header.innerHTML = `
-                        <p style="width: 130px; display: inline-block; text-decoration: underline;">Username</p>Full Name
-                    `;
-                    resultsContainer.appendChild(header);
-                }
-                displayedUsers++;
-                const userDiv = document.createElement("div");
-                userDiv.classList.add("result-item");
-                userDiv.innerHTML = `
-                    <li id="${"user-" + user.username}">
-                        <p><a
-                            href="/profile/${user.username}" 
-                            style=" display: inline-block; width: 100px; text-overflow: clip; margin-right: 30px; color: black;"
-                        >${user.username}</a> ${user.name}
-                        <button type="button">Select</button></p>
-                    </li>
-                `;
-                userDiv.onclick = function() {selectUser(user)}
-                resultsContainer.appendChild(userDiv);
-            });
-            // Handle no results case
-            if (displayedUsers === 0) {
-                resultsContainer.innerHTML = "<p>No users found.</p>";
-            }
+            cacheSearch(url, data);
+            displayUsers(data);
         })
         .catch((error) => {
+            if (error.name === "AbortError") return;
             console.error("Error fetching user data:", error);
+        })
+        .finally(() => {
+            if (searchController === controller) searchController = null;
         });
 }
 
+function fetchUsersDebounced(query = "") {
+    clearTimeout(searchDebounceTimer);
+    searchDebounceTimer = setTimeout(() => fetchUsers(query), SEARCH_DEBOUNCE_MS);
+}
+
+function displayUsers(data) {
+    const resultsContainer = document.getElementById("dynamic-results");
+    resultsContainer.innerHTML = "";
+    let displayedUsers = 0;
+
+    // Display results
+    data.forEach((user) => {
+        if (selectedUsers.find((u) => u.username === user.username)) return; // Don't show selected users
+        if (!displayedUsers) {
+            const header = document.createElement("div");
+            header.style = "text-decoration: underline"
+            header.innerHTML = `
+                <p style="width: 130px; display: inline-block; text-decoration: underline;">Username</p>Full Name
+            `;
+            resultsContainer.appendChild(header);
+        }
+        displayedUsers++;
+        const userDiv = document.createElement("div");
+        userDiv.classList.add("result-item");
+        userDiv.innerHTML = `
+            <li id="${"user-" + user.username}">
+                <p><a
+                    href="/profile/${user.username}" 
+                    style=" display: inline-block; width: 100px; text-overflow: clip; margin-right: 30px; color: black;"
+                >${user.username}</a> ${user.name}
+                <button type="button">Select</button></p>
+            </li>
+        `;
+        userDiv.onclick = function() {selectUser(user)}
+        resultsContainer.appendChild(userDiv);
+    });
+    // Handle no results case
+    if (displayedUsers === 0) {
+        resultsContainer.innerHTML = "<p>No users found.</p>";
+    }
+}
+
+function startUserSearch() {
+    document.getElementById("search-input").addEventListener("input", function () {
+        fetchUsersDebounced(this.value);
+    });
+    fetchUsers();
+}
+
 function deselectUser(user) {
     const index = selectedUsers.indexOf(user)
     if (index === -1) return // Couldn't find user
@@ -96,29 +155,47 @@ function updateSelectVisibility() {
     document.getElementById("user-selection-container").style = selectedUsers.length >= max_users ? "display: none" : "display: block"
 }
 
-prefilled_user_list = document.getElementById("selected-users-form-control").value.split(",")
-prefilled_user_list = prefilled_user_list.filter(n => n)
-
-var prefilled_user_loaded_count = 0
-for (let u of prefilled_user_list) {
-    if (u !== "") {
-        fetch(`/api/search/user/?query=${encodeURIComponent(u)}`)
-        .then((response) => response.json())
+function loadPreselectedUsers(usernames) {
+    // Resolve every preselected username with one exact-match request
+    fetch(`/api/lookup/user/?usernames=${encodeURIComponent(usernames.join(","))}`)
+        .then((response) => {
+            if (!response.ok) throw new Error(`Lookup failed with status ${response.status}`);
+            return response.json();
+        })
         .then((data) => {
-            selectUser(data[0], true)
-            prefilled_user_loaded_count++;
-            if (prefilled_user_loaded_count === prefilled_user_list.length) {
-                document.getElementById("search-input").addEventListener("input", function () {
-                    fetchUsers(this.value);
-                });
-
-                window.addEventListener("DOMContentLoaded", function () {
-                    fetchUsers();
-                });
-                fetchUsers();
-            }
+            data.forEach((user) => selectUser(user, true));
+            // Drop any preselected usernames that no longer exist
+            document.getElementById("selected-users-form-control").value = selectedUsers.map(u => u.username).join(',')
+            startUserSearch();
         })
-    }
+        .catch((error) => {
+            console.error("Error fetching preselected users:", error);
+            showLookupError(usernames);
+        });
+}
+
+function showLookupError(usernames) {
+    // The search stays off until the lookup succeeds, selecting a user would otherwise drop the unresolved ones
+    const resultsContainer = document.getElementById("dynamic-results");
+    resultsContainer.innerHTML = "";
+    const message = document.createElement("p");
+    message.textContent = "Couldn't load the selected users. ";
+    const retryButton = document.createElement("button");
+    retryButton.type = "button";
+    retryButton.textContent = "Retry";
+    retryButton.onclick = function () {
+        resultsContainer.innerHTML = "<p>Loading selected users...</p>";
+        loadPreselectedUsers(usernames);
+    };
+    message.appendChild(retryButton);
+    resultsContainer.appendChild(message);
 }
 
-if (!prefilled_user_list.length) fetchUsers();
\ No newline at end of file
+prefilled_user_list = document.getElementById("selected-users-form-control").value.split(",")
+prefilled_user_list = prefilled_user_list.filter(n => n)
+
+if (prefilled_user_list.length) {
+    loadPreselectedUsers(prefilled_user_list);
+} else {
+    startUserSearch();
+}
@@ -1,12 +1,33 @@
-function fetchUsers(query = "") {
-    fetch(`/api/search/user/?query=${encodeURIComponent(query)}`)
-        .then((response) => response.json())
-        .then((data) => {
+// Query and next page of the user search being shown, a response for an older query is ignored
+const userSearch = {query: "", nextPage: null, loading: false};
+
+function fetchUsers(query = "", page = 1) {
+    if (page === 1) {
+        userSearch.query = query;
+    } else if (userSearch.loading) {
+        return;
+    }
+    userSearch.loading = true;
+    const params = new URLSearchParams({query: query, page: page});
+    fetch(`/api/search/user/?${params}`)
+        .then((response) => {
+            const nextPage = response.headers.get("X-Next-Page");
+            return response.json().then((data) => [data, nextPage]);
+        })
+        .then(([data, nextPage]) => {
+            if (query !== userSearch.query) {
+                return;
+            }
             const resultsContainer = document.getElementById("dynamic-results");
-            resultsContainer.innerHTML = "";
+            const button = document.getElementById("users-load-more");
+            if (page === 1) {
+                resultsContainer.innerHTML = "";
+            }
+            userSearch.nextPage = nextPage;
+            button.hidden = !nextPage;
 
             // Handle no results case
-            if (data.length === 0) {
+            if (page === 1 && data.length === 0) {
                 resultsContainer.innerHTML = "<p>No users found.</p>";
                 return;
             }
@@ -26,12 +47,104 @@ function fetchUsers(query = "") {
         })
         .catch((error) => {
             console.error("Error fetching user data:", error);
+        })
+        .finally(() => {
+            if (query === userSearch.query) {
+                userSearch.loading = false;
+            }
         });
 }
-document.getElementById("search-input").addEventListener("input", function () {
-    fetchUsers(this.value);
-});
 
-window.addEventListener("DOMContentLoaded", function () {
-    fetchUsers();
-});
\ No newline at end of file
+function fetchMoreUsers() {
+    if (userSearch.nextPage) {
+        fetchUsers(userSearch.query, Number(userSearch.nextPage));
+    }
+}
+
+function courseItem(course, semester) {
+    const item = document.createElement("li");
+    const codeParagraph = document.createElement("p");
+    const link = document.createElement("a");
+    link.href = `/course/${encodeURIComponent(course.course_code)}/${encodeURIComponent(semester)}/`;
+    link.textContent = course.course_code;
+    codeParagraph.appendChild(link);
+    item.appendChild(codeParagraph);
+    [course.course_name, semester].forEach((text) => {
+        const paragraph = document.createElement("p");
+        paragraph.textContent = text;
+        item.appendChild(paragraph);
+    });
+    return item;
+}
+
+// Fetches the next page of a semester group's courses, starting from its cursor
+function loadCourses(group) {
+    if (group.dataset.loading === "true") {
+        return;
+    }
+    group.dataset.loading = "true";
+    const params = new URLSearchParams({semester: group.dataset.semester, query: group.dataset.query});
+    if (group.dataset.nextCursor) {
+        params.set("after", group.dataset.nextCursor);
+    }
+    const button = group.querySelector(".load-more");
+    fetch(`/api/search/course/?${params}`)
+        .then((response) => {
+            const nextCursor = response.headers.get("X-Next-Cursor");
+            return response.json().then((data) => [data, nextCursor]);
+        })
+        .then(([data, nextCursor]) => {
+            const list = group.querySelector(".result");
+            data.forEach((course) => list.appendChild(courseItem(course, group.dataset.semester)));
+            group.dataset.loaded = "true";
+            group.dataset.nextCursor = nextCursor || "";
+            button.hidden = !nextCursor;
+        })
+        .catch((error) => {
+            console.error("Error fetching course data:", error);
+        })
+        .finally(() => {
+            group.dataset.loading = "false";
+        });
+}
+
+const searchInput = document.getElementById("search-input");
+if (searchInput) {
+    searchInput.addEventListener("input", function () {
+        fetchUsers(this.value);
+    });
+
+    window.addEventListener("DOMContentLoaded", function () {
+        fetchUsers();
+    });
+
+    // The next page of users loads when the button scrolls into view, the same way course pages do
+    const usersButton = document.getElementById("users-load-more");
+    usersButton.addEventListener("click", fetchMoreUsers);
+    new IntersectionObserver((entries) => {
+        entries.forEach((entry) => {
+            if (entry.isIntersecting && !entry.target.hidden) {
+                fetchMoreUsers();
+            }
+        });
+    }).observe(usersButton);
+}
+
+// Collapsed semesters load their courses when first opened, and the next page loads when its button scrolls into view
+const nextPageObserver = new IntersectionObserver((entries) => {
+    entries.forEach((entry) => {
+        if (entry.isIntersecting && !entry.target.hidden) {
+            loadCourses(entry.target.closest(".semester-group"));
+        }
+    });
+});
+document.querySelectorAll(".semester-group").forEach((group) => {
+    const button = group.querySelector(".load-more");
+    group.addEventListener("toggle", () => {
+        if (group.open && group.dataset.loaded === "false") {
+            loadCourses(group);
+        }
+    });
+    button.addEventListener("click", () => loadCourses(group));
+    nextPageObserver.observe(button);
+});
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.assignment_controller.AssignmentController import AssignmentController
+
+
+class Command(BaseCommand):
+    help = (
+        "Proposes a TA for every lab section of a semester without one, from the course's non-grader TAs, avoiding "
+        "time conflicts and balancing load. Only prints the proposals unless --apply is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("semester", help="name of the semester to fill")
+        parser.add_argument("--apply", action="store_true", help="save the proposed assignments")
+
+    def handle(self, *args, **options):
+        try:
+            if options["apply"]:
+                proposals = AssignmentController.apply_lab_assignments(options["semester"])
+            else:
+                proposals = AssignmentController.propose_lab_assignments(options["semester"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        for proposal in proposals:
+            lab = f"{proposal.course_code} lab {proposal.lab_section_number}"
+            if proposal.ta:
+                self.stdout.write(f"{lab}: {proposal.ta.username}")
+            else:
+                self.stdout.write(self.style.WARNING(f"{lab}: unassigned, {proposal.reason}"))
+        assigned = sum(1 for proposal in proposals if proposal.ta)
+        verb = "Assigned" if options["apply"] else "Would assign"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {assigned} of {len(proposals)} unassigned labs"))
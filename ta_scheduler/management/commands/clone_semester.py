@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.semester_controller.SemesterController import SemesterController
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates a new semester with a copy of every course, course section and lab section of an existing one, "
+        "optionally with its TA assignments, in a single transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="name of the semester to copy")
+        parser.add_argument("semester", help="name of the new semester")
+        parser.add_argument("start_date", help="start date of the new semester, YYYY-MM-DD")
+        parser.add_argument("end_date", help="end date of the new semester, YYYY-MM-DD")
+        parser.add_argument("--with-assignments", action="store_true", help="also copy TA course and lab assignments")
+
+    def handle(self, *args, **options):
+        try:
+            counts = SemesterController.clone_semester(options["source"], options["semester"], options["start_date"],
+                                                       options["end_date"], options["with_assignments"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        for model_name, count in counts.items():
+            self.stdout.write(f"{model_name}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Created {options['semester']} from {options['source']}"))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.export_controller.ExportController import ExportController
+from core.import_controller.ImportController import IMPORT_FORMATS
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports a semester's courses, sections and TA assignments as csv or json, in the format read by "
+        "import_schedule. Rows are streamed, so memory use stays flat for large semesters."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("semester", help="name of the semester to export")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, default="csv")
+        parser.add_argument("--output", help="file to write to, defaults to stdout")
+
+    def handle(self, *args, **options):
+        try:
+            chunks = ExportController.stream_export(options["semester"], options["format"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        if options["output"]:
+            with open(options["output"], "w", newline="", encoding="utf-8") as output:
+                output.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark.SyntheticData import SyntheticData
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates users, semesters, courses, sections and TA assignments with realistic names, meeting times and "
+        "load for benchmarking, e.g. 5k users, 20 semesters, 10k courses and 50k sections by default. The same seed "
+        "always generates the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=5000)
+        parser.add_argument("--semesters", type=int, default=20)
+        parser.add_argument("--courses", type=int, default=10000, help="courses across all semesters")
+        parser.add_argument("--sections", type=int, default=50000,
+                            help="course and lab sections across all courses")
+        parser.add_argument("--first-year", type=int, default=2016, help="year of the first semester")
+        parser.add_argument("--password", default="password", help="password every generated user logs in with")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        try:
+            counts = SyntheticData.generate(options["users"], options["semesters"], options["courses"],
+                                            options["sections"], options["first_year"], options["password"],
+                                            options["seed"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        for model_name, count in counts.items():
+            self.stdout.write(f"{model_name}: {count}")
+        self.stdout.write(self.style.SUCCESS("Generated synthetic data"))
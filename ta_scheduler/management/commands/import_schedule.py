@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.import_controller.ImportController import (
+    DEFAULT_IMPORT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    ROW_TYPES,
+    ImportController,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk imports semesters, courses, sections and TA assignments from a csv or json file. "
+        "Each row names its type in a 'type' column, see ImportController.import_rows for the columns of each type."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="csv or json file to import")
+        parser.add_argument("--format", choices=IMPORT_FORMATS,
+                            help="file format, guessed from the file extension when omitted")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_IMPORT_BATCH_SIZE,
+                            help="rows validated and written per transaction")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format not in IMPORT_FORMATS:
+            raise CommandError(f"Cannot tell the format of '{path}', pass --format.")
+        try:
+            with path.open(newline="", encoding="utf-8-sig") as stream:
+                result = ImportController.import_rows(ImportController.read_rows(stream, file_format),
+                                                      batch_size=options["batch_size"])
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for row_type in ROW_TYPES:
+            self.stdout.write(f"{row_type}: {result.created[row_type]} created, {result.updated[row_type]} updated")
+        for error in result.errors:
+            self.stderr.write(f"row {error.row}: {error.message}")
+        if result.errors:
+            self.stdout.write(self.style.WARNING(f"{len(result.errors)} rows were not imported"))
+        else:
+            self.stdout.write(self.style.SUCCESS("All rows imported"))
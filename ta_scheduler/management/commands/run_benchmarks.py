@@ -0,0 +1,81 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark.Benchmark import DEFAULT_ITERATIONS, DEFAULT_TOLERANCE, Benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Times every controller entry point and the main views against the current database, prints the 50th, 90th "
+        "and 99th percentile of each in milliseconds and compares them with a stored JSON baseline. Run "
+        "generate_synthetic_data first to benchmark at scale, and --save-baseline to store the results to compare "
+        "later runs with."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="timed runs per benchmark")
+        parser.add_argument("--semester", help="semester to benchmark, defaults to the one with the most courses")
+        parser.add_argument("--only", help="only run the benchmarks whose name contains this")
+        parser.add_argument("--baseline", default=str(Path(settings.BASE_DIR) / "benchmark_baseline.json"),
+                            help="JSON baseline to compare with or save to")
+        parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+        parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                            help="fraction a median may grow by before it counts as a regression")
+        parser.add_argument("--fail-on-regression", action="store_true",
+                            help="exit with an error if any benchmark regressed")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+        try:
+            results = Benchmark.run(options["iterations"], options["semester"], options["only"])
+        except ValueError as e:
+            raise CommandError(str(e))
+        scale = Benchmark.scale()
+        baseline_path = Path(options["baseline"])
+
+        if options["save_baseline"]:
+            baseline_path.write_text(json.dumps({"scale": scale, "results": [asdict(result) for result in results]},
+                                                indent=2) + "\n")
+            self._write_results(results, {})
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {baseline_path}"))
+            return
+        if not baseline_path.exists():
+            self._write_results(results, {})
+            self.stdout.write(f"No baseline at {baseline_path}, run with --save-baseline to store one")
+            return
+
+        baseline = json.loads(baseline_path.read_text())
+        if baseline["scale"] != scale:
+            self.stdout.write(self.style.WARNING(f"The baseline was measured on different data: {baseline['scale']}"))
+        comparisons = {comparison.name: comparison for comparison in
+                       Benchmark.compare(results, {result["name"]: result for result in baseline["results"]},
+                                         options["tolerance"])}
+        self._write_results(results, comparisons)
+        regressed = [name for name, comparison in comparisons.items() if comparison.regressed]
+        if not regressed:
+            self.stdout.write(self.style.SUCCESS(f"No regressions against {baseline_path}"))
+        elif options["fail_on_regression"]:
+            raise CommandError(f"{len(regressed)} benchmark(s) regressed: {', '.join(regressed)}")
+        else:
+            self.stdout.write(self.style.ERROR(f"{len(regressed)} benchmark(s) regressed: {', '.join(regressed)}"))
+
+    def _write_results(self, results, comparisons):
+        width = max(len(result.name) for result in results) if results else 0
+        self.stdout.write(f"{'benchmark':<{width}}  {'p50 ms':>9}  {'p90 ms':>9}  {'p99 ms':>9}  {'max ms':>9}  "
+                          f"{'queries':>7}  {'vs baseline':>11}")
+        for result in results:
+            line = (f"{result.name:<{width}}  {result.p50_ms:>9.2f}  {result.p90_ms:>9.2f}  {result.p99_ms:>9.2f}  "
+                    f"{result.max_ms:>9.2f}  {result.queries:>7}")
+            comparison = comparisons.get(result.name)
+            if comparison is not None:
+                line += f"  {comparison.change:>+10.0%}"
+                if comparison.queries != comparison.baseline_queries:
+                    line += f" ({comparison.baseline_queries} queries before)"
+                if comparison.regressed:
+                    line = self.style.ERROR(line)
+            self.stdout.write(line)
@@ -0,0 +1,100 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def merge_duplicates(model, key_fields, children):
+    # keeps the lowest pk of every group of rows sharing key_fields, moving the rows of children that point at the
+    # others to it before deleting them
+    groups = (model.objects.values(*key_fields).order_by()
+              .annotate(keep=models.Min("pk"), rows=models.Count("pk")).filter(rows__gt=1))
+    for group in groups:
+        keep = group.pop("keep")
+        group.pop("rows")
+        duplicates = list(model.objects.filter(**group).exclude(pk=keep).values_list("pk", flat=True))
+        for child, field in children:
+            child.objects.filter(**{f"{field}__in": duplicates}).update(**{field: keep})
+        model.objects.filter(pk__in=duplicates).delete()
+
+
+def merge_duplicate_keys(apps, schema_editor):
+    # rows the unique constraints below would reject, merged in an order where merging a parent (e.g. two
+    # semesters of the same name) can only create duplicates among the models merged after it
+    semester, course = apps.get_model("ta_scheduler", "Semester"), apps.get_model("ta_scheduler", "Course")
+    course_section = apps.get_model("ta_scheduler", "CourseSection")
+    lab_section = apps.get_model("ta_scheduler", "LabSection")
+    ta_course_assignment = apps.get_model("ta_scheduler", "TACourseAssignment")
+    ta_lab_assignment = apps.get_model("ta_scheduler", "TALabAssignment")
+    merge_duplicates(semester, ["semester_name"], [(course, "semester")])
+    merge_duplicates(course, ["course_code", "semester"],
+                     [(course_section, "course"), (lab_section, "course"), (ta_course_assignment, "course")])
+    merge_duplicates(course_section, ["course", "course_section_number"], [])
+    merge_duplicates(lab_section, ["course", "lab_section_number"], [(ta_lab_assignment, "lab_section")])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ta_scheduler', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='labsection',
+            name='days',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='skills',
+            field=models.JSONField(blank=True, default=list, null=True),
+        ),
+        migrations.AlterField(
+            model_name='course',
+            name='course_code',
+            field=models.CharField(max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='course',
+            name='semester',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='courses', to='ta_scheduler.semester'),
+        ),
+        migrations.AlterField(
+            model_name='coursesection',
+            name='instructor',
+            field=models.ForeignKey(limit_choices_to={'role': 'Instructor'}, on_delete=django.db.models.deletion.CASCADE, related_name='coursesection_set', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='talabassignment',
+            name='lab_section',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='talabassignment_set', to='ta_scheduler.labsection'),
+        ),
+        migrations.AlterField(
+            model_name='talabassignment',
+            name='ta',
+            field=models.ForeignKey(limit_choices_to={'role': 'TA'}, on_delete=django.db.models.deletion.CASCADE, related_name='lab_assignments', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role'], name='user_role_idx'),
+        ),
+        migrations.RunPython(merge_duplicate_keys, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='course',
+            constraint=models.UniqueConstraint(fields=('course_code', 'semester'), name='unique_course_code_per_semester'),
+        ),
+        migrations.AddConstraint(
+            model_name='coursesection',
+            constraint=models.UniqueConstraint(fields=('course', 'course_section_number'), name='unique_course_section_number'),
+        ),
+        migrations.AddConstraint(
+            model_name='labsection',
+            constraint=models.UniqueConstraint(fields=('course', 'lab_section_number'), name='unique_lab_section_number'),
+        ),
+        migrations.AddConstraint(
+            model_name='semester',
+            constraint=models.UniqueConstraint(fields=('semester_name',), name='unique_semester_name'),
+        ),
+    ]
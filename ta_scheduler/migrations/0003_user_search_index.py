@@ -0,0 +1,62 @@
+from django.db import migrations
+
+# The user search index is an SQLite FTS5 table using the trigram tokenizer, so any substring of
+# three or more characters of a username/first name/last name is answered from the index. It is an
+# external content table over ta_scheduler_user kept in sync by triggers.
+CREATE_SEARCH_INDEX = [
+    """
+    CREATE VIRTUAL TABLE ta_scheduler_user_search USING fts5(
+        username, first_name, last_name,
+        content='ta_scheduler_user', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER ta_scheduler_user_search_insert AFTER INSERT ON ta_scheduler_user BEGIN
+        INSERT INTO ta_scheduler_user_search(rowid, username, first_name, last_name)
+        VALUES (new.id, new.username, new.first_name, new.last_name);
+    END
+    """,
+    """
+    CREATE TRIGGER ta_scheduler_user_search_delete AFTER DELETE ON ta_scheduler_user BEGIN
+        INSERT INTO ta_scheduler_user_search(ta_scheduler_user_search, rowid, username, first_name, last_name)
+        VALUES ('delete', old.id, old.username, old.first_name, old.last_name);
+    END
+    """,
+    """
+    CREATE TRIGGER ta_scheduler_user_search_update AFTER UPDATE ON ta_scheduler_user BEGIN
+        INSERT INTO ta_scheduler_user_search(ta_scheduler_user_search, rowid, username, first_name, last_name)
+        VALUES ('delete', old.id, old.username, old.first_name, old.last_name);
+        INSERT INTO ta_scheduler_user_search(rowid, username, first_name, last_name)
+        VALUES (new.id, new.username, new.first_name, new.last_name);
+    END
+    """,
+    "INSERT INTO ta_scheduler_user_search(ta_scheduler_user_search) VALUES ('rebuild')",
+]
+
+DROP_SEARCH_INDEX = [
+    "DROP TRIGGER IF EXISTS ta_scheduler_user_search_insert",
+    "DROP TRIGGER IF EXISTS ta_scheduler_user_search_delete",
+    "DROP TRIGGER IF EXISTS ta_scheduler_user_search_update",
+    "DROP TABLE IF EXISTS ta_scheduler_user_search",
+]
+
+
+def _run_on_sqlite(statements):
+    # Other backends fall back to icontains filtering in UserController.searchUser
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ta_scheduler", "0002_sync_models_and_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(_run_on_sqlite(CREATE_SEARCH_INDEX), _run_on_sqlite(DROP_SEARCH_INDEX)),
+    ]
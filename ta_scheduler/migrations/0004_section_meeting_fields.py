@@ -0,0 +1,107 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:14
+
+import re
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+# A frozen copy of ta_scheduler.weekdays.Weekdays.mask as of this migration, so later changes to the app code can't
+# change or break what it computes. Monday is bit 0.
+_NAMES = {
+    "monday": 0, "mon": 0, "mo": 0,
+    "tuesday": 1, "tues": 1, "tue": 1, "tu": 1,
+    "wednesday": 2, "wed": 2, "we": 2,
+    "thursday": 3, "thurs": 3, "thur": 3, "thu": 3, "th": 3,
+    "friday": 4, "fri": 4, "fr": 4,
+    "saturday": 5, "sat": 5, "sa": 5,
+    "sunday": 6, "sun": 6, "su": 6,
+}
+_LETTERS = {"m": 0, "t": 1, "w": 2, "r": 3, "f": 4, "s": 5, "u": 6}
+_COMPACT = re.compile(r"(?:th|tu|sa|su|[mtwrfsu])+")
+_COMPACT_PART = re.compile(r"th|tu|sa|su|[mtwrfsu]")
+
+
+def day_mask(days):
+    # 0 when any part of days isn't a day, like a section whose days can't be parsed
+    mask = 0
+    for token in re.split(r"[\s,/;&+-]+", (days or "").lower()):
+        if not token or token == "and":
+            continue
+        if token in _NAMES:
+            mask |= 1 << _NAMES[token]
+        elif _COMPACT.fullmatch(token):
+            for part in _COMPACT_PART.findall(token):
+                mask |= 1 << (_NAMES[part] if len(part) == 2 else _LETTERS[part])
+        else:
+            return 0
+    return mask
+
+
+def minute_of_day(value):
+    return value.hour * 60 + value.minute
+
+
+def fill_meeting_fields(apps, schema_editor):
+    # historical models don't have MeetingTimes.sync_meeting_fields, so the fields are derived here
+    for model_name in ("CourseSection", "LabSection"):
+        model = apps.get_model("ta_scheduler", model_name)
+        batch = []
+        for section in model.objects.only("days", "start_time", "end_time").iterator(chunk_size=BATCH_SIZE):
+            section.day_mask = day_mask(section.days)
+            section.start_minute = minute_of_day(section.start_time)
+            section.end_minute = minute_of_day(section.end_time)
+            batch.append(section)
+            if len(batch) == BATCH_SIZE:
+                model.objects.bulk_update(batch, ["day_mask", "start_minute", "end_minute"])
+                batch = []
+        model.objects.bulk_update(batch, ["day_mask", "start_minute", "end_minute"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ta_scheduler', '0003_user_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursesection',
+            name='day_mask',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='coursesection',
+            name='end_minute',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='coursesection',
+            name='start_minute',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='labsection',
+            name='day_mask',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='labsection',
+            name='end_minute',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='labsection',
+            name='start_minute',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='coursesection',
+            index=models.Index(fields=['start_minute', 'end_minute'], name='coursesection_meeting_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='labsection',
+            index=models.Index(fields=['start_minute', 'end_minute'], name='labsection_meeting_idx'),
+        ),
+        migrations.RunPython(fill_meeting_fields, migrations.RunPython.noop),
+    ]
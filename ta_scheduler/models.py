@@ -2,12 +2,19 @@ from django.contrib.auth.hashers import make_password
 from django.db import models
 from django.contrib.auth.models import AbstractUser, Group, Permission
 
+from ta_scheduler.weekdays import Weekdays, minute_of_day
+
 
 class Semester(models.Model):
     semester_name = models.CharField(max_length=255)
     start_date = models.DateField()
     end_date = models.DateField()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["semester_name"], name="unique_semester_name"),
+        ]
+
     # convenient format for views
     def __str__(self):
         return f"{self.semester_name}"
@@ -21,6 +28,11 @@ class Course(models.Model):
     course_name = models.CharField(max_length=255)
     semester = models.ForeignKey(Semester, on_delete=models.CASCADE, related_name="courses")
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["course_code", "semester"], name="unique_course_code_per_semester"),
+        ]
+
     # return all lab sections for the course
     def get_lab_sections(self):
         return self.labsection_set.all()
@@ -53,6 +65,11 @@ class User(AbstractUser):
         blank=True,
     )
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=["role"], name="user_role_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         """
         Preconditions:
@@ -83,7 +100,66 @@ class User(AbstractUser):
 
 
 
-class CourseSection(models.Model):
+class MeetingTimesQuerySet(models.QuerySet):
+    # bulk_create and bulk_update skip save(), so they fill in the meeting fields themselves
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.sync_meeting_fields()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.sync_meeting_fields()
+        return super().bulk_update(objs, MeetingTimes.with_meeting_fields(fields), *args, **kwargs)
+
+
+class MeetingTimes(models.Model):
+    """
+    The days and times of a section in a form the database can filter on: a bitmask of the weekdays it meets on
+    (bit n for weekday n, Monday is 0) and its start and end in minutes since midnight. They are derived from
+    days, start_time and end_time whenever the section is saved or bulk written, days that can't be parsed give
+    an empty mask. QuerySet.update() does not keep them in sync.
+    """
+    MEETING_SOURCE_FIELDS = {"days", "start_time", "end_time"}
+    MEETING_FIELDS = ["day_mask", "start_minute", "end_minute"]
+
+    day_mask = models.PositiveSmallIntegerField(default=0, editable=False)
+    start_minute = models.PositiveSmallIntegerField(default=0, editable=False)
+    end_minute = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    objects = MeetingTimesQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(fields=["start_minute", "end_minute"], name="%(class)s_meeting_idx"),
+        ]
+
+    @staticmethod
+    def with_meeting_fields(fields):
+        fields = list(fields)
+        if MeetingTimes.MEETING_SOURCE_FIELDS.intersection(fields):
+            fields += [field for field in MeetingTimes.MEETING_FIELDS if field not in fields]
+        return fields
+
+    def sync_meeting_fields(self):
+        try:
+            self.day_mask = Weekdays.mask(self.days)
+        except ValueError:
+            self.day_mask = 0
+        self.start_minute = minute_of_day(self.start_time) if self.start_time is not None else 0
+        self.end_minute = minute_of_day(self.end_time) if self.end_time is not None else 0
+
+    def save(self, *args, **kwargs):
+        self.sync_meeting_fields()
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = MeetingTimes.with_meeting_fields(kwargs["update_fields"])
+        super().save(*args, **kwargs)
+
+
+class CourseSection(MeetingTimes):
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
     instructor = models.ForeignKey(User, on_delete=models.CASCADE, limit_choices_to={'role': 'Instructor'}, related_name="coursesection_set")
     course_section_number = models.PositiveIntegerField()
@@ -91,18 +167,32 @@ class CourseSection(models.Model):
     start_time = models.TimeField()
     end_time = models.TimeField()
 
+    class Meta(MeetingTimes.Meta):
+        constraints = [
+            models.UniqueConstraint(fields=["course", "course_section_number"], name="unique_course_section_number"),
+        ]
 
 
-class LabSection(models.Model):
+
+class LabSection(MeetingTimes):
     course = models.ForeignKey(Course, on_delete=models.CASCADE)
     lab_section_number = models.PositiveIntegerField()
     days = models.CharField(max_length=255, blank=True, null=True)
     start_time = models.TimeField()
     end_time = models.TimeField()
 
+    class Meta(MeetingTimes.Meta):
+        constraints = [
+            models.UniqueConstraint(fields=["course", "lab_section_number"], name="unique_lab_section_number"),
+        ]
+
     # useful method to associate lab section with the ta - assuming that one ta per lab section
+    # a prefetched talabassignment_set is reused instead of queried again, taking the lowest pk like first() does
     def get_ta(self):
-        assignment = self.talabassignment_set.first()
+        if "talabassignment_set" in getattr(self, "_prefetched_objects_cache", {}):
+            assignment = min(self.talabassignment_set.all(), key=lambda assignment: assignment.pk, default=None)
+        else:
+            assignment = self.talabassignment_set.first()
         return assignment.ta if assignment else None
 
 
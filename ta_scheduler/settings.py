@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,6 +42,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # first, so the time other middleware takes is part of each request's measurements
+    'core.request_metrics.RequestMetrics.RequestMetricsMiddleware',
+    'core.slow_query_log.SlowQueryLog.SlowQueryMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -48,6 +52,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.request_cache.RequestCache.RequestCacheMiddleware',
+    'core.query_detector.NPlusOneDetector.NPlusOneMiddleware',
 ]
 
 ROOT_URLCONF = 'ta_scheduler.urls'
@@ -83,6 +89,30 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Cache alias and timeout (seconds) used for rendered course overviews, see core/course_controller/CourseCache.py
+COURSE_CACHE_ALIAS = 'default'
+COURSE_CACHE_TIMEOUT = 300
+
+# N+1 query detection, see core/query_detector/NPlusOneDetector.py. "log" warns about any SELECT shape a request
+# runs more than NPLUSONE_THRESHOLD times, "raise" fails the request (and so the test making it), "off" disables it.
+# e.g. NPLUSONE_MODE=raise python manage.py test views
+NPLUSONE_MODE = os.environ.get('NPLUSONE_MODE', 'log' if DEBUG else 'off')
+NPLUSONE_THRESHOLD = int(os.environ.get('NPLUSONE_THRESHOLD', 5))
+
+# Slow query log, see core/slow_query_log/SlowQueryLog.py. Queries a request runs that take at least SLOW_QUERY_MS
+# milliseconds are kept, with their query plan, in a ring buffer of the last SLOW_QUERY_LOG_SIZE shown at /slow-queries/
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 100))
+SLOW_QUERY_LOG_SIZE = int(os.environ.get('SLOW_QUERY_LOG_SIZE', 100))
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -1,3 +1,388 @@
+from datetime import date, time
+from importlib import import_module
+from typing import Callable, Dict, Tuple
 
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.loader import MigrationLoader
+from django.test import Client, SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 
-# TODO: Do system testing here
\ No newline at end of file
+from core.course_controller.CourseController import CourseController
+from core.user_controller.UserController import UserController
+from ta_scheduler.models import Semester, Course, CourseSection, LabSection, TACourseAssignment, TALabAssignment, User
+from ta_scheduler.weekdays import Weekdays, minute_of_day
+
+# TODO: Do system testing here
+
+# The most queries each covered view and controller call may run, whatever the size of the data. Raising a budget
+# should be a deliberate change reviewed with the code that needs it.
+QUERY_BUDGETS: Dict[str, int] = {
+    "CourseController.get_course": 5,
+    "UserController.getUser": 5,
+    "SearchView": 5,
+    "CourseForm": 8,
+    "SectionForm": 8,
+}
+
+# Sizes the fixture is built at for every check, the data grows roughly linearly with the size
+DEFAULT_FIXTURE_SIZES: Tuple[int, ...] = (1, 5, 25)
+
+
+def _query_plan(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return " ".join(str(row[-1]) for row in cursor.fetchall())
+
+
+class TestLookupIndexesAtScale(TestCase):
+    """
+    Benchmarks the hot controller lookups against 10k courses and checks that SQLite answers
+    them from an index instead of scanning the table.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        instructor = User.objects.create(username="instructor", role="Instructor")
+        semesters = Semester.objects.bulk_create([
+            Semester(semester_name=f"Semester {i}", start_date=date(2000 + i, 1, 1), end_date=date(2000 + i, 5, 1))
+            for i in range(20)
+        ])
+        courses = Course.objects.bulk_create([
+            Course(course_code=f"CS{i}", course_name=f"Course {i}", semester=semesters[i % 20])
+            for i in range(10000)
+        ])
+        CourseSection.objects.bulk_create([
+            CourseSection(course=course, course_section_number=1, instructor=instructor,
+                          start_time="09:00", end_time="10:00")
+            for course in courses
+        ])
+        LabSection.objects.bulk_create([
+            LabSection(course=course, lab_section_number=1, start_time="11:00", end_time="12:00")
+            for course in courses
+        ])
+        cls.course = Course.objects.get(course_code="CS9999", semester__semester_name="Semester 19")
+
+    def assertUsesIndex(self, queryset):
+        plan = _query_plan(queryset)
+        self.assertIn("USING", plan, f"Expected an index lookup, got: {plan}")
+        self.assertNotRegex(plan, r"^SCAN ta_scheduler_\w+$")
+
+    def test_semester_by_name(self):
+        self.assertUsesIndex(Semester.objects.filter(semester_name="Semester 19"))
+
+    def test_course_by_code_and_semester(self):
+        self.assertUsesIndex(Course.objects.filter(course_code="CS9999", semester=self.course.semester_id))
+        self.assertTrue(Course.objects.filter(course_code="CS9999", semester__semester_name="Semester 19").exists())
+
+    def test_sections_by_number(self):
+        self.assertUsesIndex(CourseSection.objects.filter(course=self.course, course_section_number=1))
+        self.assertUsesIndex(LabSection.objects.filter(course=self.course, lab_section_number=1))
+
+    def test_users_by_role(self):
+        self.assertUsesIndex(User.objects.filter(role="TA"))
+
+    def test_sections_by_meeting_time(self):
+        self.assertUsesIndex(LabSection.objects.filter(start_minute__lt=600, end_minute__gt=540))
+        self.assertUsesIndex(CourseSection.objects.filter(start_minute__lt=600, end_minute__gt=540))
+
+
+class TestMeetingFields(TestCase):
+    def setUp(self):
+        semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                           end_date=date(2025, 12, 15))
+        self.course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=semester)
+
+    def lab(self, number, days):
+        return LabSection(course=self.course, lab_section_number=number, days=days, start_time=time(9, 30),
+                          end_time="10:45")
+
+    def test_save_derives_fields(self):
+        lab = self.lab(801, "MWF")
+        lab.save()
+        lab.refresh_from_db()
+        self.assertEqual((lab.day_mask, lab.start_minute, lab.end_minute), (0b10101, 570, 645))
+
+    def test_unparseable_days_have_empty_mask(self):
+        lab = self.lab(801, "TBA")
+        lab.save()
+        self.assertEqual(LabSection.objects.get(pk=lab.pk).day_mask, 0)
+
+    def test_update_fields_include_derived_fields(self):
+        lab = self.lab(801, "MWF")
+        lab.save()
+        lab.days = "TR"
+        lab.save(update_fields=["days"])
+        self.assertEqual(LabSection.objects.get(pk=lab.pk).day_mask, 0b1010)
+
+    def test_bulk_writes_derive_fields(self):
+        LabSection.objects.bulk_create([self.lab(801, "Mon"), self.lab(802, "Sat")])
+        self.assertEqual(list(LabSection.objects.order_by("lab_section_number").values_list("day_mask", flat=True)),
+                         [1, 32])
+        labs = list(LabSection.objects.all())
+        for lab in labs:
+            lab.days = "Sunday"
+        LabSection.objects.bulk_update(labs, ["days"])
+        self.assertEqual(set(LabSection.objects.values_list("day_mask", flat=True)), {64})
+
+    def test_migration_fills_existing_sections(self):
+        self.lab(801, "Tue, Thu").save()
+        LabSection.objects.update(day_mask=0, start_minute=0, end_minute=0)
+        migration = import_module("ta_scheduler.migrations.0004_section_meeting_fields")
+        migration.fill_meeting_fields(apps, None)
+        self.assertEqual(LabSection.objects.values_list("day_mask", "start_minute", "end_minute").get(),
+                         (0b1010, 570, 645))
+
+
+class TestMergeDuplicateKeys(TransactionTestCase):
+    """
+    Migration 0002 adds unique constraints, rows that already break them are merged first
+    """
+    before, after = [("ta_scheduler", "0001_initial")], [("ta_scheduler", "0002_sync_models_and_lookup_indexes")]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.before)
+        old_apps = executor.loader.project_state(self.before).apps
+        semester, course = old_apps.get_model("ta_scheduler", "Semester"), old_apps.get_model("ta_scheduler", "Course")
+        lab_section = old_apps.get_model("ta_scheduler", "LabSection")
+        user = old_apps.get_model("ta_scheduler", "User")
+        ta_lab_assignment = old_apps.get_model("ta_scheduler", "TALabAssignment")
+        ta = user.objects.create(username="ta", role="TA")
+        # 0001 already kept course codes unique, so duplicate semesters and sections are what can exist
+        for code in ("CS361", "CS395"):
+            fall = semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                           end_date=date(2025, 12, 15))
+            course.objects.create(course_code=code, course_name=code, semester=fall)
+        cs361 = course.objects.get(course_code="CS361")
+        for _ in range(2):
+            lab = lab_section.objects.create(course=cs361, lab_section_number=801, start_time=time(9, 0),
+                                             end_time=time(10, 0))
+            ta_lab_assignment.objects.create(lab_section=lab, ta=ta)
+
+    def tearDown(self):
+        MigrationExecutor(connection).migrate(MigrationLoader(connection).graph.leaf_nodes())
+
+    def test_duplicates_merged_into_first(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.after)
+        new_apps = executor.loader.project_state(self.after).apps
+        semester, course = new_apps.get_model("ta_scheduler", "Semester"), new_apps.get_model("ta_scheduler", "Course")
+        ta_lab_assignment = new_apps.get_model("ta_scheduler", "TALabAssignment")
+        self.assertEqual(semester.objects.count(), 1)
+        self.assertEqual(sorted(course.objects.values_list("course_code", flat=True)), ["CS361", "CS395"])
+        self.assertEqual(set(course.objects.values_list("semester_id", flat=True)), {semester.objects.get().pk})
+        # both labs 801 became one, keeping the assignments of either
+        self.assertEqual(new_apps.get_model("ta_scheduler", "LabSection").objects.count(), 1)
+        self.assertEqual(ta_lab_assignment.objects.count(), 2)
+
+
+class TestLabSectionTA(TestCase):
+    def setUp(self):
+        semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                           end_date=date(2025, 12, 15))
+        course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=semester)
+        self.lab = LabSection.objects.create(course=course, lab_section_number=801, days="MW", start_time=time(9, 0),
+                                             end_time=time(10, 0))
+        self.first = User.objects.create(username="first", role="TA")
+        self.second = User.objects.create(username="second", role="TA")
+        TALabAssignment.objects.create(lab_section=self.lab, ta=self.first)
+        TALabAssignment.objects.create(lab_section=self.lab, ta=self.second)
+
+    def test_first_assignment_without_prefetch(self):
+        lab = LabSection.objects.get(pk=self.lab.pk)
+        with self.assertNumQueries(2):
+            self.assertEqual(lab.get_ta(), self.first)
+
+    def test_prefetched_assignments_reused(self):
+        lab = LabSection.objects.prefetch_related("talabassignment_set__ta").get(pk=self.lab.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(lab.get_ta(), self.first)
+
+    def test_no_assignment(self):
+        TALabAssignment.objects.all().delete()
+        self.assertIsNone(LabSection.objects.get(pk=self.lab.pk).get_ta())
+
+
+class TestParseWeekdays(SimpleTestCase):
+    def test_full_and_short_names(self):
+        self.assertEqual(Weekdays.parse("Monday, Wednesday"), [0, 2])
+        self.assertEqual(Weekdays.parse("Mon, Wed"), [0, 2])
+        self.assertEqual(Weekdays.parse("tues/thurs"), [1, 3])
+        self.assertEqual(Weekdays.parse("Tuesday and Thursday"), [1, 3])
+
+    def test_compact_codes(self):
+        self.assertEqual(Weekdays.parse("MWF"), [0, 2, 4])
+        self.assertEqual(Weekdays.parse("TR"), [1, 3])
+        self.assertEqual(Weekdays.parse("TTh"), [1, 3])
+        self.assertEqual(Weekdays.parse("Th"), [3])
+        self.assertEqual(Weekdays.parse("SaSu"), [5, 6])
+
+    def test_empty(self):
+        self.assertEqual(Weekdays.parse(None), [])
+        self.assertEqual(Weekdays.parse(" "), [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Weekdays.parse("Mondays")
+        with self.assertRaises(ValueError):
+            Weekdays.parse("9am")
+
+
+class TestWeekdayMask(SimpleTestCase):
+    def test_mask(self):
+        self.assertEqual(Weekdays.mask("MWF"), 0b10101)
+        self.assertEqual(Weekdays.mask("Sunday"), 64)
+        self.assertEqual(Weekdays.mask(None), 0)
+
+    def test_round_trip(self):
+        self.assertEqual(Weekdays.from_mask(Weekdays.mask("Tue, Thu, Sat")), [1, 3, 5])
+
+
+class TestMinuteOfDay(SimpleTestCase):
+    def test_times_and_strings(self):
+        self.assertEqual(minute_of_day(time(13, 45)), 13 * 60 + 45)
+        self.assertEqual(minute_of_day("09:30"), 9 * 60 + 30)
+        self.assertEqual(minute_of_day("09:30:15"), 9 * 60 + 30)
+
+
+class QueryBudgetTestCase(TestCase):
+    """
+    A TestCase for checking that a view or controller call stays within its entry in QUERY_BUDGETS and runs the same
+    number of queries however much data there is. Subclasses implement build_fixture(size); assertQueryBudget builds
+    it at each of fixture_sizes inside a transaction that is rolled back afterwards, so every size starts from the
+    same empty database, and runs the call against it with the caches cleared.
+    """
+    fixture_sizes: Tuple[int, ...] = DEFAULT_FIXTURE_SIZES
+
+    def build_fixture(self, size: int) -> None:
+        raise NotImplementedError("QueryBudgetTestCase subclasses must implement build_fixture")
+
+    def count_queries(self, call: Callable[[], object], setup: Callable[[], object] | None = None) -> Dict[int, int]:
+        """
+        Pre-conditions: call and setup take no arguments
+        Post-conditions: Returns the number of queries call runs at each fixture size, after setup (e.g. logging in)
+            has run outside of the count
+        Side-effects: Clears the cache
+        """
+        counts = {}
+        for size in self.fixture_sizes:
+            with transaction.atomic():
+                self.build_fixture(size)
+                if setup is not None:
+                    setup()
+                cache.clear()
+                with CaptureQueriesContext(connection) as queries:
+                    call()
+                counts[size] = len(queries)
+                transaction.set_rollback(True)
+        cache.clear()
+        return counts
+
+    def assertQueryBudget(self, name: str, call: Callable[[], object], setup: Callable[[], object] | None = None,
+                          budget: int | None = None) -> None:
+        """
+        Pre-conditions: name is a key of QUERY_BUDGETS or budget is given
+        Post-conditions: Fails if call runs more queries than the budget at any fixture size, or a different number
+            of queries at different sizes
+        Side-effects: Clears the cache
+        """
+        budget = QUERY_BUDGETS[name] if budget is None else budget
+        counts = self.count_queries(call, setup)
+        per_size = ", ".join(f"{count} at size {size}" for size, count in counts.items())
+        self.assertLessEqual(max(counts.values()), budget,
+                             f"{name} ran more than its budget of {budget} queries: {per_size}")
+        self.assertEqual(len(set(counts.values())), 1, f"{name} runs more queries as the data grows: {per_size}")
+
+
+class ScheduleBudgetTestCase(QueryBudgetTestCase):
+    """
+    At size n the fixture has n courses, each with a section taught by "instructor" and a lab led by "ta", who is a
+    TA of every course. CS0 additionally has n more sections, labs and TAs, so both a course and a person's schedule
+    grow with the size.
+    """
+    def build_fixture(self, size):
+        semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1),
+                                           end_date=date(2025, 12, 15))
+        User.objects.create_user(username="admin", password="adminpass", role="Admin")
+        instructor = User.objects.create(username="instructor", role="Instructor", first_name="Ida", last_name="Ng")
+        ta = User.objects.create(username="ta", role="TA", skills=["Python"])
+        extra_instructors = User.objects.bulk_create([User(username=f"instructor{i}", role="Instructor")
+                                                      for i in range(size)])
+        extra_tas = User.objects.bulk_create([User(username=f"ta{i}", role="TA") for i in range(size)])
+        courses = Course.objects.bulk_create([Course(course_code=f"CS{i}", course_name=f"Course {i}", semester=semester)
+                                              for i in range(size)])
+        target = courses[0]
+
+        CourseSection.objects.bulk_create(
+            [CourseSection(course=course, course_section_number=1, instructor=instructor, days="MW",
+                           start_time=time(9, 0), end_time=time(9, 50)) for course in courses]
+            + [CourseSection(course=target, course_section_number=i + 2, instructor=extra, days="TR",
+                             start_time=time(9, 0), end_time=time(10, 15)) for i, extra in enumerate(extra_instructors)]
+        )
+        labs = LabSection.objects.bulk_create(
+            [LabSection(course=course, lab_section_number=801, days="F", start_time=time(13, 0),
+                        end_time=time(14, 50)) for course in courses]
+            + [LabSection(course=target, lab_section_number=802 + i, days="R", start_time=time(13, 0),
+                          end_time=time(14, 50)) for i in range(size)]
+        )
+        TACourseAssignment.objects.bulk_create(
+            [TACourseAssignment(course=course, ta=ta, grader_status=False) for course in courses]
+            + [TACourseAssignment(course=target, ta=extra, grader_status=i % 2 == 0) for i, extra in enumerate(extra_tas)]
+        )
+        TALabAssignment.objects.bulk_create(
+            [TALabAssignment(lab_section=lab, ta=ta) for lab in labs[:size]]
+            + [TALabAssignment(lab_section=lab, ta=extra) for lab, extra in zip(labs[size:], extra_tas)]
+        )
+
+    def login(self):
+        self.client = Client()
+        self.client.login(username="admin", password="adminpass")
+
+
+class TestControllerQueryBudgets(ScheduleBudgetTestCase):
+    def test_get_course(self):
+        self.assertQueryBudget("CourseController.get_course", lambda: CourseController.get_course("CS0", "Fall 2025"))
+
+    def fetch_admin(self):
+        self.admin = User.objects.get(username="admin")
+
+    def test_get_ta(self):
+        self.assertQueryBudget("UserController.getUser", lambda: UserController.getUser("ta", self.admin),
+                               setup=self.fetch_admin)
+
+    def test_get_instructor(self):
+        self.assertQueryBudget("UserController.getUser", lambda: UserController.getUser("instructor", self.admin),
+                               setup=self.fetch_admin)
+
+
+class TestViewQueryBudgets(ScheduleBudgetTestCase):
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_search_view(self):
+        self.assertQueryBudget("SearchView", lambda: self.get("/search/course/"), setup=self.login)
+
+    def test_course_form(self):
+        self.assertQueryBudget("CourseForm", lambda: self.get("/edit-course/CS0/Fall 2025/"), setup=self.login)
+
+    def test_section_form(self):
+        self.assertQueryBudget("SectionForm", lambda: self.get("/edit-section/CS0/Fall 2025/1/Course"),
+                               setup=self.login)
+
+
+class TestQueryBudgetFramework(ScheduleBudgetTestCase):
+    def test_growing_query_count_fails(self):
+        def per_course_queries():
+            for course in Course.objects.all():
+                list(course.coursesection_set.all())
+        with self.assertRaisesMessage(AssertionError, "runs more queries as the data grows: 2 at size 1, 6 at size 5"):
+            self.assertQueryBudget("loop", per_course_queries, budget=100)
+
+    def test_over_budget_fails(self):
+        with self.assertRaisesMessage(AssertionError, "ran more than its budget of 0 queries"):
+            self.assertQueryBudget("CourseController.get_course",
+                                   lambda: CourseController.get_course("CS0", "Fall 2025"), budget=0)
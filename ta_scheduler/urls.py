@@ -23,8 +23,14 @@ from views.profile_view import ProfileView
 from views.section_form.views import SectionForm
 from views.user_form import UserForm
 from views.semester_form import SemesterFormView
+from views.import_form import ImportFormView
+from views.calendar_feed import CalendarFeedView
+from views.workload_view import WorkloadView
+from views.slow_query_view import SlowQueryView
 from views.search_view import SearchView
-from views.api.views import search_user_api
+from views.api.views import (search_user_api, search_course_api, lookup_user_api, course_cache_stats_api,
+                             export_semester_api, semester_conflicts_api, assign_labs_api, available_tas_api,
+                             workload_api, metrics_api)
 from views.section_form.views import get_instructors
 
 urlpatterns = [
@@ -42,8 +48,22 @@ urlpatterns = [
     path('create-section/<str:code>/<str:semester>', SectionForm.as_view(), name='section-creator'),  # Section-form
     path('create-semester/', SemesterFormView.as_view(), name='semester-creator'),
     path('create-semester/<str:semester_name>', SemesterFormView.as_view(), name='semester-editor'),
+    path('calendar/<str:token>.ics', CalendarFeedView.as_view(), name='calendar-feed'),
+    path('import/', ImportFormView.as_view(), name='import-form'),
+    path('workload/', WorkloadView.as_view(), name='workload'),
+    path('workload/<str:semester_name>/', WorkloadView.as_view(), name='workload-semester'),
+    path('slow-queries/', SlowQueryView.as_view(), name='slow-queries'),
     path('search/<str:type>/', SearchView.as_view(), name='search'),
     path("api/search/user/", search_user_api, name="search_user_api"),
     path("api/search/user/<str:role>/", search_user_api, name="search_user_api"),
+    path("api/search/course/", search_course_api, name="search_course_api"),
+    path("api/lookup/user/", lookup_user_api, name="lookup_user_api"),
+    path("api/export/<str:semester_name>/", export_semester_api, name="export_semester_api"),
+    path("api/conflicts/<str:semester_name>/", semester_conflicts_api, name="semester_conflicts_api"),
+    path("api/available-tas/<str:semester_name>/", available_tas_api, name="available_tas_api"),
+    path("api/assign-labs/<str:semester_name>/", assign_labs_api, name="assign_labs_api"),
+    path("api/workload/<str:semester_name>/", workload_api, name="workload_api"),
+    path("metrics", metrics_api, name="metrics"),
+    path("api/cache/course/", course_cache_stats_api, name="course_cache_stats_api"),
     path('get-instructors/', get_instructors, name='get-instructors'),
 ]
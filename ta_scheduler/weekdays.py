@@ -0,0 +1,69 @@
+import re
+from datetime import datetime, time
+from typing import List
+
+# Monday is 0, matching date.weekday()
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+_NAMES = {
+    "monday": 0, "mon": 0, "mo": 0,
+    "tuesday": 1, "tues": 1, "tue": 1, "tu": 1,
+    "wednesday": 2, "wed": 2, "we": 2,
+    "thursday": 3, "thurs": 3, "thur": 3, "thu": 3, "th": 3,
+    "friday": 4, "fri": 4, "fr": 4,
+    "saturday": 5, "sat": 5, "sa": 5,
+    "sunday": 6, "sun": 6, "su": 6,
+}
+# single letter codes used in compact strings like "MWF" or "TR"
+_LETTERS = {"m": 0, "t": 1, "w": 2, "r": 3, "f": 4, "s": 5, "u": 6}
+_COMPACT = re.compile(r"(?:th|tu|sa|su|[mtwrfsu])+")
+_COMPACT_PART = re.compile(r"th|tu|sa|su|[mtwrfsu]")
+
+
+class Weekdays:
+    @staticmethod
+    def parse(days: str | None) -> List[int]:
+        """
+        Pre-conditions: days is a section's days string such as "Monday, Wednesday", "Mon/Wed", "MWF" or "TTh"
+        Post-conditions: Returns the sorted weekday numbers (Monday is 0) the string names, an empty list if
+            days is empty. Raises a ValueError if any part of the string is not a day.
+        Side-effects: None
+        """
+        weekdays = set()
+        for token in re.split(r"[\s,/;&+-]+", (days or "").lower()):
+            if not token or token == "and":
+                continue
+            if token in _NAMES:
+                weekdays.add(_NAMES[token])
+            elif _COMPACT.fullmatch(token):
+                for part in _COMPACT_PART.findall(token):
+                    weekdays.add(_NAMES[part] if len(part) == 2 else _LETTERS[part])
+            else:
+                raise ValueError(f"'{days}' is not a valid list of days.")
+        return sorted(weekdays)
+
+    @staticmethod
+    def mask(days: str | None) -> int:
+        """
+        Pre-conditions: days is a string accepted by parse, otherwise a ValueError is raised
+        Post-conditions: Returns the days as a bitmask with bit n set for weekday n, so Monday is 1 and Sunday is 64
+        Side-effects: None
+        """
+        return sum(1 << weekday for weekday in Weekdays.parse(days))
+
+    @staticmethod
+    def from_mask(mask: int) -> List[int]:
+        """
+        Post-conditions: Returns the sorted weekday numbers whose bits are set in mask
+        Side-effects: None
+        """
+        return [weekday for weekday in range(len(WEEKDAY_NAMES)) if mask & (1 << weekday)]
+
+
+def minute_of_day(value: time | str) -> int:
+    """
+    Returns the number of minutes since midnight of a time, or of an "HH:MM"/"HH:MM:SS" string as posted by the forms
+    """
+    if isinstance(value, str):
+        value = datetime.strptime(value, "%H:%M:%S" if value.count(":") == 2 else "%H:%M").time()
+    return value.hour * 60 + value.minute
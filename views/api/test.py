@@ -1,9 +1,12 @@
+from django.core.cache import cache
 from django.test import TestCase, Client
-from ta_scheduler.models import User
+from ta_scheduler.models import Course, LabSection, Semester, TACourseAssignment, TALabAssignment, User
+from core.user_controller.UserController import UserController
 import json
 
 class TestSearchUserAPI(TestCase):
     def setUp(self):
+        cache.clear()
         self.admin_user = User.objects.create_user(
             username='admin', first_name='Admin', last_name='User', password='adminpass', role='Admin'
         )
@@ -47,4 +50,240 @@ class TestSearchUserAPI(TestCase):
 
         response_data = json.loads(response.content)
         self.assertEqual(len(response_data), 1)
-        self.assertEqual(response_data[0]['username'], self.user2.username)
\ No newline at end of file
+        self.assertEqual(response_data[0]['username'], self.user2.username)
+
+    def test_api_search_pagination(self):
+        response = self.client.get('/api/search/user/?query=&page_size=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([u['username'] for u in json.loads(response.content)], ['admin', 'jboy'])
+        self.assertEqual(response['X-Next-Page'], '2')
+
+        response = self.client.get('/api/search/user/?query=&page_size=2&page=2')
+        self.assertEqual([u['username'] for u in json.loads(response.content)], ['lanfar'])
+        self.assertFalse(response.has_header('X-Next-Page'))
+
+    def test_api_search_invalid_page(self):
+        response = self.client.get('/api/search/user/?query=&page=0')
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_search_results_cached_per_query_and_role(self):
+        self.client.get('/api/search/user/TA/?query=and')
+        User.objects.create_user(username='randy', first_name='Randy', last_name='Ta', password='password', role="TA")
+
+        response_data = json.loads(self.client.get('/api/search/user/TA/?query=and').content)
+        self.assertEqual([u['username'] for u in response_data], ['lanfar'])
+
+        response_data = json.loads(self.client.get('/api/search/user/?query=and').content)
+        self.assertEqual([u['username'] for u in response_data], ['jboy', 'lanfar', 'randy'])
+
+        cache.clear()
+        response_data = json.loads(self.client.get('/api/search/user/TA/?query=and').content)
+        self.assertEqual([u['username'] for u in response_data], ['lanfar', 'randy'])
+
+
+class TestLookupUserAPI(TestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_user(
+            username='admin', first_name='Admin', last_name='User', password='adminpass', role='Admin'
+        )
+        self.client = Client()
+        self.client.login(username='admin', password='adminpass')
+
+        User.objects.create(username='ta', first_name='Short', last_name='Name', role="TA")
+        User.objects.create(username='ta_long', first_name='Long', last_name='Name', role="TA")
+
+    def test_lookup_exact_usernames_in_order(self):
+        response = self.client.get('/api/lookup/user/?usernames=ta_long,ta')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), [
+            {"username": "ta_long", "name": "Long Name"},
+            {"username": "ta", "name": "Short Name"},
+        ])
+
+    def test_lookup_skips_unknown_and_repeated_usernames(self):
+        response = self.client.get('/api/lookup/user/?usernames=ta,missing,ta,')
+        self.assertEqual([u['username'] for u in json.loads(response.content)], ['ta'])
+
+    def test_lookup_empty(self):
+        response = self.client.get('/api/lookup/user/')
+        self.assertEqual(json.loads(response.content), [])
+
+    def test_lookup_single_query(self):
+        usernames = [f"bulk_ta_{i}" for i in range(50)]
+        User.objects.bulk_create([User(username=username, role="TA") for username in usernames])
+        with self.assertNumQueries(1):
+            users = UserController.lookupUsers(usernames)
+        self.assertEqual([user.username for user in users], usernames)
+
+
+class TestCourseCacheStatsAPI(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username='admin', password='adminpass', role='Admin')
+        User.objects.create_user(username='ta', password='tapass', role='TA')
+
+    def test_admin_sees_counters(self):
+        self.client.login(username='admin', password='adminpass')
+        response = self.client.get('/api/cache/course/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(json.loads(response.content)), {"hits", "misses"})
+
+    def test_non_admin_forbidden(self):
+        self.client.login(username='ta', password='tapass')
+        self.assertEqual(self.client.get('/api/cache/course/').status_code, 403)
+
+
+class TestExportSemesterAPI(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username='admin', password='adminpass', role='Admin')
+        User.objects.create_user(username='ta', password='tapass', role='TA')
+        Semester.objects.create(semester_name='Fall 2025', start_date='2025-09-01', end_date='2025-12-15')
+
+    def test_streams_csv(self):
+        self.client.login(username='admin', password='adminpass')
+        response = self.client.get('/api/export/Fall 2025/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="fall-2025.csv"')
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertTrue(lines[0].startswith("type,semester"))
+        self.assertTrue(lines[1].startswith("semester,Fall 2025,2025-09-01,2025-12-15"))
+
+    def test_streams_json(self):
+        self.client.login(username='admin', password='adminpass')
+        response = self.client.get('/api/export/Fall 2025/', {'format': 'json'})
+        self.assertEqual(json.loads(b"".join(response.streaming_content))[0]['semester'], 'Fall 2025')
+
+    def test_errors(self):
+        self.client.login(username='admin', password='adminpass')
+        self.assertEqual(self.client.get('/api/export/Spring 1900/').status_code, 404)
+        self.assertEqual(self.client.get('/api/export/Fall 2025/', {'format': 'xml'}).status_code, 400)
+        self.client.login(username='ta', password='tapass')
+        self.assertEqual(self.client.get('/api/export/Fall 2025/').status_code, 403)
+
+
+class TestSemesterConflictsAPI(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username='admin', password='adminpass', role='Admin')
+        User.objects.create_user(username='ta', password='tapass', role='TA')
+        Semester.objects.create(semester_name='Fall 2025', start_date='2025-09-01', end_date='2025-12-15')
+
+    def test_admin_gets_report(self):
+        self.client.login(username='admin', password='adminpass')
+        response = self.client.get('/api/conflicts/Fall 2025/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), [])
+        self.assertEqual(self.client.get('/api/conflicts/Spring 1900/').status_code, 404)
+
+    def test_non_admin_forbidden(self):
+        self.client.login(username='ta', password='tapass')
+        self.assertEqual(self.client.get('/api/conflicts/Fall 2025/').status_code, 403)
+
+
+class TestAssignLabsAPI(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username='admin', password='adminpass', role='Admin')
+        ta = User.objects.create_user(username='ta', password='tapass', role='TA')
+        semester = Semester.objects.create(semester_name='Fall 2025', start_date='2025-09-01', end_date='2025-12-15')
+        course = Course.objects.create(course_code='CS361', course_name='Software Eng', semester=semester)
+        TACourseAssignment.objects.create(course=course, ta=ta, grader_status=False)
+        self.lab = LabSection.objects.create(course=course, lab_section_number=801, days='Tuesday',
+                                             start_time='11:00', end_time='12:50')
+
+    def test_get_previews_and_post_applies(self):
+        self.client.login(username='admin', password='adminpass')
+        expected = [{'course_code': 'CS361', 'lab_section_number': 801,
+                     'ta': {'username': 'ta', 'name': ' '}, 'reason': None}]
+        response = self.client.get('/api/assign-labs/Fall 2025/')
+        self.assertEqual(json.loads(response.content), expected)
+        self.assertFalse(TALabAssignment.objects.exists())
+        response = self.client.post('/api/assign-labs/Fall 2025/')
+        self.assertEqual(json.loads(response.content), expected)
+        self.assertEqual(TALabAssignment.objects.get().lab_section, self.lab)
+        self.assertEqual(self.client.get('/api/assign-labs/Spring 1900/').status_code, 404)
+
+    def test_non_admin_forbidden(self):
+        self.client.login(username='ta', password='tapass')
+        self.assertEqual(self.client.post('/api/assign-labs/Fall 2025/').status_code, 403)
+        self.assertFalse(TALabAssignment.objects.exists())
+
+
+class TestAvailableTAsAPI(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username='admin', password='adminpass', role='Admin')
+        User.objects.create_user(username='ta', password='tapass', role='TA', first_name='Tina', last_name='Ash')
+        Semester.objects.create(semester_name='Fall 2025', start_date='2025-09-01', end_date='2025-12-15')
+
+    def test_admin_gets_ranked_tas(self):
+        self.client.login(username='admin', password='adminpass')
+        response = self.client.get('/api/available-tas/Fall 2025/', {'days': 'TR', 'start': '14:00', 'end': '15:15'})
+        self.assertEqual(json.loads(response.content),
+                         [{'username': 'ta', 'name': 'Tina Ash', 'load': 0, 'skill_matches': 0}])
+
+    def test_bad_parameters(self):
+        self.client.login(username='admin', password='adminpass')
+        self.assertEqual(self.client.get('/api/available-tas/Fall 2025/', {'days': 'TR'}).status_code, 400)
+        response = self.client.get('/api/available-tas/Fall 2025/', {'days': 'often', 'start': '14:00', 'end': '15:00'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_non_admin_forbidden(self):
+        self.client.login(username='ta', password='tapass')
+        response = self.client.get('/api/available-tas/Fall 2025/', {'days': 'TR', 'start': '14:00', 'end': '15:15'})
+        self.assertEqual(response.status_code, 403)
+
+
+class TestWorkloadAPI(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        User.objects.create_user(username='admin', password='adminpass', role='Admin')
+        ta = User.objects.create_user(username='ta', password='tapass', role='TA')
+        semester = Semester.objects.create(semester_name='Fall 2025', start_date='2025-09-01', end_date='2025-12-15')
+        course = Course.objects.create(course_code='CS361', course_name='Software Eng', semester=semester)
+        lab = LabSection.objects.create(course=course, lab_section_number=801, days='TR',
+                                        start_time='11:00', end_time='12:30')
+        TALabAssignment.objects.create(lab_section=lab, ta=ta)
+
+    def test_admin_gets_workloads(self):
+        self.client.login(username='admin', password='adminpass')
+        response = self.client.get('/api/workload/Fall 2025/')
+        self.assertEqual(json.loads(response.content), [{
+            'username': 'ta', 'name': ' ', 'role': 'TA', 'weekly_hours': 3.0, 'lab_sections': 1,
+            'course_sections': 0, 'courses': 0, 'graded_courses': 0,
+        }])
+        self.assertEqual(self.client.get('/api/workload/Spring 1900/').status_code, 404)
+
+    def test_non_admin_forbidden(self):
+        self.client.login(username='ta', password='tapass')
+        self.assertEqual(self.client.get('/api/workload/Fall 2025/').status_code, 403)
+
+
+class TestSearchCourseAPI(TestCase):
+    def setUp(self):
+        self.client = Client()
+        semester = Semester.objects.create(semester_name='Fall 2025', start_date='2025-09-01', end_date='2025-12-15')
+        Course.objects.bulk_create([
+            Course(course_code=f'CS{i}', course_name='Software' if i % 2 else 'Networks', semester=semester)
+            for i in range(100, 105)
+        ])
+
+    def test_pages_with_cursor_header(self):
+        response = self.client.get('/api/search/course/', {'semester': 'Fall 2025', 'page_size': 2})
+        self.assertEqual([course['course_code'] for course in json.loads(response.content)], ['CS100', 'CS101'])
+        self.assertEqual(response['X-Next-Cursor'], 'CS101')
+        response = self.client.get('/api/search/course/', {'semester': 'Fall 2025', 'page_size': 2, 'after': 'CS103'})
+        self.assertEqual(json.loads(response.content), [{'course_code': 'CS104', 'course_name': 'Networks'}])
+        self.assertNotIn('X-Next-Cursor', response)
+
+    def test_query_filters(self):
+        response = self.client.get('/api/search/course/', {'semester': 'Fall 2025', 'query': 'soft'})
+        self.assertEqual([course['course_code'] for course in json.loads(response.content)], ['CS101', 'CS103'])
+
+    def test_bad_parameters(self):
+        self.assertEqual(self.client.get('/api/search/course/').status_code, 400)
+        response = self.client.get('/api/search/course/', {'semester': 'Fall 2025', 'page_size': 0})
+        self.assertEqual(response.status_code, 400)
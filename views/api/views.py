@@ -1,6 +1,30 @@
-from django.http import JsonResponse
+import hashlib
 
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.text import slugify
+
+from core.assignment_controller.AssignmentController import AssignmentController
+from core.conflict_controller.ConflictController import ConflictController
+from core.course_controller.CourseCache import CourseCache
+from core.course_controller.CourseController import COURSE_SEARCH_PAGE_SIZE, CourseController
+from core.export_controller.ExportController import ExportController
+from core.import_controller.ImportController import IMPORT_FORMATS
+from core.request_metrics.RequestMetrics import RequestMetrics
 from core.user_controller.UserController import UserController
+from core.workload_controller.WorkloadController import WorkloadController
+
+SEARCH_USER_PAGE_SIZE = 50
+SEARCH_USER_MAX_PAGE_SIZE = 200
+SEARCH_COURSE_MAX_PAGE_SIZE = 200
+# Search results are cached briefly so repeated keystrokes/forms don't re-run the same query
+SEARCH_USER_CACHE_SECONDS = 15
+
+
+def _search_user_cache_key(query, role, page, page_size):
+    # hash the query so arbitrary user input is always a valid cache key
+    query_hash = hashlib.sha1(query.lower().encode("utf-8")).hexdigest()
+    return f"search_user_api:{role or ''}:{page}:{page_size}:{query_hash}"
 
 
 def search_user_api(request, role=None):
@@ -8,18 +32,21 @@ def search_user_api(request, role=None):
     Preconditions:
     - `request` is a valid HttpRequest object.
     - `request.GET` contains an optional "query" parameter, which may be an empty string.
+    - `request.GET` may contain positive integer "page" and "page_size" parameters.
     - `UserController.searchUser` is properly implemented to handle the provided query.
 
     Postconditions:
     - If a valid query is provided or left empty, a JSON response containing a list of user data (username and name) is returned.
         If role is specified then all returned users have the specified role
+    - Results are ranked by UserController.searchUser and only one page of them is returned. When more
+        results exist, the "X-Next-Page" response header holds the next page number.
     - If an error occurs (e.g., invalid query), a JSON response with an error message is returned with status 400.
 
     Side-effects:
-    - None.
+    - Results are cached for SEARCH_USER_CACHE_SECONDS keyed by (query, role, page, page_size).
 
     Parameters:
-    - request: HttpRequest object, containing the GET data with an optional "query" parameter.
+    - request: HttpRequest object, containing the GET data with optional "query", "page" and "page_size" parameters.
     - role: an optional parameter that specifies the types of roles results should have
 
     Returns:
@@ -29,13 +56,319 @@ def search_user_api(request, role=None):
     """
     query = request.GET.get("query", "").strip() if request.GET.get("query", "").strip() else ""
     try:
-        print(role)
-        if role:
-            users = UserController.searchUser(query, role)
+        page = int(request.GET.get("page", 1))
+        page_size = min(int(request.GET.get("page_size", SEARCH_USER_PAGE_SIZE)), SEARCH_USER_MAX_PAGE_SIZE)
+        if page < 1 or page_size < 1:
+            raise ValueError("page and page_size must be positive integers")
+
+        cache_key = _search_user_cache_key(query, role, page, page_size)
+        cached = cache.get(cache_key)
+        if cached is None:
+            # fetch one extra result to tell whether there is a next page
+            users = UserController.searchUser(query, role, limit=page_size + 1, offset=(page - 1) * page_size)
+            #convert to dictionary for JSON serialization"
+            user_data = [{"username": user.username, "name": user.name} for user in users[:page_size]]
+            cached = (user_data, len(users) > page_size)
+            cache.set(cache_key, cached, SEARCH_USER_CACHE_SECONDS)
+
+        user_data, has_next_page = cached
+        response = JsonResponse(user_data, safe=False)
+        if has_next_page:
+            response["X-Next-Page"] = str(page + 1)
+        return response
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+
+def search_course_api(request):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object.
+    - `request.GET` contains a "semester" parameter naming the semester to list courses of, an optional "query"
+      parameter and optional "after" and positive integer "page_size" parameters.
+
+    Postconditions:
+    - Returns one page of the semester's courses whose title or code matches the query, ordered by course code,
+      as a JSON list of {"course_code", "course_name"}. When more courses exist, the "X-Next-Cursor" response
+      header holds the value to pass as "after" for the next page.
+    - If a parameter is missing or invalid, a JSON response with an error message is returned with status 400.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object, containing the GET data.
+
+    Returns:
+    - JsonResponse: A JSON list of courses or an error object.
+    """
+    semester_name = request.GET.get("semester", "")
+    if not semester_name:
+        return JsonResponse({"error": "The semester parameter is required."}, status=400)
+    try:
+        page_size = min(int(request.GET.get("page_size", COURSE_SEARCH_PAGE_SIZE)), SEARCH_COURSE_MAX_PAGE_SIZE)
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    courses, next_cursor = CourseController.search_courses_page(request.GET.get("query", "").strip(), semester_name,
+                                                                request.GET.get("after") or None, page_size)
+    response = JsonResponse([{"course_code": course.course_code, "course_name": course.course_name}
+                             for course in courses], safe=False)
+    if next_cursor is not None:
+        response["X-Next-Cursor"] = next_cursor
+    return response
+
+
+def lookup_user_api(request):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object.
+    - `request.GET` contains a "usernames" parameter holding a comma separated list of usernames.
+
+    Postconditions:
+    - Returns a JSON list with the username and name of every listed username that exactly matches a user,
+        in the order they were requested. Unknown usernames are left out.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object, containing the GET data with the "usernames" parameter.
+
+    Returns:
+    - JsonResponse: A JSON list of users (username and name).
+    """
+    usernames = [username.strip() for username in request.GET.get("usernames", "").split(",") if username.strip()]
+    users = UserController.lookupUsers(usernames) if usernames else []
+    return JsonResponse([{"username": user.username, "name": user.name} for user in users], safe=False)
+
+
+def course_cache_stats_api(request):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object made by a logged in Admin.
+
+    Postconditions:
+    - Returns the hit and miss counters of the course overview cache for this server process.
+    - Returns a JSON error with status 403 for any other user.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object.
+
+    Returns:
+    - JsonResponse: {"hits": int, "misses": int} or an error object.
+    """
+    if not request.user.is_authenticated or request.user.role != "Admin":
+        return JsonResponse({"error": "Only administrators can view cache statistics."}, status=403)
+    return JsonResponse(CourseCache.stats())
+
+
+def export_semester_api(request, semester_name):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object made by a logged in Admin.
+    - `request.GET` may contain a "format" parameter of "csv" (the default) or "json".
+
+    Postconditions:
+    - Streams every course, section and TA assignment of the semester as an attachment in the format read by
+        the bulk import. The response is written as rows are read, so its size is not limited by memory.
+    - Returns a JSON error with status 404 if the semester does not exist, 400 for an unknown format and 403
+        for any user other than an Admin.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object, containing the GET data with the optional "format" parameter.
+    - semester_name: name of the semester to export.
+
+    Returns:
+    - StreamingHttpResponse with the export, or a JsonResponse with an error.
+    """
+    if not request.user.is_authenticated or request.user.role != "Admin":
+        return JsonResponse({"error": "Only administrators can export semesters."}, status=403)
+    file_format = request.GET.get("format", "csv")
+    if file_format not in IMPORT_FORMATS:
+        return JsonResponse({"error": f"Unsupported export format '{file_format}'."}, status=400)
+    try:
+        chunks = ExportController.stream_export(semester_name, file_format)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=404)
+    content_type = "text/csv" if file_format == "csv" else "application/json"
+    response = StreamingHttpResponse(chunks, content_type=f"{content_type}; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="{slugify(semester_name)}.{file_format}"'
+    return response
+
+
+def semester_conflicts_api(request, semester_name):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object made by a logged in Admin.
+
+    Postconditions:
+    - Returns a JSON list of every pair of sections in the semester taught by the same instructor or TA at
+        overlapping times, as {"username", "section", "conflicting_section", "day"} objects.
+    - Returns a JSON error with status 404 if the semester does not exist and 403 for any user other than an Admin.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object.
+    - semester_name: name of the semester to check.
+
+    Returns:
+    - JsonResponse: A JSON list of conflicts or an error object.
+    """
+    if not request.user.is_authenticated or request.user.role != "Admin":
+        return JsonResponse({"error": "Only administrators can view schedule conflicts."}, status=403)
+    try:
+        conflicts = ConflictController.semester_conflicts(semester_name)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=404)
+    return JsonResponse([vars(conflict) for conflict in conflicts], safe=False)
+
+
+def assign_labs_api(request, semester_name):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object made by a logged in Admin.
+
+    Postconditions:
+    - GET returns a preview of the TA proposed for every unassigned lab of the semester without saving anything.
+    - POST saves the proposed assignments and returns them.
+    - Each item is {"course_code", "lab_section_number", "ta": {"username", "name"} or null, "reason"}.
+    - Returns a JSON error with status 404 if the semester does not exist and 403 for any user other than an Admin.
+
+    Side-effects:
+    - POST adds records to the TALabAssignment table.
+
+    Parameters:
+    - request: HttpRequest object.
+    - semester_name: name of the semester to fill.
+
+    Returns:
+    - JsonResponse: A JSON list of proposals or an error object.
+    """
+    if not request.user.is_authenticated or request.user.role != "Admin":
+        return JsonResponse({"error": "Only administrators can assign TAs."}, status=403)
+    try:
+        if request.method == "POST":
+            proposals = AssignmentController.apply_lab_assignments(semester_name)
         else:
-            users = UserController.searchUser(query)
-        #convert to dictionary for JSON serialization"
-        user_data = [{"username": user.username, "name": user.name} for user in users]
-        return JsonResponse(user_data, safe=False)
+            proposals = AssignmentController.propose_lab_assignments(semester_name)
     except ValueError as e:
-        return JsonResponse({"error": str(e)}, status=400)
\ No newline at end of file
+        return JsonResponse({"error": str(e)}, status=404)
+    return JsonResponse([{
+        "course_code": proposal.course_code,
+        "lab_section_number": proposal.lab_section_number,
+        "ta": {"username": proposal.ta.username, "name": proposal.ta.name} if proposal.ta else None,
+        "reason": proposal.reason,
+    } for proposal in proposals], safe=False)
+
+
+def available_tas_api(request, semester_name):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object made by a logged in Admin.
+    - The GET parameters `days`, `start` and `end` give the time slot, e.g. ?days=TR&start=14:00&end=15:15.
+      The optional `course` parameter is the code of the course being staffed, used to rank TAs by skill.
+
+    Postconditions:
+    - Returns the TAs free during the time slot in the semester, ranked by their lab load and skill match,
+      as a JSON list of {"username", "name", "load", "skill_matches"}.
+    - Returns a JSON error with status 400 if a parameter is missing or invalid and 403 for any user other
+      than an Admin.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object.
+    - semester_name: name of the semester the time slot is in.
+
+    Returns:
+    - JsonResponse: A JSON list of available TAs or an error object.
+    """
+    if not request.user.is_authenticated or request.user.role != "Admin":
+        return JsonResponse({"error": "Only administrators can search TA availability."}, status=403)
+    days, start, end = (request.GET.get(name, "").strip() for name in ("days", "start", "end"))
+    if not days or not start or not end:
+        return JsonResponse({"error": "The days, start and end parameters are required."}, status=400)
+    try:
+        available = AssignmentController.find_available_tas(semester_name, days, start, end,
+                                                            request.GET.get("course") or None)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    return JsonResponse([{
+        "username": available_ta.ta.username,
+        "name": available_ta.ta.name,
+        "load": available_ta.load,
+        "skill_matches": available_ta.skill_matches,
+    } for available_ta in available], safe=False)
+
+
+def workload_api(request, semester_name):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object made by a logged in Admin.
+
+    Postconditions:
+    - Returns the workload of every TA and instructor of the semester, most weekly hours first, as a JSON list of
+      {"username", "name", "role", "weekly_hours", "lab_sections", "course_sections", "courses", "graded_courses"}.
+    - Returns a JSON error with status 404 if the semester does not exist and 403 for any user other than an Admin.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object.
+    - semester_name: name of the semester to report on.
+
+    Returns:
+    - JsonResponse: A JSON list of workloads or an error object.
+    """
+    if not request.user.is_authenticated or request.user.role != "Admin":
+        return JsonResponse({"error": "Only administrators can view workloads."}, status=403)
+    try:
+        workloads = WorkloadController.get_semester_workload(semester_name)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=404)
+    return JsonResponse([{
+        "username": workload.user.username,
+        "name": workload.user.name,
+        "role": workload.role,
+        "weekly_hours": workload.weekly_hours,
+        "lab_sections": workload.lab_sections,
+        "course_sections": workload.course_sections,
+        "courses": workload.courses,
+        "graded_courses": workload.graded_courses,
+    } for workload in workloads], safe=False)
+
+
+def metrics_api(request):
+    """
+    Preconditions:
+    - `request` is a valid HttpRequest object made by a logged in Admin.
+
+    Postconditions:
+    - Returns the per view request duration, query count, database time and response size histograms recorded
+      by RequestMetricsMiddleware in this process, in the Prometheus text format.
+    - Returns a JSON error with status 403 for any user other than an Admin.
+
+    Side-effects:
+    - None.
+
+    Parameters:
+    - request: HttpRequest object.
+
+    Returns:
+    - HttpResponse: The metrics as text/plain, or a JsonResponse error.
+    """
+    if not request.user.is_authenticated or request.user.role != "Admin":
+        return JsonResponse({"error": "Only administrators can view metrics."}, status=403)
+    return HttpResponse(RequestMetrics.render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,49 @@
+from datetime import date, time
+
+from django.core.cache import cache
+from django.test import TestCase, Client
+from django.urls import reverse
+
+from core.calendar_controller.CalendarController import CalendarController
+from ta_scheduler.models import Course, LabSection, Semester, TALabAssignment, User
+
+
+class TestCalendarFeedView(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        semester = Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1), end_date=date(2025, 9, 12))
+        course = Course.objects.create(course_code="CS361", course_name="Software Eng", semester=semester)
+        lab = LabSection.objects.create(course=course, lab_section_number=801, days="F",
+                                        start_time=time(11, 0), end_time=time(12, 50))
+        self.ta = User.objects.create_user(username="ta", password="tapass", role="TA")
+        TALabAssignment.objects.create(lab_section=lab, ta=self.ta)
+        self.url = reverse("calendar-feed", args=[CalendarController.feed_token("ta")])
+
+    def test_feed_without_login(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        self.assertIn(b"BEGIN:VEVENT", response.content)
+        self.assertTrue(response["ETag"])
+
+    def test_if_none_match_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_changed_schedule_sends_new_feed(self):
+        etag = self.client.get(self.url)["ETag"]
+        LabSection.objects.update(days="TR")
+        LabSection.objects.get().save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_invalid_token(self):
+        self.assertEqual(self.client.get("/calendar/not-a-token.ics").status_code, 404)
+
+    def test_profile_links_own_feed(self):
+        self.client.login(username="ta", password="tapass")
+        self.assertEqual(self.client.get("/").context["calendar_url"], self.url)
@@ -0,0 +1,40 @@
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views import View
+
+from core.calendar_controller.CalendarController import CalendarController
+
+
+class CalendarFeedView(View):
+    def get(self, request, token: str):
+        """
+        Preconditions:
+        - `token` was made by CalendarController.feed_token for an existing user.
+
+        Postconditions:
+        - Returns the user's schedule as an iCalendar file with an ETag. When the request's If-None-Match
+          header matches the current ETag a 304 Not Modified response without a body is returned instead.
+        - Raises Http404 if the token is invalid or the user no longer exists.
+
+        Side-effects:
+        - None.
+
+        Parameters:
+        - request: An HttpRequest object, calendar clients send it without a session.
+        - token: The signed token identifying the user.
+
+        Returns:
+        - An HttpResponse with the text/calendar feed, or a 304 response.
+        """
+        try:
+            feed = CalendarController.get_feed(CalendarController.username_from_token(token))
+        except ValueError:
+            raise Http404("Calendar not found")
+        # lets clients polling the feed skip the download while the schedule is unchanged
+        response = get_conditional_response(request, etag=feed.etag)
+        if response is None:
+            response = HttpResponse(feed.body, content_type="text/calendar; charset=utf-8")
+            response["Content-Disposition"] = 'inline; filename="schedule.ics"'
+        response["ETag"] = feed.etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -215,15 +215,10 @@ class CourseForm(View):
 
 
     def __can_use_form(self, user: User, code: str, semester: str):
-        # Need to check permissions. Could refactor in future to be controller method
         if user.role != "Admin":
             if code is None:
                 return False
-            course_form = CourseController.get_course(code, semester)
-            for section in course_form.course_sections:
-                if section.instructor.username == user.username:
-                    return True
-            return False
+            return CourseController.is_instructor_of(code, semester, user)
         return True
 
 
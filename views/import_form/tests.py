@@ -0,0 +1,54 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, Client
+
+from ta_scheduler.models import Semester, User
+
+
+class TestImportFormView(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username="admin", password="adminpass", role="Admin")
+        User.objects.create_user(username="ta", password="tapass", role="TA")
+
+    def upload(self, name, content, **data):
+        return self.client.post("/import/", {"file": SimpleUploadedFile(name, content.encode("utf-8")), **data})
+
+    def test_admin_gets_form(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.client.get("/import/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "import_form/import_form.html")
+
+    def test_non_admin_redirected(self):
+        self.client.login(username="ta", password="tapass")
+        self.assertRedirects(self.client.get("/import/"), "/")
+        self.assertRedirects(self.upload("rows.csv", "type,semester\n"), "/")
+
+    def test_upload_csv(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.upload("rows.csv", "type,semester,start_date,end_date\n"
+                                           "semester,Fall 2025,2025-09-01,2025-12-15\n"
+                                           "semester,Fall 2026,,\n")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(("semester", 1, 0), response.context["counts"])
+        self.assertEqual(response.context["error_count"], 1)
+        self.assertEqual(response.context["errors"][0].row, 2)
+        self.assertTrue(Semester.objects.filter(semester_name="Fall 2025").exists())
+
+    def test_upload_json_with_explicit_format(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.upload("rows.txt", '[{"type": "semester", "semester": "Fall 2025", '
+                                           '"start_date": "2025-09-01", "end_date": "2025-12-15"}]', format="json")
+        self.assertEqual(response.context["error_count"], 0)
+        self.assertTrue(Semester.objects.filter(semester_name="Fall 2025").exists())
+
+    def test_unsupported_file_type(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.upload("rows.xml", "<rows/>")
+        self.assertEqual(response.context["error"], "Unsupported file type 'xml'")
+
+    def test_malformed_csv(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.upload("rows.csv", 'type,semester\nsemester,"Fall 2025' + "x" * 200000)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["error"].startswith("Malformed csv after line 1"))
@@ -0,0 +1,75 @@
+import io
+from pathlib import Path
+
+from django.shortcuts import render, redirect
+from django.views import View
+
+from core.import_controller.ImportController import IMPORT_FORMATS, ROW_TYPES, ImportController
+
+# Errors listed on the page after an upload, the counts always cover every row
+MAX_DISPLAYED_ERRORS = 200
+
+
+class ImportFormView(View):
+    def get(self, request):
+        """
+        Preconditions:
+        - `request` is a valid HttpRequest object.
+
+        Postconditions:
+        - Renders the bulk import upload form for an admin.
+        - Redirects to home if the user is not an admin.
+
+        Returns:
+        - An HttpResponse object rendering the 'import_form/import_form.html' template.
+        """
+        if request.user.role != "Admin":
+            return redirect("home")
+        return render(request, 'import_form/import_form.html', self.__context(request))
+
+    def post(self, request):
+        """
+        Preconditions:
+        - `request` is a valid HttpRequest object with an uploaded csv or json file in the "file" field.
+
+        Postconditions:
+        - Imports the rows of the file and renders the number of records created and updated per row type
+          together with the rows that were rejected.
+        - Redirects to home if the user is not an admin.
+
+        Side-effects:
+        - Creates or updates semesters, courses, sections and TA assignments.
+
+        Returns:
+        - An HttpResponse object rendering the 'import_form/import_form.html' template with the import result.
+        """
+        if request.user.role != "Admin":
+            return redirect("home")
+        upload = request.FILES.get("file")
+        if upload is None:
+            return render(request, 'import_form/import_form.html', self.__context(request, error="No file was uploaded"))
+        file_format = request.POST.get("format") or Path(upload.name).suffix.lstrip(".").lower()
+        if file_format not in IMPORT_FORMATS:
+            return render(request, 'import_form/import_form.html',
+                          self.__context(request, error=f"Unsupported file type '{file_format}'"))
+        # read the upload as text without loading it into memory first
+        stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        try:
+            result = ImportController.import_rows(ImportController.read_rows(stream, file_format))
+        except ValueError as e:
+            return render(request, 'import_form/import_form.html', self.__context(request, error=str(e)))
+        return render(request, 'import_form/import_form.html', self.__context(
+            request,
+            counts=[(row_type, result.created[row_type], result.updated[row_type]) for row_type in ROW_TYPES],
+            errors=result.errors[:MAX_DISPLAYED_ERRORS],
+            error_count=len(result.errors),
+        ))
+
+    @staticmethod
+    def __context(request, **extra):
+        return {
+            'full_name': f"{request.user.first_name} {request.user.last_name}",
+            "isAdmin": True,
+            "formats": IMPORT_FORMATS,
+            **extra,
+        }
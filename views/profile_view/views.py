@@ -1,6 +1,7 @@
 import json
 from django.http import Http404
 from django.shortcuts import render, redirect
+from django.urls import reverse
 from django.views import View
 
 
@@ -30,6 +31,7 @@ class ProfileView(View):
         """
         # intentionally delay import to avoid apps not loaded error
         from core.user_controller.UserController import UserController
+        from core.calendar_controller.CalendarController import CalendarController
 
         if not request.user.is_authenticated:
             return redirect('login')
@@ -42,14 +44,17 @@ class ProfileView(View):
             return redirect('home')
 
         user_skills = user_profile.skills or []
+        is_self = username is None or username == request.user.username
 
         context = {
             'full_name': f"{request.user.first_name} {request.user.last_name}",
             'user_profile': user_profile,
             'isAdmin': request.user.role == 'Admin',
-            'self': username is None or username == request.user.username,
+            'self': is_self,
             'username': request.user.username if username is None else username,
             'user_skills': user_skills,
+            # only shown on your own profile, anyone with the link can read the schedule
+            'calendar_url': reverse('calendar-feed', args=[CalendarController.feed_token(request.user.username)]) if is_self else None,
         }
 
         return render(request, 'profile_view/profile.html', context)
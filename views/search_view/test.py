@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from ta_scheduler.models import Semester, Course, User
 from core.user_controller.UserController import UserController
@@ -34,6 +36,36 @@ class TestSearchCourses(TestCase):
         })
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "CS101")
+
+    def test_course_search_query_count_independent_of_semesters(self):
+        with CaptureQueriesContext(connection) as few_semesters:
+            self.client.get(reverse('search', args=['course']))
+
+        for year in range(2025, 2035):
+            semester = Semester.objects.create(
+                semester_name=f"Fall {year}", start_date=f"{year}-08-01", end_date=f"{year}-12-31")
+            Course.objects.create(course_code="CS101", course_name="Intro to CS", semester=semester)
+
+        with CaptureQueriesContext(connection) as many_semesters:
+            response = self.client.get(reverse('search', args=['course']))
+        self.assertContains(response, "Fall 2034")
+        self.assertEqual(len(few_semesters), len(many_semesters))
+
+        with CaptureQueriesContext(connection) as post_queries:
+            self.client.post(reverse('search', args=['course']), {'query': 'CS'})
+        self.assertEqual(len(post_queries), len(many_semesters))
+
+    def test_only_open_semester_rendered(self):
+        spring = Semester.objects.create(semester_name="Spring 2025", start_date="2025-01-20", end_date="2025-05-10")
+        Course.objects.create(course_code="CS202", course_name="Systems", semester=spring)
+        response = self.client.get(reverse('search', args=['course']))
+        self.assertContains(response, "Fall 2024 (1 course)")
+        self.assertNotContains(response, "CS101")
+        self.assertContains(response, "CS202")
+
+        response = self.client.post(reverse('search', args=['course']), {'query': '', 'semester_name': 'Fall 2024'})
+        self.assertContains(response, "CS101")
+        self.assertNotContains(response, "Spring 2025 (")
 class TestSearchUsers(TestCase):
     def setUp(self):
         self.admin_user = User.objects.create_user(
@@ -54,6 +86,10 @@ class TestSearchUsers(TestCase):
         self.assertNotContains(response, self.test_user1.username)
         self.assertNotContains(response, self.test_user2.username)
 
+    def test_get_has_load_more_for_paged_results(self):
+        response = self.client.get('/search/user/')
+        self.assertContains(response, 'id="users-load-more"')
+
 class TestSearchViewPermissions(TestCase):
     def setUp(self):
         self.regular_user = User.objects.create_user(
@@ -14,11 +14,13 @@ class SearchView(View):
         - `type` is a string indicating the search type ("course" or "user").
 
         Postconditions:
-        - If type is "course", all courses grouped by semester are displayed.
+        - If type is "course", every semester with courses is listed with its course count. Only the latest
+          semester is expanded, with its first page of courses; the others load theirs from search_course_api
+          when expanded.
         - If type is "user", an empty or initialized user search context is displayed.
 
         Side-effects:
-        - Retrieves all courses and semesters for course type.
+        - Retrieves the semesters and one page of courses for course type.
         - Initializes search results for user type.
 
         Parameters:
@@ -27,7 +29,7 @@ class SearchView(View):
 
         Returns:
         - Renders the 'search_view/search_view.html' template with appropriate context:
-          * `search_results`: List of courses or users.
+          * `search_results`: List of SemesterCoursePage groups (if type is "course").
           * `semesters`: List of all semesters (if type is "course").
         """
         context = {
@@ -37,14 +39,8 @@ class SearchView(View):
         }
 
         if type == "course":
-            context["search_results"] = []
             context["semesters"] = SemesterController.list_semester()
-            for semester in SemesterController.list_semester():
-                semester_courses = CourseController.search_courses("", semester.semester_name)
-                context["search_results"].append({
-                    "semester": semester.semester_name,
-                    "courses": semester_courses,
-                })
+            context["search_results"] = CourseController.search_course_groups("")
         return render(request, 'search_view/search_view.html', context)
 
     def post(self, request, type: str):
@@ -58,11 +54,12 @@ class SearchView(View):
         Postconditions:
         - Processes the search query and returns filtered results:
           * Users matching the search query (for "user" type).
-          * Courses matching the search query, optionally filtered by semester (for "course" type).
+          * Semesters with courses matching the search query, optionally filtered by semester, with the
+            selected (or latest) semester expanded to its first page of courses (for "course" type).
 
         Side-effects:
         - Calls `UserController.searchUser` for user search.
-        - Calls `CourseController.search_courses` for course search.
+        - Calls `CourseController.search_course_groups` for course search.
 
         Parameters:
         - request: The HttpRequest object containing details about the HTTP POST request.
@@ -70,7 +67,7 @@ class SearchView(View):
 
         Returns:
         - Renders the 'search_view/search_view.html' template with appropriate context:
-          * `search_results`: List of matching courses or users.
+          * `search_results`: List of SemesterCoursePage groups.
           * `semesters`: List of all semesters.
           * `query`: The search query (if provided).
           * `selected_semester`: The selected semester (if provided).
@@ -85,19 +82,7 @@ class SearchView(View):
                 "type": type,
             })
         elif type == "course":
-            search_results = []
-            if semester_name:
-                search_results.append({
-                    "semester": semester_name,
-                    "courses": CourseController.search_courses(query, semester_name),
-                })
-            else:
-                for semester in SemesterController.list_semester():
-                    semester_courses = CourseController.search_courses(query, semester.semester_name)
-                    search_results.append({
-                        "semester": semester.semester_name,
-                        "courses": semester_courses,
-                    })
+            search_results = CourseController.search_course_groups(query, semester_name, open_semester=semester_name)
         else:
             search_results = []
 
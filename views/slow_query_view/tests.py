@@ -0,0 +1,65 @@
+from django.test import TestCase, Client, override_settings
+
+from core.request_metrics.RequestMetrics import RequestMetrics
+from core.slow_query_log.SlowQueryLog import SlowQueryLog
+from ta_scheduler.models import User
+
+
+class TestSlowQueryView(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username="admin", password="adminpass", role="Admin")
+        User.objects.create_user(username="ta", password="tapass", role="TA")
+        SlowQueryLog.clear()
+
+    def tearDown(self):
+        SlowQueryLog.clear()
+
+    def test_admin_gets_page(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.client.get("/slow-queries/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "slow_query_view/slow_query_view.html")
+        self.assertContains(response, "No slow queries have been recorded.")
+
+    def test_non_admin_redirected(self):
+        self.client.login(username="ta", password="tapass")
+        self.assertRedirects(self.client.get("/slow-queries/"), "/")
+        self.assertRedirects(self.client.post("/slow-queries/"), "/")
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_requests_record_queries_with_plans(self):
+        self.client.login(username="admin", password="adminpass")
+        self.client.get("/search/course/")
+        queries = SlowQueryLog.entries()
+        self.assertTrue(queries)
+        self.assertTrue(all(query.path in ("GET /search/course/", "GET /slow-queries/") for query in queries))
+        course_query = next(query for query in queries if "ta_scheduler_course" in query.sql)
+        self.assertTrue(course_query.caller.startswith("CourseController."), course_query.caller)
+        self.assertTrue(course_query.plan)
+
+        response = self.client.get("/slow-queries/")
+        self.assertContains(response, "GET /search/course/")
+        self.assertContains(response, course_query.plan[0])
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_queries_not_attributed_to_middleware(self):
+        self.client.login(username="admin", password="adminpass")
+        RequestMetrics.reset()
+        self.client.get("/search/course/")
+        # RequestMetricsMiddleware ran in front and timed the same queries
+        self.assertIn("SearchView", RequestMetrics.render_prometheus())
+        callers = [query.caller for query in SlowQueryLog.entries()]
+        self.assertTrue(callers)
+        for caller in callers:
+            self.assertNotIn("request_metrics", caller)
+            self.assertNotIn("slow_query_log", caller)
+            self.assertNotIn("Middleware", caller)
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_clear(self):
+        self.client.login(username="admin", password="adminpass")
+        self.client.get("/search/course/")
+        self.assertRedirects(self.client.post("/slow-queries/"), "/slow-queries/", fetch_redirect_response=False)
+        # the queries of the clearing request itself are recorded after the log is emptied
+        self.assertEqual({query.path for query in SlowQueryLog.entries()}, {"POST /slow-queries/"})
@@ -0,0 +1,46 @@
+from django.shortcuts import render, redirect
+from django.views import View
+
+from core.slow_query_log.SlowQueryLog import SlowQueryLog
+
+
+class SlowQueryView(View):
+    def get(self, request):
+        """
+        Preconditions:
+        - `request` is a valid HttpRequest object.
+
+        Postconditions:
+        - Renders the queries in this process's slow query log for an admin, newest first, each with its
+          parameters, duration, the request and function that ran it and its query plan.
+        - Redirects to home if the user is not an admin.
+
+        Returns:
+        - An HttpResponse object rendering the 'slow_query_view/slow_query_view.html' template.
+        """
+        if request.user.role != "Admin":
+            return redirect("home")
+        return render(request, 'slow_query_view/slow_query_view.html', {
+            'full_name': f"{request.user.first_name} {request.user.last_name}",
+            "isAdmin": True,
+            "queries": SlowQueryLog.entries(),
+            "threshold_ms": SlowQueryLog.threshold_ms(),
+            "size": SlowQueryLog.size(),
+        })
+
+    def post(self, request):
+        """
+        Preconditions:
+        - `request` is a valid HttpRequest object.
+
+        Postconditions:
+        - Empties the slow query log and redirects back to it for an admin.
+        - Redirects to home if the user is not an admin.
+
+        Side-effects:
+        - Clears this process's slow query log.
+        """
+        if request.user.role != "Admin":
+            return redirect("home")
+        SlowQueryLog.clear()
+        return redirect("slow-queries")
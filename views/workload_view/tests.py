@@ -0,0 +1,31 @@
+from datetime import date
+
+from django.test import TestCase, Client
+
+from ta_scheduler.models import Semester, User
+
+
+class TestWorkloadView(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username="admin", password="adminpass", role="Admin")
+        User.objects.create_user(username="ta", password="tapass", role="TA")
+        Semester.objects.create(semester_name="Fall 2025", start_date=date(2025, 9, 1), end_date=date(2025, 12, 15))
+        Semester.objects.create(semester_name="Spring 2026", start_date=date(2026, 1, 20), end_date=date(2026, 5, 10))
+
+    def test_defaults_to_latest_semester(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.client.get("/workload/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "workload_view/workload_view.html")
+        self.assertEqual(response.context["semester"], "Spring 2026")
+        self.assertEqual(response.context["workloads"], [])
+
+    def test_unknown_semester(self):
+        self.client.login(username="admin", password="adminpass")
+        response = self.client.get("/workload/Winter 1900/")
+        self.assertIn("does not exist", response.context["error"])
+
+    def test_non_admin_redirected(self):
+        self.client.login(username="ta", password="tapass")
+        self.assertRedirects(self.client.get("/workload/"), "/")
@@ -0,0 +1,38 @@
+from django.shortcuts import render, redirect
+from django.views import View
+
+from core.semester_controller.SemesterController import SemesterController
+from core.workload_controller.WorkloadController import WorkloadController
+
+
+class WorkloadView(View):
+    def get(self, request, semester_name=None):
+        """
+        Preconditions:
+        - `request` is a valid HttpRequest object.
+        - `semester_name` is the name of a semester, or None for the latest one.
+
+        Postconditions:
+        - Renders the weekly contact hours and lab, section and course counts of every TA and instructor
+          of the semester for an admin, with links to the other semesters.
+        - Renders an error if the semester does not exist.
+        - Redirects to home if the user is not an admin.
+
+        Returns:
+        - An HttpResponse object rendering the 'workload_view/workload_view.html' template.
+        """
+        if request.user.role != "Admin":
+            return redirect("home")
+        semesters = [semester.semester_name for semester in SemesterController.list_semester()]
+        context = {
+            'full_name': f"{request.user.first_name} {request.user.last_name}",
+            "isAdmin": True,
+            "semesters": semesters,
+            "semester": semester_name or (semesters[-1] if semesters else None),
+        }
+        if context["semester"] is not None:
+            try:
+                context["workloads"] = WorkloadController.get_semester_workload(context["semester"])
+            except ValueError as e:
+                context["error"] = str(e)
+        return render(request, 'workload_view/workload_view.html', context)